@@ -0,0 +1,107 @@
+"""Benchmark for packing rendered FIA pages into Discord webhook messages.
+
+Compares the previous upload plan (every page at JPEG quality 95, fixed groups of
+ten) with `fia_scraper.scraper.encode_page` + `pack_attachments` (per-page quality
+against the byte budget, greedy in-order packing) and reports requests per
+document, the largest request, requests over Discord's limit and encode time.
+
+    python -m benchmarks.bench_attachments [file.pdf ...]
+
+With no arguments every `benchmarks/fixtures/pdfs/*.pdf` is used, plus a few
+synthetic scanned documents (noisy raster pages, generated into a temp directory)
+that are large enough to hit the upload limit. Real FIA PDFs can be passed on the
+command line; `DISCORD_MAX_UPLOAD_MB` changes the limit as it does for the scraper.
+"""
+from __future__ import annotations
+
+import glob
+import os
+import random
+import sys
+import tempfile
+import time
+
+import fitz
+
+from fia_scraper.scraper import (
+    MAX_FILES_PER_MESSAGE,
+    MAX_UPLOAD_BYTES,
+    UPLOAD_BUDGET,
+    encode_page,
+    pack_attachments,
+)
+
+
+PDF_DIR = os.path.join(os.path.dirname(__file__), "fixtures", "pdfs")
+DPI = 150
+# (name, pages, share of each page covered by scan noise)
+SCANNED = (("scanned_decision", 2, 0.5), ("scanned_timing_sheets", 14, 0.7), ("scanned_classification", 24, 1.0))
+
+
+def write_scanned_pdf(path: str, pages: int, noise: float, seed: int = 2024) -> None:
+    # A4 pages carrying a raster "scan": grainy grey noise over part of the page, which
+    # compresses about as badly as a photocopied, signed FIA decision.
+    rng = random.Random(seed)
+    doc = fitz.open()
+    w, h = 1240, int(1754 * noise)
+    for n in range(pages):
+        page = doc.new_page(width=595, height=842)
+        samples = bytes(200 + b % 56 for b in rng.randbytes(w * h))
+        pix = fitz.Pixmap(fitz.csGRAY, w, h, samples, False)
+        page.insert_image(fitz.Rect(0, 0, 595, 842 * noise), pixmap=pix)
+        page.insert_text((60, 80), f"FIA Formula One World Championship - page {n + 1}", fontsize=12)
+    doc.save(path, deflate=True)
+    doc.close()
+
+
+def legacy_plan(doc) -> tuple[list[list[int]], float]:
+    start = time.perf_counter()
+    sizes = [len(page.get_pixmap(dpi=DPI).tobytes("jpeg", jpg_quality=95)) for page in doc]
+    elapsed = time.perf_counter() - start
+    return [sizes[i:i + MAX_FILES_PER_MESSAGE] for i in range(0, len(sizes), MAX_FILES_PER_MESSAGE)], elapsed
+
+
+def packed_plan(doc) -> tuple[list[list[int]], float]:
+    start = time.perf_counter()
+    images = [(f"p{n}.jpg", encode_page(page, DPI)) for n, page in enumerate(doc)]
+    chunks = [[len(data) for _, data in chunk] for chunk in pack_attachments(images)]
+    return chunks, time.perf_counter() - start
+
+
+def describe(chunks: list[list[int]], elapsed: float) -> str:
+    totals = [sum(c) for c in chunks]
+    over = sum(1 for t in totals if t > UPLOAD_BUDGET)
+    return (f"{len(chunks):>3} req  max {max(totals) / 2**20:5.2f} MiB  "
+            f"{over} over limit  {sum(totals) / 2**20:6.2f} MiB total  {elapsed * 1000:7.1f} ms")
+
+
+def main(argv: list[str]) -> int:
+    paths = argv or sorted(glob.glob(os.path.join(PDF_DIR, "*.pdf")))
+    with tempfile.TemporaryDirectory() as tmp:
+        if not argv:
+            for name, pages, noise in SCANNED:
+                path = os.path.join(tmp, f"{name}.pdf")
+                write_scanned_pdf(path, pages, noise)
+                paths.append(path)
+
+        print(f"Limit {MAX_UPLOAD_BYTES / 2**20:.1f} MiB / {MAX_FILES_PER_MESSAGE} files per message, {DPI} DPI")
+        totals = {"legacy": [0, 0], "packed": [0, 0]}
+        for path in paths:
+            with fitz.open(path) as doc:
+                legacy, legacy_s = legacy_plan(doc)
+                packed, packed_s = packed_plan(doc)
+                print(f"\n{os.path.basename(path)} ({len(doc)} pages)")
+            print(f"  legacy q95 / 10 : {describe(legacy, legacy_s)}")
+            print(f"  packed          : {describe(packed, packed_s)}")
+            for label, chunks in (("legacy", legacy), ("packed", packed)):
+                totals[label][0] += len(chunks)
+                totals[label][1] += sum(1 for c in chunks if sum(c) > UPLOAD_BUDGET)
+
+        print()
+        for label, (requests, over) in totals.items():
+            print(f"{label:>6}: {requests} requests, {over} over the upload limit")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
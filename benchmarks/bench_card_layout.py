@@ -0,0 +1,99 @@
+"""Output size and render time of every weekend card type, old renderer vs layout engine.
+
+Builds the cards exactly as `f1_weekend.post` does (its post closures run against
+the stubbed services from `bench_weekend_engine`, with the race's official long
+name) and renders each one with:
+
+  legacy - the previous fixed-height RGB PNG renderer (tabs shown as spaces)
+  png    - measured layout, palette-quantised PNG (default)
+  webp   - measured layout, lossless WebP
+
+Reports bytes, milliseconds per render, card height and how many lines run past
+the card's right margin.
+
+    python -m benchmarks.bench_card_layout [--rounds 5]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+
+os.environ["F1_WEEKEND_ALLOW_DUPES"] = "true"
+os.environ["F1_WEEKEND_FORCE"] = "true"
+
+from benchmarks import bench_weekend_engine as stubs  # noqa: E402
+from benchmarks.bench_render import legacy_render  # noqa: E402
+from f1_weekend import post, render  # noqa: E402
+
+
+MODES = ("schedule", "track", "countdown", "weather", "qualifying", "sprint", "results", "standings", "recap", "delta")
+
+
+def collect_cards() -> list[tuple[str, dict]]:
+    stubs.RACE["raceName"] = "Formula 1 Gran Premio de la Ciudad de México 2026"
+    stubs.install_stubs(0, 0)
+    cards: list[tuple[str, dict]] = []
+    post._send_post = lambda p, image=None, targets=(): cards.append((mode, p.card)) if p and p.card else None
+    for mode in MODES:
+        post.post_weekend_update(mode)
+    return cards
+
+
+def legacy_overflow(card: dict) -> int:
+    # Lines the old renderer drew past the right margin (it never measured anything)
+    body, title = render._font(render.BODY_SIZE), render._font(render.TITLE_SIZE)
+    limit = render.WIDTH - render.PAD
+    lines = [ln.replace("\t", " ") for ln in card["lines"]]
+    return sum(render.PAD + render._text_width(body, ln) > limit for ln in lines) + \
+        (render.PAD + render._text_width(title, card["title"]) > limit)
+
+
+def layout_overflow(card: dict) -> int:
+    ops, _ = render.layout_card(**card)
+    return sum(x + render._text_width(font, text) > render.WIDTH - render.PAD for x, _, text, font, _ in ops)
+
+
+def timed(fn, rounds: int) -> tuple[bytes, float]:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        out = fn()
+    return out, (time.perf_counter() - start) / rounds * 1000
+
+
+def main(argv: list[str]) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--rounds", type=int, default=5)
+    args = ap.parse_args(argv)
+
+    cards = collect_cards()
+    totals = {"legacy": [0, 0.0], "png": [0, 0.0], "webp": [0, 0.0]}
+    print(f"{'card':<11}{'legacy':>18}{'png':>18}{'webp':>18}{'height':>14}{'overflow':>11}")
+    for mode, card in cards:
+        row = []
+        legacy_card = dict(card, lines=[ln.replace("\t", " ") for ln in card["lines"]])
+        legacy_card.pop("columns", None)
+        data, ms = timed(lambda: legacy_render(**legacy_card), args.rounds)
+        row.append((len(data), ms))
+        totals["legacy"][0] += len(data)
+        totals["legacy"][1] += ms
+        for fmt in ("png", "webp"):
+            render.CARD_FORMAT = fmt
+            data, ms = timed(lambda: render.draw_weekend_card(**card), args.rounds)
+            row.append((len(data), ms))
+            totals[fmt][0] += len(data)
+            totals[fmt][1] += ms
+        old_h = render.PAD * 2 + 60 + len(card["lines"]) * 30 + 50
+        new_h = render.layout_card(**card)[1]
+        cells = "".join(f"{b / 1024:8.1f} KB {ms:5.1f}ms" for b, ms in row)
+        print(f"{mode:<11}{cells}{old_h:>7} ->{new_h:>4}{legacy_overflow(card):>6} ->{layout_overflow(card):>2}")
+
+    print()
+    for fmt, (size, ms) in totals.items():
+        print(f"{fmt:>6}: {size / 1024:7.1f} KB total, {ms:7.1f} ms per full set")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,87 @@
+"""Cold-start cost of the entry points, in fresh interpreters.
+
+For each entry module this reports the median wall time of a no-op run (the
+race-weekend gate says no), the import time of the module itself from
+`python -X importtime`, and which heavy dependencies (requests, PyMuPDF,
+BeautifulSoup, Pillow) ended up loaded. The slim `python -m fia_scraper` /
+`python -m f1_weekend` entry points should load none of them; the full
+modules are listed for comparison.
+
+    python -m benchmarks.bench_cold_start [--runs 7] [--top 8]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY = ("requests", "fitz", "pymupdf", "bs4", "PIL")
+
+# Module to import and the no-op run for it. The calendar checks are patched to "no race"
+# so the result doesn't depend on today's date.
+NO_RACE = ("import f1_weekend.race_calendar as c; c.is_race_weekend = lambda today=None: False; "
+           "c.covers = lambda today: True; c.near_race = lambda today, before, after: False")
+ENTRIES = {
+    "fia_scraper": f"{NO_RACE}; import fia_scraper.__main__ as m; m.main()",
+    "fia_scraper.scraper": f"{NO_RACE}; import fia_scraper.scraper as m; m.main()",
+    "f1_weekend": f"{NO_RACE}; import f1_weekend.__main__ as m; m.main()",
+    "f1_weekend.post": f"{NO_RACE}; import f1_weekend.post",
+}
+
+
+def _run(code: str, importtime: bool = False) -> tuple[float, str, str]:
+    cmd = [sys.executable] + (["-X", "importtime"] if importtime else []) + ["-c", code]
+    env = {k: v for k, v in os.environ.items() if k not in ("F1_WEEKEND_FORCE", "PYTHONPROFILEIMPORTTIME")}
+    start = time.perf_counter()
+    p = subprocess.run(cmd, cwd=ROOT, env=env, capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+    if p.returncode != 0:
+        raise RuntimeError(f"{code!r} failed:\n{p.stderr}")
+    return elapsed, p.stdout, p.stderr
+
+
+def _import_times(stderr: str) -> dict[str, int]:
+    # -X importtime lines: "import time: self [us] | cumulative | imported package"
+    out = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        out.setdefault(name.strip(), int(cumulative))
+    return out
+
+
+def main(argv: list[str]) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--runs", type=int, default=7, help="fresh interpreters per entry point")
+    ap.add_argument("--top", type=int, default=0, help="also list the N slowest imports per entry point")
+    args = ap.parse_args(argv)
+
+    baseline = statistics.median(_run("pass")[0] for _ in range(args.runs))
+    # Imported by interpreter start-up (site, .pth files), not by the entry points
+    startup = set(_import_times(_run("pass", importtime=True)[2]))
+    print(f"Bare interpreter: {baseline * 1000:.0f} ms (median of {args.runs})\n")
+    print(f"{'entry point':<22} {'no-op run':>10} {'import':>9}  heavy modules loaded")
+    for module, code in ENTRIES.items():
+        wall = statistics.median(_run(code)[0] for _ in range(args.runs))
+        _, _, stderr = _run(code, importtime=True)
+        times = _import_times(stderr)
+        target = "fia_scraper.__main__" if module == "fia_scraper" else \
+            "f1_weekend.__main__" if module == "f1_weekend" else module
+        _, stdout, _ = _run(f"{code}; import sys, json; print(json.dumps([m for m in {HEAVY!r} if m in sys.modules]))")
+        loaded = json.loads(stdout.strip().splitlines()[-1])
+        print(f"{module:<22} {wall * 1000:>7.0f} ms {times.get(target, 0) / 1000:>6.1f} ms  {', '.join(loaded) or '-'}")
+        if args.top:
+            own = {name: us for name, us in times.items() if name not in startup}
+            for name, us in sorted(own.items(), key=lambda kv: -kv[1])[: args.top]:
+                print(f"    {us / 1000:>7.1f} ms  {name}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,255 @@
+"""Throughput and accuracy benchmark for FIA document metadata extraction.
+
+Runs the position-based extractor (`fia_scraper.metadata`) and the previous
+seven-regex text extractor over a corpus of PDFs and reports documents/second
+(best of REPEATS interleaved runs) plus how many expected fields each one
+recovers. Exits 1 if the current extractor misses any expected field.
+
+    python -m benchmarks.bench_metadata [file.pdf ...]
+
+With no arguments every `benchmarks/fixtures/pdfs/*.pdf` is used; expected
+fields live in `benchmarks/fixtures/pdfs/expected.json`. Drop real FIA PDFs into
+that directory (and optionally add their expected fields) to extend the corpus.
+`--write-fixtures` regenerates the synthetic FIA-style PDFs.
+"""
+from __future__ import annotations
+
+import glob
+import json
+import os
+import re
+import sys
+import time
+
+import fitz
+
+from fia_scraper.metadata import parse_first_page
+
+
+PDF_DIR = os.path.join(os.path.dirname(__file__), "fixtures", "pdfs")
+EXPECTED_FILE = os.path.join(PDF_DIR, "expected.json")
+ROUNDS = 20
+REPEATS = 5
+FIELDS = ("doc_num", "title", "event", "date", "time", "driver_info", "competitor", "penalty", "reason")
+
+
+def legacy_extract(pdf_path: str) -> dict:
+    # The extractor this replaced: seven independent searches over the flattened text.
+    with fitz.open(pdf_path) as doc:
+        text = doc[0].get_text()
+    doc_match = re.search(r"Document\s+(\d+)", text)
+    event_match = re.search(r"(\d{4}\s+.*?Grand Prix)", text, re.IGNORECASE)
+    date_match = re.search(r"Date\s+([0-9]{1,2}\s+[A-Za-z]+\s+\d{4})", text)
+    time_match = re.search(r"Time\s+([0-9]{2}:[0-9]{2})", text)
+    driver_match = re.search(r"No\s*/\s*Driver\s+(\d+)\s*[-–]\s*(.+)", text)
+    reason_match = re.search(r"Reason\s+([^\n]+)", text)
+    title_match = re.search(
+        r"(Summons|Decision|Infringement|Classification|Points|Notes|Report|Scrutineering|Grid|Procedure|Entry List|Car Presentation)",
+        text, re.IGNORECASE)
+    return {
+        "doc_num": doc_match.group(1) if doc_match else "Unknown",
+        "title": title_match.group(1).title() if title_match else os.path.basename(pdf_path).split(".")[0].replace("_", " ").title(),
+        "driver_info": f"{driver_match.group(1)} – {driver_match.group(2).strip()}" if driver_match else "",
+        "event": event_match.group(1).title().replace("  ", " ") if event_match else "Event Unknown",
+        "date": date_match.group(1).strip() if date_match else "",
+        "time": time_match.group(1).strip() if time_match else "",
+        "reason": reason_match.group(1).strip() if reason_match else "",
+    }
+
+
+def current_extract(pdf_path: str) -> dict:
+    with fitz.open(pdf_path) as doc:
+        words = doc[0].get_text("words")
+    return parse_first_page(words, fallback_title=os.path.basename(pdf_path).split(".")[0].replace("_", " ").title())
+
+
+# --- synthetic corpus -------------------------------------------------------------------
+
+def _header(page, event: str, doc_num: int, date: str, time_: str, to: str, right_x: float = 400):
+    page.insert_text((50, 60), event, fontsize=16)
+    page.insert_text((50, 100), "From The Stewards", fontsize=10)
+    page.insert_text((50, 114), to, fontsize=10)
+    page.insert_text((right_x, 100), f"Document {doc_num}", fontsize=10)
+    page.insert_text((right_x, 114), "Date", fontsize=10)
+    page.insert_text((right_x + 40, 114), date, fontsize=10)
+    page.insert_text((right_x, 128), "Time", fontsize=10)
+    page.insert_text((right_x + 40, 128), time_, fontsize=10)
+
+
+def _table(page, rows: list[tuple[str, str]], y: float = 200, label_x: float = 50, value_x: float = 160):
+    for label, value in rows:
+        page.insert_text((label_x, y), label, fontsize=10)
+        page.insert_text((value_x, y), value, fontsize=10)
+        y += 22
+
+
+def write_synthetic_fixtures() -> None:
+    os.makedirs(PDF_DIR, exist_ok=True)
+    expected: dict[str, dict] = {}
+
+    def save(name: str, doc, fields: dict):
+        doc.save(os.path.join(PDF_DIR, name), garbage=3, deflate=True)
+        expected[name] = fields
+
+    # Stewards' decision with the usual two-column table
+    doc = fitz.open()
+    p = doc.new_page()
+    _header(p, "2026 Mexico City Grand Prix", 41, "01 November 2026", "16:45",
+            "To The Team Manager, McLaren Formula 1 Team")
+    p.insert_text((50, 170), "Decision - Car 4 - Causing a collision", fontsize=13)
+    _table(p, [
+        ("No / Driver", "4 - Lando Norris"),
+        ("Competitor", "McLaren Formula 1 Team"),
+        ("Time", "14:22"),
+        ("Session", "Race"),
+        ("Fact", "Collision with Car 16 at Turn 1."),
+        ("Infringement", "Breach of Article 33.4 of the FIA Formula One Sporting Regulations."),
+        ("Decision", "10 second time penalty."),
+        ("Reason", "The Stewards reviewed video evidence and determined that Car 4 was wholly to blame."),
+    ])
+    save("decision_car4.pdf", doc, {
+        "doc_num": "41", "title": "Decision", "event": "2026 Mexico City Grand Prix",
+        "date": "01 November 2026", "time": "16:45", "driver_info": "4 – Lando Norris",
+        "competitor": "McLaren Formula 1 Team", "penalty": "10 second time penalty.",
+        "reason": "The Stewards reviewed video evidence and determined that Car 4 was wholly to blame.",
+    })
+
+    # Summons with the table shifted right (layout drift) and the value column further out
+    doc = fitz.open()
+    p = doc.new_page()
+    _header(p, "2026 Sao Paulo Grand Prix", 12, "07 November 2026", "11:05",
+            "To The Team Manager, Scuderia Ferrari HP", right_x=380)
+    p.insert_text((50, 170), "Summons - Car 16 - Alleged unsafe release", fontsize=13)
+    _table(p, [
+        ("No / Driver", "16 - Charles Leclerc"),
+        ("Competitor", "Scuderia Ferrari HP"),
+        ("Time", "10:41"),
+        ("Session", "Practice 3"),
+        ("Reason", "The driver is required to report to the Stewards at 12:00."),
+    ], label_x=70, value_x=230)
+    save("summons_car16.pdf", doc, {
+        "doc_num": "12", "title": "Summons", "event": "2026 Sao Paulo Grand Prix",
+        "date": "07 November 2026", "time": "11:05", "driver_info": "16 – Charles Leclerc",
+        "competitor": "Scuderia Ferrari HP", "penalty": "",
+        "reason": "The driver is required to report to the Stewards at 12:00.",
+    })
+
+    # Infringement where the value cells were written before their labels (separate blocks)
+    doc = fitz.open()
+    p = doc.new_page()
+    p.insert_text((160, 200), "81 - Oscar Piastri", fontsize=10)
+    p.insert_text((160, 222), "McLaren Formula 1 Team", fontsize=10)
+    p.insert_text((160, 244), "Drive through penalty.", fontsize=10)
+    p.insert_text((160, 266), "Exceeded the pit lane speed limit by 4.1 km/h.", fontsize=10)
+    for y, label in ((200, "No / Driver"), (222, "Competitor"), (244, "Decision"), (266, "Reason")):
+        p.insert_text((50, y), label, fontsize=10)
+    _header(p, "2026 Las Vegas Grand Prix", 27, "21 November 2026", "22:10",
+            "To The Team Manager, McLaren Formula 1 Team")
+    p.insert_text((50, 170), "Infringement - Car 81 - Pit lane speeding", fontsize=13)
+    save("infringement_car81.pdf", doc, {
+        "doc_num": "27", "title": "Infringement", "event": "2026 Las Vegas Grand Prix",
+        "date": "21 November 2026", "time": "22:10", "driver_info": "81 – Oscar Piastri",
+        "competitor": "McLaren Formula 1 Team", "penalty": "Drive through penalty.",
+        "reason": "Exceeded the pit lane speed limit by 4.1 km/h.",
+    })
+
+    # Multi-page provisional classification (dense table)
+    doc = fitz.open()
+    for page_no in range(3):
+        p = doc.new_page()
+        if page_no == 0:
+            p.insert_text((50, 60), "2026 Qatar Grand Prix", fontsize=16)
+            p.insert_text((50, 90), "Provisional Classification - Race", fontsize=13)
+            p.insert_text((400, 60), "Document 58", fontsize=10)
+        for i in range(36):
+            y = 120 + i * 18
+            p.insert_text((50, y), f"{i + 1 + page_no * 36}", fontsize=8)
+            p.insert_text((80, y), f"{(i * 7) % 99 + 1}  DRIVER {i:02d}  TEAM {i % 10}  57  1:28:{i:02d}.{i * 13 % 1000:03d}", fontsize=8)
+    save("classification_race.pdf", doc, {
+        "doc_num": "58", "title": "Classification", "event": "2026 Qatar Grand Prix",
+        "date": "", "time": "", "driver_info": "", "competitor": "", "penalty": "", "reason": "",
+    })
+
+    # Race director's event notes
+    doc = fitz.open()
+    p = doc.new_page()
+    _header(p, "2026 Abu Dhabi Grand Prix", 3, "04 December 2026", "09:00",
+            "To All Teams, All Officials")
+    p.insert_text((50, 170), "Race Director's Event Notes", fontsize=13)
+    for i in range(25):
+        p.insert_text((50, 200 + i * 16), f"{i + 1}. Track limits at Turn {i % 16 + 1} will be monitored.", fontsize=10)
+    save("event_notes.pdf", doc, {
+        "doc_num": "3", "title": "Notes", "event": "2026 Abu Dhabi Grand Prix",
+        "date": "04 December 2026", "time": "09:00", "driver_info": "", "competitor": "",
+        "penalty": "", "reason": "",
+    })
+
+    with open(EXPECTED_FILE, "w", encoding="utf-8") as f:
+        json.dump(expected, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+
+
+# --- benchmark ---------------------------------------------------------------------------
+
+def _throughput(fn, paths: list[str]) -> float:
+    t0 = time.perf_counter()
+    for _ in range(ROUNDS):
+        for p in paths:
+            fn(p)
+    return ROUNDS * len(paths) / (time.perf_counter() - t0)
+
+
+def _best_throughput(fns: dict, paths: list[str]) -> dict[str, float]:
+    # Interleaved so a noisy neighbour slows every extractor alike; the best run is reported
+    best = dict.fromkeys(fns, 0.0)
+    for _ in range(REPEATS):
+        for label, fn in fns.items():
+            best[label] = max(best[label], _throughput(fn, paths))
+    return best
+
+
+def _score(fn, paths: list[str], expected: dict) -> tuple[int, int]:
+    hits = total = 0
+    for p in paths:
+        exp = expected.get(os.path.basename(p))
+        if not exp:
+            continue
+        got = fn(p)
+        for field in FIELDS:
+            total += 1
+            hits += got.get(field, "") == exp.get(field, "")
+    return hits, total
+
+
+def main(argv: list[str]) -> int:
+    if "--write-fixtures" in argv:
+        write_synthetic_fixtures()
+        print(f"Wrote fixtures to {PDF_DIR}")
+        return 0
+
+    paths = argv or sorted(glob.glob(os.path.join(PDF_DIR, "*.pdf")))
+    if not paths:
+        print("No PDFs found; run with --write-fixtures first.")
+        return 1
+    expected = {}
+    if os.path.exists(EXPECTED_FILE):
+        with open(EXPECTED_FILE, "r", encoding="utf-8") as f:
+            expected = json.load(f)
+
+    print(f"{len(paths)} PDFs, {ROUNDS} rounds, best of {REPEATS}")
+    fns = {"legacy regex": legacy_extract, "position-based": current_extract}
+    rates = _best_throughput(fns, paths)
+    missed = 0
+    for label, fn in fns.items():
+        rate = rates[label]
+        hits, total = _score(fn, paths, expected)
+        accuracy = f"{hits}/{total} expected fields" if total else "no expectations"
+        print(f"  {label:<14} {rate:8.0f} docs/s   {accuracy}")
+        if fn is current_extract:
+            missed = total - hits
+    # The legacy extractor is known to miss fields; the current one must not
+    return 1 if missed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,159 @@
+"""Parse-time and peak-memory benchmark for FIA PDF link extraction.
+
+Compares the BeautifulSoup reference (`extract_pdf_links`) with the streaming
+scanner (`iter_pdf_links`) on saved copies of the FIA season page.
+
+    python -m benchmarks.bench_pdf_links [page.html ...]
+
+With no arguments every `benchmarks/fixtures/*.html` is used. Save a real page
+with e.g. `curl -o benchmarks/fixtures/fia_live.html <FIA_DOCS_URL>`. Every run
+first checks that both extractors agree on the tag-syntax edge cases in
+EDGE_CASES, fed to the scanner in chunks of several sizes.
+`--write-fixture` regenerates the synthetic `fia_season_page.html` fixture.
+"""
+from __future__ import annotations
+
+import glob
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+from fia_scraper.scraper import extract_pdf_links, iter_pdf_links
+
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+SYNTHETIC_FIXTURE = os.path.join(FIXTURE_DIR, "fia_season_page.html")
+CHUNK = 64 * 1024
+ROUNDS = 5
+
+# Markup where a naive href search and html.parser disagree
+EDGE_CASES = [
+    """<a title="x href='/fake.pdf'" href="/real.pdf">quoted href in another attribute</a>""",
+    """<a title='y href="/fake.pdf"'>only a quoted href</a>""",
+    """<a href="/first.pdf" href="/second.pdf">duplicate href (the last one wins)</a>""",
+    """<a/href="/slash.pdf">slash before the attribute</a><a/href=/bare.pdf>unquoted</a>""",
+    """<a data-href="/data.pdf">prefixed name</a><abbr href="/abbr.pdf">other tag</abbr>""",
+    """<a-b href="/dash.pdf">tag name with a dash</a-b>""",
+    """<A HREF = '/upper.pdf' >upper case, spaces around =</A>""",
+    """<a title=foo"bar href="/quote_in_bare_value.pdf">quote inside an unquoted value</a>""",
+    """<a x="1"href="/no_space.pdf">no space after a quoted value</a>""",
+    """<a href="/gt>inside.pdf">&gt; inside quotes</a><a href="/self_closing.pdf"/>""",
+    """<a href=/amp&amp;ersand.pdf>entity</a><a href>no value</a><a href="">empty</a>""",
+]
+
+
+def _chunks(text: str, size: int = CHUNK):
+    for i in range(0, len(text), size):
+        yield text[i:i + size]
+
+
+def write_synthetic_fixture(path: str = SYNTHETIC_FIXTURE, docs: int = 900) -> None:
+    """Approximate the FIA season page: a large Drupal shell, inline scripts and
+    comments that mention PDFs, and one list block per event of document links."""
+    rng = random.Random(2026)
+    events = ["Australian", "Chinese", "Japanese", "Bahrain", "Saudi Arabian", "Miami",
+              "Canadian", "Monaco", "Spanish", "Austrian", "British", "Belgian"]
+    kinds = ["Decision - Car 4 - Impeding", "Summons - Car 16 - Unsafe release",
+             "Infringement - Car 44 - Pit lane speeding", "Final Starting Grid",
+             "Provisional Classification", "Entry List", "Scrutineering", "Race Director Notes"]
+
+    parts = ["<!DOCTYPE html><html><head><title>Season 2026 | Federation Internationale de l'Automobile</title>"]
+    for i in range(40):
+        parts.append(f'<link rel="stylesheet" href="/sites/default/files/css/css_{i:04x}.css">')
+    parts.append("<script>var drupalSettings = {\"path\": {\"baseUrl\": \"/\"}, "
+                 "\"tpl\": \"<a href=\\\"/sites/default/files/template.pdf\\\">x</a>\"};</script>")
+    parts.append("<style>a[href$='.pdf'] { padding-left: 16px; }</style></head><body>")
+    parts.append("<!-- <a href=\"/sites/default/files/old_bulletin.pdf\">archived</a> -->")
+    for i in range(200):
+        parts.append(f'<li class="menu-item"><a href="/node/{i}" title="Menu {i}">Menu item {i}</a></li>')
+
+    n = 0
+    for ev in events:
+        parts.append(f'<div class="event-wrapper"><div class="event-title">{ev} Grand Prix</div><ul class="document-row-wrapper">')
+        for _ in range(docs // len(events)):
+            n += 1
+            kind = rng.choice(kinds)
+            slug = f"2026_{ev.lower().replace(' ', '_')}_grand_prix_-_doc_{n}_-_{kind.lower().replace(' ', '_')}.pdf"
+            href = f"/sites/default/files/decision-document/{slug}"
+            if n % 97 == 0:
+                href = "https://www.fia.com" + href
+            if n % 53 == 0:
+                href = href.replace("_-_", "_&amp;_", 1)
+            parts.append(
+                f'<li class="document-row"><a href="{href}" target="_blank">'
+                f'<div class="title">Doc {n} - {kind}</div>'
+                f'<div class="published"><span class="date-display-single">'
+                f'{rng.randint(1, 28):02d}.0{rng.randint(3, 9)}.26 {rng.randint(8, 22):02d}:{rng.randint(0, 59):02d}'
+                f"</span></div></a></li>"
+            )
+            if n % 41 == 0:
+                # Same document linked twice (dedup must keep the first occurrence)
+                parts.append(f'<li class="document-row"><a href=\'{href}\'>Doc {n} (again)</a></li>')
+        parts.append("</ul></div>")
+    parts.append('<footer><a href="/privacy">Privacy</a></footer></body></html>')
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(parts))
+
+
+def _measure(fn, text: str) -> tuple[float, int, list[str]]:
+    best = float("inf")
+    for _ in range(ROUNDS):
+        t0 = time.perf_counter()
+        out = fn(text)
+        best = min(best, time.perf_counter() - t0)
+    tracemalloc.start()
+    fn(text)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak, out
+
+
+def check_edge_cases() -> int:
+    mismatches = 0
+    for html in EDGE_CASES:
+        expected = extract_pdf_links(html)
+        for size in (1, 2, 7, CHUNK):
+            got = list(iter_pdf_links(_chunks(html, size)))
+            if got != expected:
+                mismatches += 1
+                print(f"  MISMATCH ({size}-char chunks) on {html!r}: bs4 {expected}, stream {got}")
+    print(f"Edge cases: {len(EDGE_CASES)} snippets, {mismatches} mismatches")
+    return mismatches
+
+
+def main(argv: list[str]) -> int:
+    if "--write-fixture" in argv:
+        write_synthetic_fixture()
+        print(f"Wrote {SYNTHETIC_FIXTURE}")
+        return 0
+    if check_edge_cases():
+        return 1
+
+    paths = argv or sorted(glob.glob(os.path.join(FIXTURE_DIR, "*.html")))
+    if not paths:
+        print("No page fixtures found; run with --write-fixture first.")
+        return 1
+
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            text = f.read()
+
+        bs_time, bs_peak, bs_links = _measure(extract_pdf_links, text)
+        st_time, st_peak, st_links = _measure(lambda t: list(iter_pdf_links(_chunks(t))), text)
+
+        print(f"{os.path.basename(path)}: {len(text) / 1024:.0f} KiB, {len(bs_links)} PDF links")
+        print(f"  bs4     {bs_time * 1000:8.1f} ms   peak {bs_peak / 1024:8.0f} KiB")
+        print(f"  stream  {st_time * 1000:8.1f} ms   peak {st_peak / 1024:8.0f} KiB"
+              f"   ({bs_time / st_time:.1f}x faster, {bs_peak / max(st_peak, 1):.1f}x less memory)")
+        if st_links != bs_links:
+            print(f"  MISMATCH: streaming extractor returned {len(st_links)} links")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,101 @@
+"""Renders-per-second microbenchmark for the weekend cards.
+
+Compares three paths over the same set of cards (schedule, standings, results,
+weather and delta shaped):
+
+  legacy - the previous renderer: fonts loaded and canvas allocated per call
+  draw   - `draw_weekend_card`: cached fonts and background templates, no PNG cache
+  cached - `render_weekend_card` on content it has already rendered (in-memory LRU hit)
+
+    python -m benchmarks.bench_render [--seconds 2]
+"""
+from __future__ import annotations
+
+import argparse
+import io
+import sys
+import time
+
+from PIL import Image, ImageDraw, ImageFont
+
+from f1_weekend.render import CardCache, card_key, draw_weekend_card
+import f1_weekend.render as render
+
+
+CARDS = [
+    ("F1 Weekend: Mexico City Grand Prix",
+     ["Race: Mexico City Grand Prix", "Circuit: Autódromo Hermanos Rodríguez", "Race (UTC): Sun 25 Oct 20:00",
+      "Qualifying (UTC): Sat 24 Oct 21:00"], "Source: Ergast-compatible API · 2026-10-22 09:00 UTC"),
+    ("F1 Standings",
+     ["Top 10 Drivers:"] + [f"{i}. Driver Number{i} — {400 - 23 * i} pts" for i in range(1, 11)]
+     + ["", "Top 10 Constructors:"] + [f"{i}. Constructor {i} — {600 - 41 * i} pts" for i in range(1, 11)],
+     "Source: Ergast-compatible API · 2026-10-25 22:00 UTC"),
+    ("Race result: Mexico City Grand Prix",
+     ["Results: Mexico City Grand Prix"] + [f"{i}. Driver Number{i} (Team {i})" for i in range(1, 11)],
+     "Source: Ergast-compatible API · 2026-10-25 22:00 UTC"),
+    ("Weather: Mexico City Grand Prix",
+     ["Race: Mexico City Grand Prix", "Forecast (race hour, UTC): Sun 20:00", "Temp: 21.5°C",
+      "Feels / dew point: 9.1°C", "Humidity: 45%", "Rain chance: 10%", "Wind: 8.3 km/h", "Visibility: 24.1 km"],
+     "Source: Open-Meteo (UTC) · best effort"),
+    ("Champ delta", ["Championship delta (vs R18)"] + [f"Driver Number{i}: +{26 - 3 * i} pts" for i in range(1, 6)],
+     "Source: Ergast-compatible API"),
+]
+
+
+def legacy_render(title: str, lines: list[str], footer: str) -> bytes:
+    def font(size: int):
+        try:
+            return ImageFont.truetype("DejaVuSans.ttf", size)
+        except Exception:
+            return ImageFont.load_default()
+
+    width, pad = 900, 32
+    height = pad * 2 + 60 + (len(lines) * 30) + 50
+    img = Image.new("RGB", (width, height), (14, 17, 22))
+    draw = ImageDraw.Draw(img)
+    draw.rectangle([0, 0, width, 8], fill=(255, 60, 60))
+    y = pad
+    draw.text((pad, y), title, font=font(40), fill=(235, 240, 246))
+    y += 60
+    for line in lines:
+        draw.text((pad, y), line, font=font(22), fill=(235, 240, 246))
+        y += 30
+    draw.text((pad, height - pad - 18), footer, font=font(16), fill=(170, 180, 192))
+    bio = io.BytesIO()
+    img.save(bio, format="PNG", optimize=True)
+    return bio.getvalue()
+
+
+def rate(fn, seconds: float) -> float:
+    n = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        for title, lines, footer in CARDS:
+            fn(title, lines, footer)
+            n += 1
+    return n / (time.perf_counter() - start)
+
+
+def main(argv: list[str]) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--seconds", type=float, default=2.0, help="time spent on each path")
+    args = ap.parse_args(argv)
+
+    # Memory-only cache so the benchmark leaves no files behind
+    render.card_cache = CardCache(directory=None)
+    for title, lines, footer in CARDS:
+        render.render_weekend_card(title, lines, footer)
+    assert all(render.card_cache.get(card_key(*c)) for c in CARDS)
+
+    legacy = rate(legacy_render, args.seconds)
+    draw = rate(draw_weekend_card, args.seconds)
+    cached = rate(render.render_weekend_card, args.seconds)
+    print(f"{len(CARDS)} card types, {args.seconds:.0f} s per path")
+    print(f"  legacy : {legacy:10.1f} renders/s")
+    print(f"  draw   : {draw:10.1f} renders/s  ({draw / legacy:.2f}x)")
+    print(f"  cached : {cached:10.1f} renders/s  ({cached / legacy:.0f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
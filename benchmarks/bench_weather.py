@@ -0,0 +1,112 @@
+"""Weather card analysis: per-call string scans vs the parsed hourly forecast.
+
+Both paths answer the same questions over a full weekend of Open-Meteo hourly
+data (FP1 through the race): the race-hour snapshot, and for every session its
+temperature range, rain peak and rain trend.
+
+  legacy   - the previous approach: `startswith` scans over `hourly["time"]` and
+             element-wise reads of the parallel lists, once per session hour
+  columnar - `HourlyForecast.from_api` once, then `at()` / `session_windows()`
+
+Before timing, `get_hourly_forecast` is called against the local stand-in
+(`benchmarks.stand_in`, serving the recorded Open-Meteo fixture) to check the
+request, the parse and the in-process cache end to end.
+
+    python -m benchmarks.bench_weather [--days 7] [--seconds 2]
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+from benchmarks.bench_weekend_engine import synthetic_forecast
+from benchmarks.stand_in import StandIn
+from f1_weekend import weather
+from f1_weekend.weather import SESSION_HOURS, HourlyForecast
+
+
+SESSIONS = [
+    ("FP1", datetime(2026, 10, 23, 18, 30, tzinfo=timezone.utc)),
+    ("FP2", datetime(2026, 10, 23, 22, 0, tzinfo=timezone.utc)),
+    ("FP3", datetime(2026, 10, 24, 17, 30, tzinfo=timezone.utc)),
+    ("Qualifying", datetime(2026, 10, 24, 21, 0, tzinfo=timezone.utc)),
+    ("Race", datetime(2026, 10, 25, 20, 0, tzinfo=timezone.utc)),
+]
+
+
+def legacy(data: dict) -> list:
+    hourly = data.get("hourly") or {}
+    times = hourly.get("time") or []
+    temps = hourly.get("temperature_2m") or []
+    pops = hourly.get("precipitation_probability") or []
+    out = []
+    for label, start in SESSIONS:
+        rows = []
+        target = start.replace(minute=0)
+        end = start + timedelta(hours=SESSION_HOURS[label])
+        while target < end:
+            for i, tstamp in enumerate(times):
+                if tstamp.startswith(target.strftime("%Y-%m-%dT%H")):
+                    rows.append((temps[i] if i < len(temps) else None, pops[i] if i < len(pops) else None))
+                    break
+            target += timedelta(hours=1)
+        t = [r[0] for r in rows if r[0] is not None]
+        p = [r[1] for r in rows if r[1] is not None]
+        out.append((label, min(t, default=None), max(t, default=None), max(p, default=None)))
+    return out
+
+
+def columnar(data: dict) -> list:
+    fc = HourlyForecast.from_api(data)
+    fc.at(SESSIONS[-1][1])
+    return [(w.label, w.temp_min, w.temp_max, w.rain_peak) for w in fc.session_windows(SESSIONS)]
+
+
+def check_fetch() -> None:
+    # One real request through get_hourly_forecast; the repeat must come from its cache
+    with StandIn() as s:
+        url = weather.OPEN_METEO_URL
+        weather.OPEN_METEO_URL = s.env()["OPEN_METEO_URL"]
+        try:
+            start = SESSIONS[0][1].date()
+            end = SESSIONS[-1][1].date()
+            data = weather.get_hourly_forecast(19.4042, -99.0907, start, end)
+            again = weather.get_hourly_forecast(19.4042, -99.0907, start, end)
+        finally:
+            weather.OPEN_METEO_URL = url
+    assert again is data and s.requests["weather"] == 1, dict(s.requests)
+    fc = HourlyForecast.from_api(data)
+    assert len(fc.hours) and set(weather.HOURLY_FIELDS) <= set(data["hourly"]), sorted(data["hourly"])
+    print(f"get_hourly_forecast: {len(fc.hours)} hours from the stand-in, repeat served from cache")
+
+
+def rate(fn, data: dict, seconds: float) -> float:
+    n = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        fn(data)
+        n += 1
+    return n / (time.perf_counter() - start)
+
+
+def main(argv: list[str]) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--days", type=int, default=7, help="hours of forecast in the payload, in days")
+    ap.add_argument("--seconds", type=float, default=2.0, help="time spent on each path")
+    args = ap.parse_args(argv)
+
+    check_fetch()
+    data = synthetic_forecast(args.days)
+    assert legacy(data) == columnar(data), (legacy(data), columnar(data))
+    old = rate(legacy, data, args.seconds)
+    new = rate(columnar, data, args.seconds)
+    print(f"{len(SESSIONS)} sessions, {24 * args.days} forecast hours")
+    print(f"  legacy   : {old:10.1f} cards/s")
+    print(f"  columnar : {new:10.1f} cards/s  ({new / old:.2f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
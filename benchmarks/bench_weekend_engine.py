@@ -0,0 +1,142 @@
+"""Wall-clock benchmark of the weekend poster's sync and async engines.
+
+Runs a Sunday `auto` update (weather, results, delta, standings, head-to-head)
+against stubbed services: the F1 API, Open-Meteo and Discord each answer after a
+fixed latency, while cards are rendered for real. Every run starts from an
+empty state database, so all five posts go out each time.
+
+    python -m benchmarks.bench_weekend_engine [--api-ms 250] [--send-ms 150] [--rounds 3]
+"""
+from __future__ import annotations
+
+import argparse
+import math
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+STATE_DIR = tempfile.mkdtemp(prefix="bench_weekend_")
+os.environ["F1_WEEKEND_STATE_DB"] = os.path.join(STATE_DIR, "state.db")
+os.environ["F1_WEEKEND_STATE_FILE"] = os.path.join(STATE_DIR, "legacy.json")
+os.environ.setdefault("DISCORD_F1_WEEKEND_WEBHOOK_URL", "http://discord.invalid/webhook")
+
+from f1_weekend import f1_api, post, render, snapshot  # noqa: E402
+
+
+SUNDAY = datetime(2026, 10, 25, 22, 0, tzinfo=timezone.utc)
+RACE = {
+    "season": "2026", "round": "19", "raceName": "Mexico City Grand Prix",
+    "date": "2026-10-25", "time": "20:00:00Z",
+    "Circuit": {"circuitName": "Autódromo Hermanos Rodríguez",
+                "Location": {"lat": "19.4042", "long": "-99.0907", "locality": "Mexico City", "country": "Mexico"}},
+    "Qualifying": {"date": "2026-10-24", "time": "21:00:00Z"},
+}
+DRIVERS = [("Max", "Verstappen", "Red Bull"), ("Lando", "Norris", "McLaren"), ("Charles", "Leclerc", "Ferrari"),
+           ("Oscar", "Piastri", "McLaren"), ("Lewis", "Hamilton", "Ferrari"), ("George", "Russell", "Mercedes"),
+           ("Carlos", "Sainz", "Williams"), ("Fernando", "Alonso", "Aston Martin"), ("Pierre", "Gasly", "Alpine"),
+           ("Nico", "Hulkenberg", "Sauber"), ("Alex", "Albon", "Williams"), ("Yuki", "Tsunoda", "Red Bull")]
+
+
+class _FrozenClock(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return SUNDAY
+
+
+def _payload(path: str) -> dict:
+    if "driverStandings" in path:
+        rows = [{"position": str(i + 1), "points": str(400 - 23 * i), "Driver": {"givenName": g, "familyName": f}}
+                for i, (g, f, _) in enumerate(DRIVERS)]
+        return {"MRData": {"StandingsTable": {"StandingsLists": [{"DriverStandings": rows}]}}}
+    if "constructorStandings" in path:
+        teams = list(dict.fromkeys(t for _, _, t in DRIVERS))
+        rows = [{"position": str(i + 1), "points": str(600 - 41 * i), "Constructor": {"name": t}} for i, t in enumerate(teams)]
+        return {"MRData": {"StandingsTable": {"StandingsLists": [{"ConstructorStandings": rows}]}}}
+    if "qualifying" in path:
+        rows = [{"position": str(i + 1), "Driver": {"givenName": g, "familyName": f}, "Constructor": {"name": t},
+                 "Q1": f"1:17.{300 + 17 * i}", "Q2": f"1:16.{800 + 11 * i}" if i < 15 else None,
+                 "Q3": f"1:16.{100 + 13 * i}" if i < 10 else None}
+                for i, (g, f, t) in enumerate(DRIVERS)]
+        return {"MRData": {"RaceTable": {"Races": [dict(RACE, QualifyingResults=rows)]}}}
+    if "sprint" in path:
+        rows = [{"position": str(i + 1), "Driver": {"givenName": g, "familyName": f}, "Constructor": {"name": t}}
+                for i, (g, f, t) in enumerate(DRIVERS)]
+        return {"MRData": {"RaceTable": {"Races": [dict(RACE, SprintResults=rows)]}}}
+    if "results" in path:
+        rows = [{"position": str(i + 1), "Driver": {"givenName": g, "familyName": f}, "Constructor": {"name": t}}
+                for i, (g, f, t) in enumerate(DRIVERS)]
+        return {"MRData": {"RaceTable": {"Races": [dict(RACE, Results=rows)]}}}
+    return {"MRData": {"RaceTable": {"Races": [RACE]}}}
+
+
+def synthetic_forecast(days: int = 3) -> dict:
+    # Open-Meteo-shaped hourly payload, Friday 00:00 UTC onwards, with an afternoon shower
+    n = 24 * days
+    return {"hourly": {
+        "time": [f"2026-10-{23 + h // 24}T{h % 24:02d}:00" for h in range(n)],
+        "temperature_2m": [round(14 + 8 * math.sin((h % 24 - 9) / 24 * 2 * math.pi), 1) for h in range(n)],
+        "precipitation_probability": [max(0, 60 - 12 * abs(h % 24 - 16)) for h in range(n)],
+        "wind_speed_10m": [round(6 + (h % 7) * 0.9, 1) for h in range(n)],
+        "dew_point_2m": [9.1] * n,
+        "visibility": [24140.0] * n,
+        "relative_humidity_2m": [45 + h % 24 for h in range(n)],
+    }}
+
+
+def install_stubs(api_s: float, send_s: float) -> None:
+    def get_json(path: str) -> dict:
+        time.sleep(api_s)
+        return _payload(path)
+
+    def forecast(lat: float, lon: float, start=None, end=None) -> dict:
+        time.sleep(api_s)
+        return synthetic_forecast()
+
+    def fan_out(requests_by_subscriber: dict) -> dict:
+        time.sleep(send_s)
+        return {sub.name: None for sub in requests_by_subscriber}
+
+    f1_api._get_json = get_json
+    snapshot.get_hourly_forecast = forecast
+    post.fan_out = fan_out
+    post.datetime = _FrozenClock
+
+
+def run(engine: str) -> float:
+    if os.path.exists(os.environ["F1_WEEKEND_STATE_DB"]):
+        os.remove(os.environ["F1_WEEKEND_STATE_DB"])
+    post.ENGINE = engine
+    # Fresh memory-only card cache, so every round renders its cards
+    render.card_cache = render.CardCache(directory=None)
+    start = time.perf_counter()
+    post.post_weekend_update("auto")
+    return time.perf_counter() - start
+
+
+def main(argv: list[str]) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--api-ms", type=float, default=250, help="stubbed F1 API / Open-Meteo latency")
+    ap.add_argument("--send-ms", type=float, default=150, help="stubbed Discord latency")
+    ap.add_argument("--rounds", type=int, default=3)
+    args = ap.parse_args(argv)
+    install_stubs(args.api_ms / 1000, args.send_ms / 1000)
+
+    results = {}
+    for engine in ("sync", "async"):
+        times = []
+        for _ in range(args.rounds):
+            times.append(run(engine))
+        results[engine] = statistics.median(times)
+
+    print(f"Sunday auto run, API {args.api_ms:.0f} ms, Discord {args.send_ms:.0f} ms, median of {args.rounds}")
+    for engine, t in results.items():
+        print(f"  {engine:>5}: {t * 1000:7.1f} ms")
+    print(f"  speedup: {results['sync'] / results['async']:.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,272 @@
+"""Local stand-in for the FIA site, the Ergast-compatible API, Open-Meteo and Discord.
+
+One threaded HTTP server on 127.0.0.1 answers from the recorded fixtures in
+`benchmarks/fixtures`, with an optional per-service latency, so the real code
+paths (requests sessions, conditional GETs, streaming, multipart uploads) run
+without the network:
+
+  GET  /documents/...                  FIA season page (ETag / If-None-Match)
+  GET  /sites/....pdf                  a PDF from fixtures/pdfs, picked by the path
+  GET  /ergast/f1/....json             fixtures/ergast/<kind>.json (ETag)
+  GET  /v1/forecast                    fixtures/open_meteo/forecast.json
+  POST /api/webhooks/<name>/<token>    Discord webhook: body read and counted, 204
+
+Point the code at it with `StandIn.env()` before importing the scraper or the
+weekend poster (their endpoints are read at import time). Run on its own to
+poke at it by hand, or with --record to refresh the Ergast and Open-Meteo
+fixtures from the live services (the FIA page and PDF corpus are shared with
+the other benchmarks and are left alone):
+
+    python -m benchmarks.stand_in [--port 8765] [--record]
+"""
+from __future__ import annotations
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+PAGE_FIXTURE = os.path.join(FIXTURE_DIR, "fia_season_page.html")
+PDF_DIR = os.path.join(FIXTURE_DIR, "pdfs")
+ERGAST_DIR = os.path.join(FIXTURE_DIR, "ergast")
+OPEN_METEO_FILE = os.path.join(FIXTURE_DIR, "open_meteo", "forecast.json")
+
+# Ergast fixture kind for a request path, first match wins
+ERGAST_ROUTES = (
+    (re.compile(r"/next\.json$"), "next"),
+    (re.compile(r"/last/results\.json$"), "last_results"),
+    (re.compile(r"/last\.json$"), "last"),
+    (re.compile(r"/results\.json$"), "results"),
+    (re.compile(r"/qualifying\.json$"), "qualifying"),
+    (re.compile(r"/sprint\.json$"), "sprint"),
+    (re.compile(r"/driverStandings\.json$"), "driverStandings"),
+    (re.compile(r"/constructorStandings\.json$"), "constructorStandings"),
+    (re.compile(r"/\d{4}/\d+\.json$"), "next"),
+)
+
+
+def _etag(body: bytes) -> str:
+    return '"' + hashlib.sha256(body).hexdigest()[:16] + '"'
+
+
+class StandIn:
+    def __init__(self, port: int = 0, latency: dict[str, float] | None = None):
+        # latency: seconds added per request, by service ("fia", "pdf", "api", "weather", "discord")
+        self.latency = dict(latency or {})
+        self.requests: Counter[str] = Counter()
+        self.webhook_bytes: Counter[str] = Counter()
+        self._lock = threading.Lock()
+        with open(PAGE_FIXTURE, "r", encoding="utf-8") as f:
+            # Site-relative links, so PDFs are fetched from the stand-in too
+            self._page = f.read().replace("https://www.fia.com/", "/")
+        self.hidden: set[str] = set()  # PDF paths left out of the page (documents not published yet)
+        self._pdfs = [open(p, "rb").read() for p in sorted(glob.glob(os.path.join(PDF_DIR, "*.pdf")))]
+        self._ergast = {}
+        for path in glob.glob(os.path.join(ERGAST_DIR, "*.json")):
+            with open(path, "rb") as f:
+                self._ergast[os.path.basename(path)[:-len(".json")]] = f.read()
+        with open(OPEN_METEO_FILE, "rb") as f:
+            self._forecast = f.read()
+        self.server = ThreadingHTTPServer(("127.0.0.1", port), self._handler())
+        self.server.daemon_threads = True
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def env(self) -> dict[str, str]:
+        # Environment that points both pipelines at this server
+        return {
+            "FIA_BASE_URL": self.url,
+            "F1_API_BASE": f"{self.url}/ergast",
+            "OPEN_METEO_URL": f"{self.url}/v1/forecast",
+            "DISCORD_WEBHOOK_URL": f"{self.url}/api/webhooks/fia/token",
+            "DISCORD_ERROR_WEBHOOK_URL": f"{self.url}/api/webhooks/errors/token",
+            "DISCORD_F1_WEEKEND_WEBHOOK_URL": f"{self.url}/api/webhooks/weekend/token",
+        }
+
+    def pdf_paths(self) -> list[str]:
+        return re.findall(r'href="(/sites/[^"]+\.pdf)"', self._page)
+
+    def page(self) -> bytes:
+        page = self._page
+        for path in self.hidden:
+            page = page.replace(f'href="{path}"', 'href="#"')
+        return page.encode("utf-8")
+
+    def corpus_index(self, path: str) -> int:
+        return int(hashlib.sha256(path.encode()).hexdigest(), 16) % len(self._pdfs)
+
+    def pdf(self, path: str) -> bytes:
+        # A trailing comment after %%EOF makes every document's bytes (and content hash)
+        # unique, so the scraper doesn't skip them as re-uploads of one another
+        return self._pdfs[self.corpus_index(path)] + b"\n% " + path.encode() + b"\n"
+
+    def start(self) -> StandIn:
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self) -> StandIn:
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def _count(self, service: str, nbytes: int = 0, name: str | None = None) -> None:
+        with self._lock:
+            self.requests[service] += 1
+            if name:
+                self.webhook_bytes[name] += nbytes
+
+    def _handler(self):
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body go out as separate writes; without this every response
+            # waits on the client's delayed ACK
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args):
+                pass
+
+            def _reply(self, status: int, body: bytes = b"", content_type: str = "application/json",
+                       headers: dict | None = None) -> None:
+                self.send_response(status)
+                for k, v in (headers or {}).items():
+                    self.send_header(k, v)
+                if status != 304:
+                    self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                if body and self.command != "HEAD":
+                    self.wfile.write(body)
+
+            def _conditional(self, service: str, body: bytes, content_type: str) -> None:
+                tag = _etag(body)
+                if self.headers.get("If-None-Match") == tag:
+                    self._reply(304, headers={"ETag": tag})
+                else:
+                    self._reply(200, body, content_type, {"ETag": tag})
+
+            def do_GET(self):
+                path = urlparse(self.path).path
+                if path.startswith("/documents/"):
+                    service = "fia"
+                elif path.endswith(".pdf"):
+                    service = "pdf"
+                elif path.startswith("/ergast/"):
+                    service = "api"
+                elif path.startswith("/v1/forecast"):
+                    service = "weather"
+                else:
+                    self._reply(404, b"{}")
+                    return
+                stand_in._count(service)
+                time.sleep(stand_in.latency.get(service, 0))
+
+                if service == "fia":
+                    self._conditional(service, stand_in.page(), "text/html; charset=utf-8")
+                elif service == "pdf":
+                    self._reply(200, stand_in.pdf(path), "application/pdf")
+                elif service == "weather":
+                    self._reply(200, stand_in._forecast)
+                else:
+                    kind = next((k for rx, k in ERGAST_ROUTES if rx.search(path)), None)
+                    if kind is None or kind not in stand_in._ergast:
+                        self._reply(404, b"{}")
+                        return
+                    self._conditional(service, stand_in._ergast[kind], "application/json")
+
+            def do_POST(self):
+                path = urlparse(self.path).path
+                m = re.match(r"/api/webhooks/([^/]+)/", path)
+                length = int(self.headers.get("Content-Length") or 0)
+                self.rfile.read(length)
+                if not m:
+                    self._reply(404, b"{}")
+                    return
+                stand_in._count("discord", length, m.group(1))
+                time.sleep(stand_in.latency.get("discord", 0))
+                self._reply(204, headers={"X-RateLimit-Remaining": "4", "X-RateLimit-Reset-After": "0.0"})
+
+        return Handler
+
+
+def record(api_base: str = "https://api.jolpi.ca/ergast",
+           open_meteo: str = "https://api.open-meteo.com/v1/forecast") -> None:
+    # Refresh the Ergast and Open-Meteo fixtures for the next race from the live services
+    import requests
+
+    def get(url: str) -> dict:
+        r = requests.get(url, timeout=30)
+        r.raise_for_status()
+        return r.json()
+
+    def write(path: str, data: dict) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=1)
+            f.write("\n")
+        print(f"recorded {os.path.relpath(path, FIXTURE_DIR)}")
+
+    nxt = get(f"{api_base}/f1/current/next.json")
+    race = nxt["MRData"]["RaceTable"]["Races"][0]
+    season, round_ = race["season"], race["round"]
+    paths = {
+        "next": "/f1/current/next.json",
+        "last": "/f1/current/last.json",
+        "last_results": "/f1/current/last/results.json",
+        "results": f"/f1/{season}/{round_}/results.json",
+        "qualifying": f"/f1/{season}/{round_}/qualifying.json",
+        "sprint": f"/f1/{season}/{round_}/sprint.json",
+        "driverStandings": "/f1/current/driverStandings.json",
+        "constructorStandings": "/f1/current/constructorStandings.json",
+    }
+    for kind, path in paths.items():
+        write(os.path.join(ERGAST_DIR, f"{kind}.json"), nxt if kind == "next" else get(api_base + path))
+
+    from f1_weekend.weather import HOURLY_FIELDS
+    loc = race["Circuit"]["Location"]
+    first = min(race[k]["date"] for k in race if isinstance(race[k], dict) and "date" in race[k])
+    write(OPEN_METEO_FILE, get(
+        f"{open_meteo}?latitude={loc['lat']}&longitude={loc['long']}&hourly={','.join(HOURLY_FIELDS)}"
+        f"&start_date={min(first, race['date'])}&end_date={race['date']}&timezone=UTC"))
+
+
+def main(argv: list[str]) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--record", action="store_true", help="refresh the Ergast / Open-Meteo fixtures and exit")
+    args = ap.parse_args(argv)
+    if args.record:
+        record()
+        return 0
+    with StandIn(args.port) as s:
+        print(f"Stand-in listening on {s.url}")
+        print(json.dumps(s.env(), indent=2))
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
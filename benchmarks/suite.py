@@ -0,0 +1,409 @@
+"""Offline benchmark suite: both pipelines, end to end, against the local stand-in.
+
+Starts `benchmarks.stand_in` (FIA site, Ergast API, Open-Meteo and Discord
+answering from the recorded fixtures), points the scraper and the weekend
+poster at it and times:
+
+  stages       page fetch + link scan, PDF download, metadata (and its
+               accuracy on benchmarks/fixtures/pdfs/expected.json), rasterise,
+               Discord upload, F1 API (cold / cached / revalidated), forecast,
+               card draw / cache hit, card send
+  end to end   FIA: first run (cache baseline), a run that posts --new-docs
+               documents that just appeared, and an unchanged poll (304);
+               weekend: the Sunday `auto` update with every post going out
+
+Each line reports throughput and p50 / p95 latency; the end-to-end runs also
+get a per-span breakdown from the tracer. Results are compared with the
+committed benchmarks/baseline.json, and --check exits 1 when a p50 got
+slower than the tolerance. The baseline is machine-specific (the run notes
+when it was recorded elsewhere): re-record it with --save-baseline on the
+machine you compare on, and commit it when a change is meant to move the
+numbers.
+
+    python -m benchmarks.suite [--repeat 10] [--rounds 3] [--latency api=120,discord=80]
+    python -m benchmarks.suite --save-baseline
+    python -m benchmarks.suite --check [--tolerance 0.25] [--out results.json]
+
+Every stage and end-to-end scenario gets one untimed warm-up call first.
+--check refuses to run with fewer than MIN_CHECK_REPEAT / MIN_CHECK_ROUNDS
+samples, or with other --repeat / --rounds / --new-docs than the baseline's.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timezone
+from urllib.parse import urlparse
+
+from benchmarks.stand_in import StandIn
+
+BASELINE_FILE = os.path.join(os.path.dirname(__file__), "baseline.json")
+SUNDAY = datetime(2026, 10, 25, 22, 0, tzinfo=timezone.utc)
+# Differences below this are noise whatever the ratio (sub-millisecond stages)
+MIN_REGRESSION_MS = 0.5
+# --check needs at least this many samples per stage (--repeat) and per end-to-end scenario
+# (--rounds); a p50 over fewer is mostly noise
+MIN_CHECK_REPEAT = 10
+MIN_CHECK_ROUNDS = 3
+
+
+class _FrozenClock(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return SUNDAY
+
+
+def _parse_latency(text: str) -> dict[str, float]:
+    out = {}
+    for part in filter(None, (p.strip() for p in text.split(","))):
+        service, _, ms = part.partition("=")
+        out[service.strip()] = float(ms) / 1000
+    return out
+
+
+def _timed(fn, n: int, setup=None) -> list[float]:
+    # One untimed call first: first-use costs (imports, font and PDF engine set-up,
+    # connection pools) would otherwise land in the first sample
+    if setup:
+        setup(0)
+    fn(0)
+    times = []
+    for i in range(n):
+        if setup:
+            setup(i)
+        t0 = time.perf_counter()
+        fn(i)
+        times.append(time.perf_counter() - t0)
+    return times
+
+
+def _summarise(times: list[float], ops: int = 1) -> dict:
+    p95 = statistics.quantiles(times, n=20)[18] if len(times) > 1 else times[0]
+    return {
+        "n": len(times),
+        "ops_per_s": round(ops * len(times) / sum(times), 2) if sum(times) else None,
+        "p50_ms": round(statistics.median(times) * 1000, 3),
+        "p95_ms": round(p95 * 1000, 3),
+    }
+
+
+class Suite:
+    def __init__(self, stand_in: StandIn, work_dir: str, repeat: int, rounds: int, new_docs: int):
+        self.stand_in = stand_in
+        self.work_dir = work_dir
+        self.repeat = repeat
+        self.rounds = rounds
+        self.new_docs = new_docs
+        self.stages: dict[str, dict] = {}
+        self.spans: dict[str, dict] = {}
+        self._metrics_offset = 0
+
+        # Imported only now: endpoints, webhooks and file locations are read at import time
+        from f1_weekend import api_cache, f1_api, post, render, weather
+        from f1_weekend.discord_webhook import webhook_request
+        from f1_weekend.subscribers import fan_out, load_subscribers
+        from f1_weekend.tracing import get_tracer
+        from fia_scraper import scraper
+        self.api_cache, self.f1_api, self.post, self.render, self.weather = api_cache, f1_api, post, render, weather
+        self.webhook_request, self.fan_out, self.load_subscribers = webhook_request, fan_out, load_subscribers
+        self.tracer = get_tracer()
+        self.scraper = scraper
+
+    def _fresh_dir(self, name: str) -> str:
+        path = os.path.join(self.work_dir, name)
+        shutil.rmtree(path, ignore_errors=True)
+        os.makedirs(path)
+        os.chdir(path)
+        return path
+
+    def _stage(self, name: str, times: list[float], ops: int = 1) -> None:
+        self.stages[name] = _summarise(times, ops)
+        print(f"  {name:<28} {self.stages[name]['p50_ms']:>10.2f} ms p50")
+
+    def _new_runs(self) -> list[dict]:
+        # Run summaries the tracer exported since the last call
+        path = os.environ["F1_METRICS_FILE"]
+        if not os.path.exists(path):
+            return []
+        with open(path, "r", encoding="utf-8") as f:
+            f.seek(self._metrics_offset)
+            lines = f.readlines()
+            self._metrics_offset = f.tell()
+        return [r for r in map(json.loads, lines) if r.get("type") == "run"]
+
+    # --- FIA stages -------------------------------------------------------
+
+    def fia_stages(self) -> None:
+        sc = self.scraper
+        self._fresh_dir("fia_stages")
+        links: list[str] = []
+
+        def page(_):
+            r, _v = sc.poll_documents_page({})
+            with r:
+                links[:] = sc.read_pdf_links(r)
+
+        self._stage("fia.page", _timed(page, self.repeat))
+        urls = links[: self.repeat * 2]
+        corpus = {}
+
+        def download(i):
+            path = urlparse(urls[i]).path
+            corpus[self.stand_in.corpus_index(path)] = (sc.fetch_pdf_bytes(urls[i]), path.split("/")[-1])
+
+        self._stage("fia.pdf_download", _timed(download, len(urls)))
+        # One of each corpus document, whichever links happen to map to it
+        corpus = list(corpus.values())
+        docs = [corpus[i % len(corpus)] for i in range(self.repeat)]
+        prepared = [None] * len(docs)
+        self._stage("fia.metadata", _timed(lambda i: sc.extract_pdf_metadata(docs[i][0], name=docs[i][1]), len(docs)))
+        self._check_metadata()
+
+        def rasterise(i):
+            prepared[i] = sc.prepare_document(docs[i][0], docs[i][1])
+
+        self._stage("fia.prepare_document", _timed(rasterise, len(docs)))
+        subscribers = self.load_subscribers(sc.WEBHOOK_URL, "fia")
+        self._stage("fia.discord_upload", _timed(
+            lambda i: sc.post_images_to_discord(prepared[i][1], prepared[i][0], None, subscribers), len(prepared)))
+
+    def _check_metadata(self) -> None:
+        # Every expected field of the fixture corpus must come out exactly; a miss fails the run
+        from benchmarks.bench_metadata import EXPECTED_FILE, FIELDS, PDF_DIR
+        with open(EXPECTED_FILE, "r", encoding="utf-8") as f:
+            expected = json.load(f)
+        misses, total = [], 0
+        for name, fields in expected.items():
+            got = self.scraper.extract_pdf_metadata(os.path.join(PDF_DIR, name))
+            total += len(FIELDS)
+            misses += [f"{name} {field}" for field in FIELDS if got.get(field, "") != fields.get(field, "")]
+        if misses:
+            raise RuntimeError(f"metadata extraction missed {len(misses)}/{total} expected fields: {', '.join(misses)}")
+        print(f"  {'fia.metadata accuracy':<28} {total:>7}/{total} fields")
+
+    # --- weekend stages ---------------------------------------------------
+
+    def weekend_stages(self) -> None:
+        api, cache_mod = self.f1_api, self.api_cache
+        self._fresh_dir("weekend_stages")
+        paths = ["/f1/current/next.json", "/f1/2026/20/results.json", "/f1/current/driverStandings.json"]
+
+        def cold_cache(_):
+            cache_mod._cache = cache_mod.ResponseCache(os.path.join(self.work_dir, "weekend_stages", "cold.json"))
+            if os.path.exists(cache_mod._cache.path):
+                os.remove(cache_mod._cache.path)
+
+        self._stage("f1_api.cold", _timed(lambda i: api._get_json(paths[i % 3]), self.repeat * 3, cold_cache), 1)
+        for p in paths:
+            api._get_json(p)
+        self._stage("f1_api.cached", _timed(lambda i: api._get_json(paths[i % 3]), self.repeat * 3))
+
+        def expire(i):
+            get = cache_mod.get_cache().get(paths[i % 3])
+            get.expires_at = 0
+
+        self._stage("f1_api.revalidated", _timed(lambda i: api._get_json(paths[i % 3]), self.repeat * 3, expire))
+
+        w = self.weather
+        self._stage("weather.forecast", _timed(
+            lambda i: w.HourlyForecast.from_api(w.get_hourly_forecast(19.4042, -99.0907, date(2026, 10, 23), date(2026, 10, 25))),
+            self.repeat, lambda i: w._cache.clear()))
+
+        rows = api.get_driver_standings("current")
+        lines = ["Top 10 Drivers:"] + [
+            f"{d['position']}.\t{d['Driver']['givenName']} {d['Driver']['familyName']}\t{d['points']} pts" for d in rows[:10]]
+        card = ("F1 Standings", lines, "Source: Ergast-compatible API", 1)
+        self._stage("card.draw", _timed(lambda i: self.render.draw_weekend_card(*card), self.repeat))
+        self.render.card_cache = self.render.CardCache(directory=None)
+        png = self.render.render_weekend_card(*card)
+        self._stage("card.cache_hit", _timed(lambda i: self.render.render_weekend_card(*card), self.repeat))
+
+        subs = self.load_subscribers(self.post.WEBHOOK, "weekend")
+
+        def send(_):
+            errors = self.fan_out({s: self.webhook_request("**F1 Standings**", png, "standings.png") for s in subs})
+            if any(errors.values()):
+                raise RuntimeError(f"card send failed: {errors}")
+
+        self._stage("card.send", _timed(send, self.repeat))
+
+    # --- end to end -------------------------------------------------------
+
+    def fia_end_to_end(self) -> None:
+        sc, s = self.scraper, self.stand_in
+        new = list(dict.fromkeys(s.pdf_paths()))[: self.new_docs]
+        times = {"fia.e2e.baseline": [], "fia.e2e.new_docs": [], "fia.e2e.not_modified": []}
+        self.tracer.pipeline = "fia"
+        self.tracer.drain()
+        self._new_runs()
+        # Round -1 is an untimed warm-up
+        for r in range(-1, self.rounds):
+            self._fresh_dir(f"fia_e2e_{r}")
+            sent_before = s.webhook_bytes["fia"]
+            s.hidden = set(new)
+            for phase, reveal in (("baseline", False), ("new_docs", True), ("not_modified", False)):
+                if reveal:
+                    s.hidden = set()
+                t0 = time.perf_counter()
+                sc.run_once()
+                if r >= 0:
+                    times[f"fia.e2e.{phase}"].append(time.perf_counter() - t0)
+                for run in self._new_runs():
+                    self.spans[f"fia.e2e.{phase}"] = run["spans"]
+            if s.webhook_bytes["fia"] == sent_before or s.webhook_bytes["errors"]:
+                raise RuntimeError(f"FIA end-to-end run posted nothing or reported errors ({dict(s.webhook_bytes)})")
+        for name, t in times.items():
+            self._stage(name, t, self.new_docs if name.endswith("new_docs") else 1)
+
+    def weekend_end_to_end(self) -> None:
+        post = self.post
+        post.datetime = _FrozenClock
+        self.tracer.pipeline = "weekend"
+        self.tracer.drain()
+        self._new_runs()
+        for engine in ("sync", "async"):
+            post.ENGINE = engine
+            times = []
+            for r in range(-1, self.rounds):  # round -1: untimed warm-up
+                self._fresh_dir(f"weekend_e2e_{engine}_{r}")
+                self.api_cache._cache = None
+                self.weather._cache.clear()
+                self.render.card_cache = self.render.CardCache(directory=None)
+                sent_before = self.stand_in.webhook_bytes["weekend"]
+                t0 = time.perf_counter()
+                post.post_weekend_update("auto")
+                if r >= 0:
+                    times.append(time.perf_counter() - t0)
+                self.tracer.export()
+                for run in self._new_runs():
+                    self.spans[f"weekend.e2e.{engine}"] = run["spans"]
+                if self.stand_in.webhook_bytes["weekend"] == sent_before:
+                    raise RuntimeError("weekend end-to-end run posted nothing")
+            self._stage(f"weekend.e2e.{engine}", times)
+
+
+def compare(results: dict, baseline: dict | None, tolerance: float) -> list[str]:
+    # Prints the results table; returns the stages whose p50 regressed past the tolerance
+    regressions = []
+    base = (baseline or {}).get("stages") or {}
+    print(f"\n{'stage':<28} {'ops/s':>9} {'p50 ms':>10} {'p95 ms':>10} {'base p50':>10} {'change':>8}")
+    for name, st in results["stages"].items():
+        ref = base.get(name)
+        line = f"{name:<28} {st['ops_per_s'] or 0:>9.1f} {st['p50_ms']:>10.2f} {st['p95_ms']:>10.2f}"
+        if ref:
+            change = st["p50_ms"] / ref["p50_ms"] - 1 if ref["p50_ms"] else 0.0
+            slow = change > tolerance and st["p50_ms"] - ref["p50_ms"] > MIN_REGRESSION_MS
+            line += f" {ref['p50_ms']:>10.2f} {change:>+7.0%}{'  <-- slower' if slow else ''}"
+            if slow:
+                regressions.append(name)
+        print(line)
+    if baseline and baseline.get("latency") != results.get("latency"):
+        print(f"note: baseline was recorded with latency {baseline.get('latency')}, this run {results.get('latency')}")
+    recorded = {k: (baseline or {}).get(k) for k in ("repeat", "rounds", "new_docs")}
+    if baseline and recorded != {k: results.get(k) for k in recorded}:
+        print(f"note: baseline was recorded with {recorded}; sample counts differ, so p50s may too")
+    if baseline and baseline.get("machine") != results.get("machine"):
+        print(f"note: baseline was recorded on {baseline.get('machine')} ({baseline.get('recorded_at')}); "
+              "re-record it with --save-baseline before trusting the change column")
+    return regressions
+
+
+def main(argv: list[str]) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--repeat", type=int, default=10, help="operations per stage")
+    ap.add_argument("--rounds", type=int, default=3, help="end-to-end runs per scenario")
+    ap.add_argument("--new-docs", type=int, default=6, help="documents that appear in the FIA end-to-end run")
+    ap.add_argument("--latency", default="", help="added per-request latency, e.g. fia=80,pdf=40,api=120,weather=150,discord=90")
+    ap.add_argument("--only", choices=("fia", "weekend"), help="run one pipeline")
+    ap.add_argument("--baseline", default=BASELINE_FILE)
+    ap.add_argument("--save-baseline", action="store_true", help="store this run as the baseline")
+    ap.add_argument("--tolerance", type=float, default=0.25, help="allowed p50 slow-down before --check fails")
+    ap.add_argument("--check", action="store_true", help="exit 1 if any stage regressed")
+    ap.add_argument("--out", help="also write the results to this JSON file")
+    args = ap.parse_args(argv)
+    if args.check and (args.repeat < MIN_CHECK_REPEAT or args.rounds < MIN_CHECK_ROUNDS):
+        ap.error(f"--check needs --repeat >= {MIN_CHECK_REPEAT} and --rounds >= {MIN_CHECK_ROUNDS}")
+    settings = {"repeat": args.repeat, "rounds": args.rounds, "new_docs": args.new_docs}
+
+    baseline = None
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        recorded = {k: baseline.get(k) for k in settings}
+        if args.check and recorded != settings:
+            # Different sample counts give different p50s; comparing them would flag noise
+            ap.error(f"--check: baseline was recorded with {recorded}, this run would use {settings}; "
+                     "match them or re-record the baseline")
+
+    cwd = os.getcwd()
+    work_dir = tempfile.mkdtemp(prefix="bench_suite_")
+    latency = _parse_latency(args.latency)
+    stand_in = StandIn(latency=latency).start()
+    os.environ.update(stand_in.env())
+    os.environ.update({
+        "F1_METRICS_FILE": os.path.join(work_dir, "metrics.jsonl"),
+        "DISCORD_SUBSCRIBERS": "[]",
+        "MAX_NEW_DOCS_PER_RUN": str(max(10, args.new_docs)),
+    })
+    for key in ("F1_METRICS_PROM_FILE", "F1_API_OFFLINE", "F1_WEEKEND_FORCE", "F1_WEEKEND_ALLOW_DUPES"):
+        os.environ.pop(key, None)
+    try:
+        suite = Suite(stand_in, work_dir, args.repeat, args.rounds, args.new_docs)
+        print(f"Stand-in at {stand_in.url}, latency {latency or 'none'}")
+        if args.only != "weekend":
+            suite.fia_stages()
+            suite.fia_end_to_end()
+        if args.only != "fia":
+            suite.weekend_stages()
+            suite.weekend_end_to_end()
+    finally:
+        os.chdir(cwd)
+        stand_in.stop()
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    results = {
+        "recorded_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "machine": {"python": platform.python_version(), "platform": platform.platform(), "cpus": os.cpu_count()},
+        "latency": {k: round(v * 1000) for k, v in latency.items()},
+        **settings,
+        "stages": suite.stages,
+        "spans": suite.spans,
+        "requests": dict(stand_in.requests),
+    }
+
+    print("\nEnd-to-end span breakdown (last round):")
+    for run, spans in suite.spans.items():
+        top = sorted(spans.items(), key=lambda kv: -kv[1]["seconds"])[:6]
+        print(f"  {run}: " + ", ".join(f"{n} {st['count']}x {st['seconds'] * 1000:.0f} ms" for n, st in top))
+
+    regressions = compare(results, baseline, args.tolerance)
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+            f.write("\n")
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+            f.write("\n")
+        print(f"\nBaseline saved to {args.baseline}")
+    elif baseline is None:
+        print("\nNo baseline to compare with; record one with --save-baseline")
+    elif regressions:
+        print(f"\n{len(regressions)} stage(s) slower than baseline by more than {args.tolerance:.0%}: {', '.join(regressions)}")
+        if args.check:
+            return 1
+    else:
+        print(f"\nNo stage slower than baseline by more than {args.tolerance:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import os
+from datetime import datetime, timezone
+
+from .race_calendar import covers, near_race
+
+
+# Slim entry point (`python -m f1_weekend`, same settings as `python -m f1_weekend.post`).
+# Away from every race on the calendar the run ends here, before requests, Pillow and the
+# poster are imported. Near a race the API decides as before (post._within_window), with a
+# day of slack either side so a calendar date that is slightly off can't hide a weekend,
+# and once the calendar has run out nothing is skipped.
+def main() -> None:
+    today = datetime.now(timezone.utc).date()
+    force = os.getenv("F1_WEEKEND_FORCE", "false").lower() == "true"
+    if not force and covers(today) and not near_race(today, before=7, after=2):
+        print("Not in race weekend window; skipping.")
+        return
+
+    from .post import main as post_main
+    post_main()
+
+
+if __name__ == "__main__":
+    main()
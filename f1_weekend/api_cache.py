@@ -0,0 +1,184 @@
+import json
+import os
+import re
+import threading
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+
+
+CACHE_FILE = os.getenv("F1_API_CACHE_FILE", "f1_api_cache.json")
+
+# How long a response is served without asking the API again, per endpoint class:
+#   live    - current/next, current/last, current standings: change as a weekend unfolds
+#   round   - a specific round that has not settled yet (results can still be amended)
+#   default - anything else for the current season (calendar, race info)
+# Past seasons, and rounds whose race is more than SETTLE_DAYS old, never expire.
+LIVE_TTL = int(os.getenv("F1_API_LIVE_TTL_MINUTES", "10")) * 60
+ROUND_TTL = 6 * 3600
+DEFAULT_TTL = 24 * 3600
+SETTLE_DAYS = 3
+# When every base URL fails, cached data up to this old is served instead (immutable
+# entries are always served).
+MAX_STALE_HOURS = float(os.getenv("F1_API_MAX_STALE_HOURS", "48"))
+# Entries not refreshed for this long are dropped when the cache is loaded.
+PRUNE_DAYS = 45
+
+_SEASON_RE = re.compile(r"^/?f1/(\d{4})(?:/(\d+))?(?:/|\.json)")
+
+
+@dataclass
+class CacheEntry:
+    data: dict
+    fetched_at: float
+    expires_at: float | None  # None: immutable
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def is_fresh(self, now: float) -> bool:
+        return self.expires_at is None or now < self.expires_at
+
+    def age_hours(self, now: float) -> float:
+        return (now - self.fetched_at) / 3600
+
+    def validators(self) -> dict:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def _races(data: dict) -> list[dict]:
+    return ((data.get("MRData") or {}).get("RaceTable") or {}).get("Races") or []
+
+
+def _has_payload(data: dict) -> bool:
+    mr = data.get("MRData") or {}
+    if "RaceTable" in mr:
+        return bool(_races(data))
+    if "StandingsTable" in mr:
+        return bool((mr.get("StandingsTable") or {}).get("StandingsLists"))
+    return bool(mr)
+
+
+class ResponseCache:
+    def __init__(self, path: str = CACHE_FILE):
+        self.path = path
+        self.entries: dict[str, CacheEntry] = {}
+        # "season/round" -> race date, learned from any response carrying races
+        self.race_dates: dict[str, str] = {}
+        # Base URL -> circuit breaker state (see f1_api), kept here so it survives runs
+        self.health: dict[str, dict] = {}
+        self.lock = threading.RLock()
+        self.hits = 0
+        self.revalidated = 0
+        self.stale = 0
+        self._load()
+
+    def _load(self) -> None:
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                raw = json.load(f)
+        except Exception as e:
+            print(f"⚠️ Ignoring unreadable F1 API cache {self.path}: {e}")
+            return
+        cutoff = time.time() - PRUNE_DAYS * 86400
+        dropped = 0
+        for key, value in (raw.get("entries") or {}).items():
+            # Entries written by another version (renamed or missing fields) are refetched
+            try:
+                entry = CacheEntry(**value)
+                if entry.fetched_at >= cutoff:
+                    self.entries[key] = entry
+            except (TypeError, KeyError):
+                dropped += 1
+        if dropped:
+            print(f"⚠️ Dropped {dropped} malformed F1 API cache entries from {self.path}")
+        self.race_dates = raw.get("race_dates") or {}
+        self.health = raw.get("health") or {}
+
+    def save(self) -> None:
+        with self.lock:
+            data = {
+                "entries": {k: asdict(v) for k, v in self.entries.items()},
+                "race_dates": self.race_dates,
+                "health": self.health,
+            }
+            tmp = self.path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+                f.write("\n")
+            os.replace(tmp, self.path)
+
+    def get(self, path: str) -> CacheEntry | None:
+        return self.entries.get(path)
+
+    def store(self, path: str, data: dict, headers) -> None:
+        now = time.time()
+        with self.lock:
+            for race in _races(data):
+                if race.get("season") and race.get("round") and race.get("date"):
+                    self.race_dates[f"{race['season']}/{race['round']}"] = race["date"]
+            ttl = self.ttl_for(path, data)
+            self.entries[path] = CacheEntry(
+                data=data,
+                fetched_at=now,
+                expires_at=None if ttl is None else now + ttl,
+                etag=headers.get("ETag"),
+                last_modified=headers.get("Last-Modified"),
+            )
+            self.save()
+
+    def refresh(self, path: str, headers) -> CacheEntry:
+        # 304 from a conditional request: same data, new lease.
+        entry = self.entries[path]
+        now = time.time()
+        with self.lock:
+            ttl = self.ttl_for(path, entry.data)
+            entry.fetched_at = now
+            entry.expires_at = None if ttl is None else now + ttl
+            entry.etag = headers.get("ETag") or entry.etag
+            entry.last_modified = headers.get("Last-Modified") or entry.last_modified
+            self.revalidated += 1
+            self.save()
+        return entry
+
+    def ttl_for(self, path: str, data: dict) -> float | None:
+        m = _SEASON_RE.match(path)
+        if not m:
+            return LIVE_TTL
+        season, round_ = int(m.group(1)), m.group(2)
+        if season < datetime.now(timezone.utc).year:
+            return None
+        if round_ is None:
+            return DEFAULT_TTL
+        if not _has_payload(data):
+            return LIVE_TTL  # round not run yet
+        race_date = self.race_dates.get(f"{season}/{round_}")
+        if race_date:
+            settled = datetime.fromisoformat(race_date).replace(tzinfo=timezone.utc).timestamp() + SETTLE_DAYS * 86400
+            if time.time() >= settled:
+                return None
+        return ROUND_TTL
+
+    def usable_stale(self, entry: CacheEntry) -> bool:
+        return entry.expires_at is None or entry.age_hours(time.time()) <= MAX_STALE_HOURS
+
+    def summary(self) -> str:
+        return f"{self.hits} cache hits, {self.revalidated} revalidated, {self.stale} served stale"
+
+
+_cache: ResponseCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_cache() -> ResponseCache:
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ResponseCache()
+        return _cache
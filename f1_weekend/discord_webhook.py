@@ -1,21 +1,234 @@
 import json
+import mimetypes
+import queue
+import random
+import threading
+import time
+from concurrent.futures import Future
+
 import requests
 
 
-def send_webhook(webhook_url: str, content: str, file_bytes: bytes | None = None, filename: str | None = None):
-    if not webhook_url:
-        raise RuntimeError("Missing webhook url")
+DEFAULT_TIMEOUT = 60
+MAX_ATTEMPTS = 5
+
+
+class _Bucket:
+    # Rate-limit state Discord reported for one webhook
+    def __init__(self):
+        self.remaining: int | None = None
+        self.reset_at = 0.0  # time.monotonic() when the bucket refills
+
+
+# Paced, retrying Discord webhook sender shared by the FIA scraper and the weekend poster.
+# Each webhook gets its own FIFO queue and worker thread, so posts to one webhook keep their
+# order while different webhooks don't hold each other up. Before a send the worker waits out
+# an exhausted bucket (X-RateLimit-Remaining / X-RateLimit-Reset-After); 429s are retried
+# after the server-provided delay, 5xx and connection errors after a jittered backoff.
+class WebhookDelivery:
+    def __init__(self, session: requests.Session | None = None, max_attempts: int = MAX_ATTEMPTS):
+        self.session = session or requests.Session()
+        self.max_attempts = max_attempts
+        self._lock = threading.Lock()
+        self._queues: dict[str, queue.Queue] = {}
+        self._buckets: dict[str, _Bucket] = {}
+        self._pending = 0
+        self.max_queue_depth = 0
+        self.sent = 0
+        self.failed = 0
+        self.retries = 0
+        self.rate_limit_waits = 0.0
+        self.latencies: list[float] = []
+
+    @property
+    def queue_depth(self) -> int:
+        return self._pending
+
+    def submit(self, webhook_url: str, **request_kwargs) -> Future:
+        # Queue a POST; the Future resolves to the final requests.Response.
+        fut: Future = Future()
+        with self._lock:
+            q = self._queues.get(webhook_url)
+            if q is None:
+                q = self._queues[webhook_url] = queue.Queue()
+                self._buckets[webhook_url] = _Bucket()
+                threading.Thread(target=self._worker, args=(webhook_url, q), daemon=True).start()
+            self._pending += 1
+            self.max_queue_depth = max(self.max_queue_depth, self._pending)
+        q.put((fut, request_kwargs, time.monotonic()))
+        return fut
+
+    def send(self, webhook_url: str, **request_kwargs) -> requests.Response:
+        return self.submit(webhook_url, **request_kwargs).result()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lat = list(self.latencies)
+            counts = (self.sent, self.failed, self.retries, self._pending, self.max_queue_depth,
+                      self.rate_limit_waits)
+        sent, failed, retries, pending, max_depth, waits = counts
+        return {
+            "sent": sent,
+            "failed": failed,
+            "retries": retries,
+            "queue_depth": pending,
+            "max_queue_depth": max_depth,
+            "rate_limit_wait_s": round(waits, 2),
+            "latency_avg_ms": round(1000 * sum(lat) / len(lat), 1) if lat else None,
+            "latency_max_ms": round(1000 * max(lat), 1) if lat else None,
+        }
+
+    def summary(self) -> str:
+        st = self.stats()
+        if not st["sent"] and not st["failed"]:
+            return "no Discord sends"
+        return (
+            f"{st['sent']} sent, {st['failed']} failed, {st['retries']} retries, "
+            f"max queue {st['max_queue_depth']}, rate-limit wait {st['rate_limit_wait_s']}s, "
+            f"latency avg {st['latency_avg_ms']} ms / max {st['latency_max_ms']} ms"
+        )
+
+    def _worker(self, webhook_url: str, q: queue.Queue) -> None:
+        while True:
+            fut, kwargs, queued_at = q.get()
+            try:
+                if fut.set_running_or_notify_cancel():
+                    # Counted before the Future resolves, so stats() after send() includes it
+                    try:
+                        r = self._deliver(webhook_url, kwargs)
+                    except BaseException as e:
+                        self._record(queued_at, ok=False)
+                        fut.set_exception(e)
+                    else:
+                        self._record(queued_at, ok=True)
+                        fut.set_result(r)
+            finally:
+                with self._lock:
+                    self._pending -= 1
+
+    def _record(self, queued_at: float, ok: bool) -> None:
+        # Counters are shared by every webhook's worker thread
+        with self._lock:
+            if ok:
+                self.sent += 1
+            else:
+                self.failed += 1
+            self.latencies.append(time.monotonic() - queued_at)
+
+    def _count_retry(self, rate_limit_wait: float = 0.0) -> None:
+        with self._lock:
+            self.retries += 1
+            self.rate_limit_waits += rate_limit_wait
+
+    def _wait_for_bucket(self, webhook_url: str) -> None:
+        bucket = self._buckets[webhook_url]
+        if bucket.remaining == 0:
+            delay = bucket.reset_at - time.monotonic()
+            if delay > 0:
+                print(f"⏳ Discord rate limit: waiting {delay:.1f}s (queue depth {self._pending})")
+                with self._lock:
+                    self.rate_limit_waits += delay
+                time.sleep(delay)
+
+    def _update_bucket(self, webhook_url: str, r: requests.Response) -> None:
+        bucket = self._buckets[webhook_url]
+        remaining = r.headers.get("X-RateLimit-Remaining")
+        reset_after = r.headers.get("X-RateLimit-Reset-After")
+        if remaining is not None:
+            bucket.remaining = int(remaining)
+        if reset_after is not None:
+            bucket.reset_at = time.monotonic() + float(reset_after)
+
+    def _deliver(self, webhook_url: str, kwargs: dict) -> requests.Response:
+        kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+        attempt = 0
+        while True:
+            attempt += 1
+            self._wait_for_bucket(webhook_url)
+            _rewind_files(kwargs.get("files"))
+            try:
+                r = self.session.post(webhook_url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt >= self.max_attempts:
+                    raise
+                delay = _backoff(attempt)
+                print(f"🔁 Discord send failed ({e}); retry {attempt}/{self.max_attempts - 1} in {delay:.1f}s")
+                self._count_retry()
+                time.sleep(delay)
+                continue
 
+            self._update_bucket(webhook_url, r)
+            if r.status_code == 429 or r.status_code >= 500:
+                if attempt >= self.max_attempts:
+                    r.raise_for_status()
+                delay = _retry_after(r) if r.status_code == 429 else (_retry_after(r) or _backoff(attempt))
+                print(f"🔁 Discord answered {r.status_code}; retry {attempt}/{self.max_attempts - 1} in {delay:.1f}s")
+                self._count_retry(delay if r.status_code == 429 else 0.0)
+                time.sleep(delay)
+                continue
+
+            r.raise_for_status()
+            return r
+
+
+def _backoff(attempt: int) -> float:
+    return min(30.0, 2 ** (attempt - 1)) * random.uniform(0.5, 1.5)
+
+
+def _retry_after(r: requests.Response) -> float | None:
+    # 429 bodies carry a precise float retry_after; the Retry-After header is whole seconds.
+    try:
+        body = r.json()
+        if isinstance(body, dict) and body.get("retry_after") is not None:
+            return float(body["retry_after"])
+    except ValueError:
+        pass
+    header = r.headers.get("Retry-After")
+    if header is not None:
+        try:
+            return float(header)
+        except ValueError:
+            return None
+    return 1.0 if r.status_code == 429 else None
+
+
+def _rewind_files(files) -> None:
+    # Re-sending multipart bodies: open file objects must be read again from the start.
+    for value in (files or {}).values():
+        fileobj = value[1] if isinstance(value, tuple) else value
+        if hasattr(fileobj, "seek"):
+            fileobj.seek(0)
+
+
+_delivery: WebhookDelivery | None = None
+_delivery_lock = threading.Lock()
+
+
+def get_delivery() -> WebhookDelivery:
+    # Process-wide delivery component (one set of buckets per process).
+    global _delivery
+    with _delivery_lock:
+        if _delivery is None:
+            _delivery = WebhookDelivery()
+        return _delivery
+
+
+def webhook_request(content: str, file_bytes: bytes | None = None, filename: str | None = None) -> dict:
+    # Keyword arguments for WebhookDelivery.send(): a text message, or one attachment with it.
     if file_bytes is None:
-        r = requests.post(webhook_url, json={"content": content})
-        r.raise_for_status()
-        return
+        return {"json": {"content": content}}
 
+    filename = filename or "image.png"
     files = {
-        "files[0]": (filename or "image.png", file_bytes, "image/png"),
+        "files[0]": (filename, file_bytes, mimetypes.guess_type(filename)[0] or "image/png"),
     }
     data = {
         "payload_json": json.dumps({"content": content}),
     }
-    r = requests.post(webhook_url, data=data, files=files)
-    r.raise_for_status()
+    return {"data": data, "files": files}
+
+
+def send_webhook(webhook_url: str, content: str, file_bytes: bytes | None = None, filename: str | None = None):
+    if not webhook_url:
+        raise RuntimeError("Missing webhook url")
+    get_delivery().send(webhook_url, **webhook_request(content, file_bytes, filename))
@@ -1,8 +1,18 @@
 import os
+import queue
+import threading
+import time
+
 import requests
+from requests.adapters import HTTPAdapter
+
+from .api_cache import get_cache
+from .tracing import span
 
 
 DEFAULT_TIMEOUT = 30
+# Serve everything from f1_api_cache.json, whatever its age, without touching the network
+OFFLINE = os.getenv("F1_API_OFFLINE", "false").lower() == "true"
 
 # Prefer Jolpica (Ergast-compatible). Fall back to legacy Ergast if needed.
 BASE_URLS = [
@@ -10,21 +20,132 @@ BASE_URLS = [
     "https://ergast.com/mrd",
 ]
 
-
-def _get_json(path: str) -> dict:
+# Hedging: if a base hasn't answered after this long, the next one is raced against it
+# (immediately if it fails outright). The first good answer wins.
+HEDGE_SECONDS = float(os.getenv("F1_API_HEDGE_SECONDS", "2"))
+# Circuit breaker: after BREAKER_FAILURES failed or beaten calls in a row a base is skipped
+# for BREAKER_COOLDOWN seconds, then given one trial call. Kept in f1_api_cache.json.
+BREAKER_FAILURES = 2
+BREAKER_COOLDOWN = 30 * 60
+
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+
+
+def _http() -> requests.Session:
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=len(BASE_URLS), pool_maxsize=8)
+            _session.mount("https://", adapter)
+            _session.mount("http://", adapter)
+        return _session
+
+
+def _ordered_bases() -> list[str]:
+    # Bases with a closed (or cooled-down) breaker in preference order; if every breaker
+    # is open, try them all anyway rather than fail without asking.
+    health = get_cache().health
+    now = time.time()
+    usable = [b for b in BASE_URLS if (health.get(b) or {}).get("open_until", 0) <= now]
+    return usable or list(BASE_URLS)
+
+
+def _record(base: str, ok: bool, reason: str = "") -> None:
+    cache = get_cache()
+    with cache.lock:
+        h = cache.health.setdefault(base, {"failures": 0, "open_until": 0})
+        if ok:
+            h["failures"], h["open_until"] = 0, 0
+            return
+        h["failures"] += 1
+        if h["failures"] >= BREAKER_FAILURES:
+            h["open_until"] = time.time() + BREAKER_COOLDOWN
+            print(f"⚡ F1 API circuit open for {base} ({reason}); skipping it for {BREAKER_COOLDOWN // 60} min")
+        cache.save()
+
+
+def _fetch(base: str, path: str, headers: dict | None):
+    url = base.rstrip("/") + "/" + path.lstrip("/")
+    r = _http().get(url, headers=headers, timeout=DEFAULT_TIMEOUT)
+    if r.status_code == 304:
+        return r, None
+    r.raise_for_status()
+    return r, r.json()
+
+
+def _race(path: str, headers: dict | None):
+    # Returns (response, json or None on 304) from the first base to answer successfully.
+    bases = _ordered_bases()
+    results: queue.Queue = queue.Queue()
+    pending: set[str] = set()
     last_err = None
-    for base in BASE_URLS:
-        url = base.rstrip("/") + "/" + path.lstrip("/")
+
+    def start(base: str) -> None:
+        def run():
+            try:
+                results.put((base, _fetch(base, path, headers), None))
+            except Exception as e:
+                results.put((base, None, e))
+        pending.add(base)
+        # Daemon threads: a hung loser must not keep the process alive for its full timeout
+        threading.Thread(target=run, daemon=True).start()
+
+    start(bases.pop(0))
+    while pending:
         try:
-            r = requests.get(url, timeout=DEFAULT_TIMEOUT)
-            r.raise_for_status()
-            return r.json()
-        except Exception as e:
-            last_err = e
+            base, result, err = results.get(timeout=HEDGE_SECONDS if bases else None)
+        except queue.Empty:
+            start(bases.pop(0))
             continue
+        pending.discard(base)
+        if err is None:
+            _record(base, True)
+            for slow in pending:
+                _record(slow, False, f"slower than {base}")
+            return result
+        _record(base, False, str(err))
+        last_err = err
+        if bases:
+            start(bases.pop(0))
     raise RuntimeError(f"F1 API request failed for {path}: {last_err}")
 
 
+def _get_json(path: str) -> dict:
+    with span("f1_api.get", path=path) as attrs:
+        cache = get_cache()
+        entry = cache.get(path)
+        now = time.time()
+        if entry and (OFFLINE or entry.is_fresh(now)):
+            with cache.lock:  # snapshot fetches run on worker threads
+                cache.hits += 1
+            attrs["source"] = "cache"
+            return entry.data
+        if OFFLINE:
+            raise RuntimeError(f"F1 API offline mode: nothing cached for {path}")
+
+        try:
+            r, data = _race(path, entry.validators() if entry else None)
+        except RuntimeError as e:
+            # Both APIs down: fall back to what we had, if it is not too old to trust
+            if entry and cache.usable_stale(entry):
+                print(f"⚠️ F1 API unreachable ({e}); using cached {path} from {entry.age_hours(now):.1f} h ago")
+                with cache.lock:
+                    cache.stale += 1
+                attrs["source"] = "stale"
+                return entry.data
+            raise
+        attrs["source"] = "network"
+        if data is None:
+            if entry:
+                attrs["source"] = "revalidated"
+                return cache.refresh(path, r.headers).data
+            raise RuntimeError(f"F1 API answered 304 for uncached {path}")
+        cache.store(path, data, r.headers)
+        return data
+
+
 def _race0(path: str) -> dict:
     data = _get_json(path)
     races = (((data.get("MRData") or {}).get("RaceTable") or {}).get("Races") or [])
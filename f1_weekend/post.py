@@ -1,22 +1,36 @@
 from __future__ import annotations
 
+import asyncio
 import os
 import random
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
+from functools import partial
 
-from . import f1_api
-from .discord_webhook import send_webhook
-from .render import render_weekend_card
-from .state import load_state, save_state
-from .weather import get_hourly_forecast
+from .api_cache import get_cache
+from .discord_webhook import get_delivery, webhook_request
+from .render import CARD_EXT, render_weekend_card
+from .snapshot import NEEDS, Race, SeasonSnapshot
+from .state import load_state
+from .subscribers import DEFAULT, Subscriber, fan_out, load_subscribers
+from .tracing import get_tracer, span
 
 
 WEBHOOK = os.getenv("DISCORD_F1_WEEKEND_WEBHOOK_URL")
+# sync: fetch, then render and send each post in turn
+# async: fetch parts concurrently, render cards in a thread pool as their data arrives,
+#        send in the same order as sync
+ENGINE = os.getenv("F1_WEEKEND_ENGINE", "sync").lower()
+# Pillow's drawing holds the GIL, so a second thread mostly delays the card the next send needs
+RENDER_WORKERS = int(os.getenv("F1_WEEKEND_RENDER_WORKERS", "1"))
 
 
-def _utc_dt(date_str: str, time_str: str | None) -> datetime:
-    t = (time_str or "00:00:00Z").replace("Z", "+00:00")
-    return datetime.fromisoformat(f"{date_str}T{t}")
+@dataclass
+class Post:
+    content: str
+    card: dict | None = None  # render_weekend_card() arguments
+    filename: str | None = None  # the extension follows F1_CARD_FORMAT
 
 
 def _within_window(now: datetime, race_dt: datetime) -> bool:
@@ -24,34 +38,115 @@ def _within_window(now: datetime, race_dt: datetime) -> bool:
     return (race_dt - timedelta(days=6)) <= now <= (race_dt + timedelta(days=1))
 
 
-def _driver_name(drv: dict) -> str:
-    return f"{drv.get('givenName','')} {drv.get('familyName','')}".strip()
+def _allow_dupes() -> bool:
+    return os.getenv("F1_WEEKEND_ALLOW_DUPES", "false").lower() == "true"
 
 
-def _post_once(st, key: str, fn):
-    if key in st.posted and os.getenv("F1_WEEKEND_ALLOW_DUPES", "false").lower() != "true":
-        print(f"Already posted {key}; skipping")
-        return
-    fn()
-    st.posted.add(key)
-    save_state(st)
-
+def _dest_key(key: str, sub: Subscriber) -> str:
+    # The default webhook keeps the plain key, so state from before subscribers still counts
+    return key if sub.name == DEFAULT else f"{key}@{sub.name}"
 
-def _next_session_card(race: dict, now: datetime) -> tuple[str, list[str]] | None:
-    sessions: list[tuple[str, datetime]] = []
 
-    def add(label: str, node_key: str):
-        if race.get(node_key):
-            n = race[node_key]
-            sessions.append((label, _utc_dt(n.get("date"), n.get("time"))))
+def _already_posted(st, key: str, targets: list[Subscriber]) -> bool:
+    return not _allow_dupes() and all(st.is_posted(_dest_key(key, s)) for s in targets)
 
-    add("FP1", "FirstPractice")
-    add("FP2", "SecondPractice")
-    add("FP3", "ThirdPractice")
-    add("Qualifying", "Qualifying")
-    add("Sprint", "Sprint")
 
-    sessions.append(("Race", _utc_dt(race.get("date"), race.get("time"))))
+def _post_once(st, key: str, targets: list[Subscriber], fn):
+    # Each destination's key is claimed before sending, so an overlapping run skips it
+    # rather than posting it twice; a destination whose send fails gets its claim back for
+    # the next run. fn(subscribers) sends to the claimed ones and returns their errors.
+    claimed = []
+    for sub in targets:
+        k = _dest_key(key, sub)
+        was_posted = st.is_posted(k)
+        if st.claim(k, force=_allow_dupes()):
+            claimed.append((sub, k, was_posted))
+        else:
+            print(f"Already posted {k} (or another run is posting it); skipping")
+    if not claimed:
+        return
+    try:
+        with span("weekend.post", key=key, destinations=len(claimed)):
+            errors = fn([sub for sub, _, _ in claimed]) or {}
+    except BaseException:
+        for _, k, was_posted in claimed:
+            st.release(k, was_posted)
+        raise
+    failed = []
+    for sub, k, was_posted in claimed:
+        if errors.get(sub.name) is not None:
+            st.release(k, was_posted)
+            failed.append(f"{sub.name}: {errors[sub.name]}")
+        else:
+            st.mark_posted(k)
+    if failed:
+        raise RuntimeError(f"Posting {key} failed for " + "; ".join(failed))
+
+
+def _send_post(post: Post | None, image: bytes | None = None, targets: list[Subscriber] = ()) -> dict:
+    # Rendered once, then sent to every target concurrently
+    if post is None or not targets:
+        return {}
+    if post.card is not None and image is None:
+        image = render_weekend_card(**post.card)
+    filename = os.path.splitext(post.filename or "card")[0] + CARD_EXT if image is not None else None
+    request = webhook_request(post.content, image, filename)
+    return fan_out({sub: dict(request) for sub in targets})
+
+
+async def _post_all_async(st, snap: SeasonSnapshot, plan: list[str], todo: list[str], actions: dict, keys: dict,
+                          targets: dict) -> None:
+    loop = asyncio.get_running_loop()
+    fetches = {
+        part: asyncio.create_task(asyncio.to_thread(snap.fetch, [part]))
+        for part in dict.fromkeys(p for m in todo for p in NEEDS[m])
+    }
+
+    # Cards whose data is in wait here, earliest in the plan first, so the card the next
+    # send needs is drawn before the ones behind it
+    renders: asyncio.PriorityQueue = asyncio.PriorityQueue()
+
+    with ThreadPoolExecutor(max_workers=RENDER_WORKERS) as pool:
+        async def render_worker() -> None:
+            while True:
+                _, card, fut = await renders.get()
+                try:
+                    image = await loop.run_in_executor(pool, partial(render_weekend_card, **card))
+                except Exception as e:
+                    if not fut.done():
+                        fut.set_exception(e)
+                    continue
+                if not fut.done():
+                    fut.set_result(image)
+
+        async def prepare(mode: str) -> tuple[Post | None, bytes | None]:
+            await asyncio.gather(*(fetches[p] for p in NEEDS[mode]))
+            post = actions[mode]()
+            if post is None or post.card is None:
+                return post, None
+            fut = loop.create_future()
+            renders.put_nowait((plan.index(mode), post.card, fut))
+            return post, await fut
+
+        workers = [asyncio.create_task(render_worker()) for _ in range(RENDER_WORKERS)]
+        prepared = {m: asyncio.create_task(prepare(m)) for m in todo}
+        try:
+            # Sends (and de-dup bookkeeping) stay strictly in plan order; a failed post
+            # stops the ones after it, as in the sync engine.
+            for m in plan:
+                if m not in prepared:
+                    continue  # no targets, or already posted everywhere
+                post, image = await prepared[m]
+                await asyncio.to_thread(_post_once, st, keys[m], targets[m], partial(_send_post, post, image))
+        finally:
+            for task in [*prepared.values(), *workers]:
+                task.cancel()
+            await asyncio.gather(*prepared.values(), *workers, return_exceptions=True)
+
+
+def _next_session_card(race: Race, now: datetime) -> tuple[str, list[str]] | None:
+    sessions = [(s.label, s.start) for s in race.sessions]
+    sessions.append(("Race", race.start))
 
     sessions.sort(key=lambda x: x[1])
     for label, dt in sessions:
@@ -70,19 +165,24 @@ def _next_session_card(race: dict, now: datetime) -> tuple[str, list[str]] | Non
 
 def post_weekend_update(mode: str) -> None:
     st = load_state()
+    try:
+        _post_weekend_update(st, mode)
+    finally:
+        st.close()
+
 
+def _post_weekend_update(st, mode: str) -> None:
     now = datetime.now(timezone.utc)
     force = os.getenv("F1_WEEKEND_FORCE", "false").lower() == "true"
 
-    next_race = f1_api.get_next_race()
-    season = next_race.get("season")
-    round_ = next_race.get("round")
-    race_name = next_race.get("raceName")
-    circuit = (next_race.get("Circuit") or {})
-    circuit_name = circuit.get("circuitName")
-    loc = circuit.get("Location") or {}
+    snap = SeasonSnapshot.for_next_race()
+    next_race = snap.next_race
+    season = next_race.season
+    round_ = next_race.round
+    race_name = next_race.name
+    circuit_name = next_race.circuit_name
 
-    race_dt = _utc_dt(next_race.get("date"), next_race.get("time"))
+    race_dt = next_race.start
 
     if not force and not _within_window(now, race_dt):
         print("Not in race weekend window; skipping.")
@@ -94,98 +194,83 @@ def post_weekend_update(mode: str) -> None:
         if circuit_name:
             lines.append(f"Circuit: {circuit_name}")
         lines.append(f"Race (UTC): {race_dt.strftime('%a %d %b %H:%M')}")
-        if next_race.get("Qualifying"):
-            q = next_race["Qualifying"]
-            qdt = _utc_dt(q.get("date"), q.get("time"))
-            lines.append(f"Qualifying (UTC): {qdt.strftime('%a %d %b %H:%M')}")
-        if next_race.get("Sprint"):
-            s = next_race["Sprint"]
-            sdt = _utc_dt(s.get("date"), s.get("time"))
-            lines.append(f"Sprint (UTC): {sdt.strftime('%a %d %b %H:%M')}")
+        q = next_race.session("Qualifying")
+        if q:
+            lines.append(f"Qualifying (UTC): {q.start.strftime('%a %d %b %H:%M')}")
+        s = next_race.session("Sprint")
+        if s:
+            lines.append(f"Sprint (UTC): {s.start.strftime('%a %d %b %H:%M')}")
 
         content = f"**F1 Weekend — {race_name}**\nSchedule in UTC (ask @Venbot if you want it in your timezone)."
-        img = render_weekend_card(
+        return Post(content, dict(
             title=f"F1 Weekend: {race_name}",
             lines=lines,
-            footer=f"Source: Ergast-compatible API · {now.strftime('%Y-%m-%d %H:%M UTC')}",
-        )
-        send_webhook(WEBHOOK, content=content, file_bytes=img, filename="schedule.png")
+            footer="Source: Ergast-compatible API",
+        ), "schedule.png")
 
     def post_standings():
-        ds = f1_api.get_driver_standings("current")[:10]
-        cs = f1_api.get_constructor_standings("current")[:10]
+        ds = snap.driver_standings[:10]
+        cs = snap.constructor_standings[:10]
         lines: list[str] = ["Top 10 Drivers:"]
         for d in ds:
-            drv = d.get("Driver") or {}
-            lines.append(f"{d.get('position')}. {_driver_name(drv)} — {d.get('points')} pts")
+            lines.append(f"{d.position}.\t{d.name}\t{d.points_text} pts")
         lines.append("")
         lines.append("Top 10 Constructors:")
         for c in cs:
-            con = c.get("Constructor") or {}
-            lines.append(f"{c.get('position')}. {con.get('name')} — {c.get('points')} pts")
+            lines.append(f"{c.position}.\t{c.name}\t{c.points_text} pts")
 
         content = "**F1 Standings (current)**"
-        img = render_weekend_card(
+        return Post(content, dict(
             title="F1 Standings",
             lines=lines,
-            footer=f"Source: Ergast-compatible API · {now.strftime('%Y-%m-%d %H:%M UTC')}",
-        )
-        send_webhook(WEBHOOK, content=content, file_bytes=img, filename="standings.png")
+            footer="Source: Ergast-compatible API",
+            columns=2,
+        ), "standings.png")
 
     def post_results():
-        results = f1_api.get_race_results(season, round_)
+        results = snap.results
         if not results:
             print("No race results available yet; skipping")
             return
         lines = [f"Results: {race_name}"]
         for r in results[:10]:
-            drv = r.get("Driver") or {}
-            cons = (r.get("Constructor") or {}).get("name")
-            lines.append(f"{r.get('position')}. {_driver_name(drv)} ({cons})")
+            lines.append(f"{r.position}.\t{r.driver}\t{r.constructor}")
         content = f"**Race result — {race_name}**"
-        img = render_weekend_card(
+        return Post(content, dict(
             title=f"Race result: {race_name}",
             lines=lines,
-            footer=f"Source: Ergast-compatible API · {now.strftime('%Y-%m-%d %H:%M UTC')}",
-        )
-        send_webhook(WEBHOOK, content=content, file_bytes=img, filename="race_result.png")
+            footer="Source: Ergast-compatible API",
+        ), "race_result.png")
 
     def post_quali():
-        q = f1_api.get_qualifying_results(season, round_)
+        q = snap.qualifying
         if not q:
             print("No qualifying results available yet; skipping")
             return
         lines = [f"Qualifying: {race_name}"]
         for r in q[:10]:
-            drv = r.get("Driver") or {}
-            cons = (r.get("Constructor") or {}).get("name")
-            q3 = r.get("Q3") or r.get("Q2") or r.get("Q1") or ""
-            lines.append(f"{r.get('position')}. {_driver_name(drv)} ({cons}) {q3}")
+            lines.append(f"{r.position}.\t{r.driver}\t{r.constructor}\t{r.lap}")
         content = f"**Qualifying result — {race_name}**"
-        img = render_weekend_card(
+        return Post(content, dict(
             title=f"Qualifying: {race_name}",
             lines=lines,
             footer="Note: penalties/grid changes may not be reflected · Ergast-compatible API",
-        )
-        send_webhook(WEBHOOK, content=content, file_bytes=img, filename="qualifying.png")
+        ), "qualifying.png")
 
     def post_sprint():
-        s = f1_api.get_sprint_results(season, round_)
+        s = snap.sprint
         if not s:
             print("No sprint results available yet; skipping")
             return
         lines = [f"Sprint: {race_name}"]
         for r in s[:10]:
-            drv = r.get("Driver") or {}
-            cons = (r.get("Constructor") or {}).get("name")
-            lines.append(f"{r.get('position')}. {_driver_name(drv)} ({cons})")
+            lines.append(f"{r.position}.\t{r.driver}\t{r.constructor}")
         content = f"**Sprint result — {race_name}**"
-        img = render_weekend_card(
+        return Post(content, dict(
             title=f"Sprint: {race_name}",
             lines=lines,
-            footer=f"Source: Ergast-compatible API · {now.strftime('%Y-%m-%d %H:%M UTC')}",
-        )
-        send_webhook(WEBHOOK, content=content, file_bytes=img, filename="sprint.png")
+            footer="Source: Ergast-compatible API",
+        ), "sprint.png")
 
     def post_countdown():
         nxt = _next_session_card(next_race, now)
@@ -194,17 +279,16 @@ def post_weekend_update(mode: str) -> None:
             return
         _, lines = nxt
         content = f"**F1 weekend countdown — {race_name}**"
-        img = render_weekend_card(
+        return Post(content, dict(
             title=f"Next session: {race_name}",
             lines=lines,
-            footer=f"UTC · generated {now.strftime('%Y-%m-%d %H:%M')}",
-        )
-        send_webhook(WEBHOOK, content=content, file_bytes=img, filename="countdown.png")
+            footer="UTC",
+        ), "countdown.png")
 
     def post_track_facts():
         # Minimal track facts without a big dataset.
-        country = loc.get("country")
-        locality = loc.get("locality")
+        country = next_race.country
+        locality = next_race.locality
         lines = [
             f"Race: {race_name}",
         ]
@@ -214,100 +298,88 @@ def post_weekend_update(mode: str) -> None:
             lines.append(f"Location: {locality or ''} {('· ' + country) if country else ''}".strip())
         lines.append(f"Race (UTC): {race_dt.strftime('%a %d %b %H:%M')}")
         content = f"**Track card — {race_name}**"
-        img = render_weekend_card(
+        return Post(content, dict(
             title=f"Track card: {race_name}",
             lines=lines,
             footer="Source: Ergast-compatible API",
-        )
-        send_webhook(WEBHOOK, content=content, file_bytes=img, filename="track.png")
+        ), "track.png")
 
     def post_weather():
-        try:
-            lat = float(loc.get("lat"))
-            lon = float(loc.get("long"))
-        except Exception:
+        fc = snap.forecast
+        if fc is None:
             print("No circuit lat/long available; skipping weather")
             return
-    
-        data = get_hourly_forecast(lat, lon)
-        hourly = data.get("hourly") or {}
-    
-        times = hourly.get("time") or []
-        temps = hourly.get("temperature_2m") or []
-        pops = hourly.get("precipitation_probability") or []
-        winds = hourly.get("wind_speed_10m") or []
-        dew_points = hourly.get("dew_point_2m") or []
-        visibility = hourly.get("visibility") or []
-        humidity = hourly.get("relative_humidity_2m") or []
-    
-        # Find forecast hour closest to race start
+
+        # Forecast hour containing the race start
         target = race_dt.replace(minute=0, second=0, microsecond=0)
-        idx = None
-    
-        for i, tstamp in enumerate(times):
-            if tstamp.startswith(target.strftime("%Y-%m-%dT%H")):
-                idx = i
-                break
-    
-        if idx is None:
+        race_hour = fc.at(target)
+        if race_hour is None:
             print("No matching forecast hour for race start; skipping weather")
             return
-    
-        t = temps[idx] if idx < len(temps) else None
-        p = pops[idx] if idx < len(pops) else None
-        w = winds[idx] if idx < len(winds) else None
-        d = dew_points[idx] if idx < len(dew_points) else None
-        v = visibility[idx] if idx < len(visibility) else None
-        h = humidity[idx] if idx < len(humidity) else None
-    
+
+        t = race_hour["temperature_2m"]
+        p = race_hour["precipitation_probability"]
+        w = race_hour["wind_speed_10m"]
+        d = race_hour["dew_point_2m"]
+        v = race_hour["visibility"]
+        h = race_hour["relative_humidity_2m"]
+
         visibility_km = round(v / 1000, 1) if v is not None else None
-    
+
         lines = [
             f"Race: {race_name}",
             f"Forecast (race hour, UTC): {target.strftime('%a %H:%M')}",
             f"Temp: {t}°C" if t is not None else "Temp: n/a",
             f"Feels / dew point: {d}°C" if d is not None else "Feels / dew point: n/a",
-            f"Humidity: {h}%" if h is not None else "Humidity: n/a",
-            f"Rain chance: {p}%" if p is not None else "Rain chance: n/a",
+            f"Humidity: {h:.0f}%" if h is not None else "Humidity: n/a",
+            f"Rain chance: {p:.0f}%" if p is not None else "Rain chance: n/a",
             f"Wind: {w} km/h" if w is not None else "Wind: n/a",
             f"Visibility: {visibility_km} km" if visibility_km is not None else "Visibility: n/a",
         ]
-    
+
+        # Every session of the weekend the forecast reaches: temperature range, rain peak and trend
+        sessions = [(s.label, s.start) for s in next_race.sessions] + [("Race", race_dt)]
+        windows = fc.session_windows(sorted(sessions, key=lambda x: x[1]))
+        if windows:
+            lines += ["", "Sessions (UTC):"]
+            for win in windows:
+                temp = f"{win.temp_min:.0f}–{win.temp_max:.0f}°C" if win.temp_min is not None else "n/a"
+                if win.temp_min is not None and round(win.temp_min) == round(win.temp_max):
+                    temp = f"{win.temp_min:.0f}°C"
+                rain = f"rain {win.rain_peak:.0f}%" if win.rain_peak is not None else "rain n/a"
+                if win.rain_trend != "steady":
+                    rain += f" ({win.rain_trend})"
+                lines.append(f"{win.label}\t{win.start.strftime('%a %H:%M')}\t{temp}\t{rain}")
+
         content = f"**Weather snapshot — {race_name}** (best effort)"
-    
-        img = render_weekend_card(
+
+        return Post(content, dict(
             title=f"Weather: {race_name}",
             lines=lines,
             footer="Source: Open-Meteo (UTC) · best effort",
-        )
-    
-        send_webhook(WEBHOOK, content=content, file_bytes=img, filename="weather.png")
+        ), "weather.png")
 
     def post_recap_last_race():
-        last_race = f1_api.get_last_race()
-        last_name = last_race.get("raceName")
-        last_results = f1_api.get_last_race_results()
+        last_name = snap.last_race.name
+        last_results = snap.last_results
         if not last_results:
             print("No last race results available; skipping recap")
             return
         lines = [f"Last race: {last_name}"]
         for r in last_results[:5]:
-            drv = r.get("Driver") or {}
-            cons = (r.get("Constructor") or {}).get("name")
-            lines.append(f"{r.get('position')}. {_driver_name(drv)} ({cons})")
+            lines.append(f"{r.position}.\t{r.driver}\t{r.constructor}")
         content = f"**Last race recap — {last_name}**"
-        img = render_weekend_card(
+        return Post(content, dict(
             title=f"Recap: {last_name}",
             lines=lines,
             footer="Source: Ergast-compatible API",
-        )
-        send_webhook(WEBHOOK, content=content, file_bytes=img, filename="recap.png")
+        ), "recap.png")
 
     def post_champ_delta():
         # Compare current standings vs previous round (if available)
-        prev_round = str(max(1, int(round_) - 1))
-        cur = {(_driver_name((d.get('Driver') or {}))): float(d.get('points', 0)) for d in f1_api.get_driver_standings('current')}
-        prev = {(_driver_name((d.get('Driver') or {}))): float(d.get('points', 0)) for d in f1_api.get_driver_standings(season, prev_round)}
+        prev_round = snap.prev_round
+        cur = {d.name: d.points for d in snap.driver_standings}
+        prev = {d.name: d.points for d in snap.prev_driver_standings}
         if not prev:
             print("No previous-round standings available; skipping delta")
             return
@@ -320,77 +392,98 @@ def post_weekend_update(mode: str) -> None:
         lines = [f"Championship delta (vs R{prev_round})"]
         for name, d in deltas[:5]:
             sign = "+" if d >= 0 else ""
-            lines.append(f"{name}: {sign}{int(d)} pts")
+            lines.append(f"{name}\t{sign}{int(d)} pts")
         content = "**Championship delta** (best effort)"
-        img = render_weekend_card(
+        return Post(content, dict(
             title="Champ delta",
             lines=lines,
             footer="Source: Ergast-compatible API",
-        )
-        send_webhook(WEBHOOK, content=content, file_bytes=img, filename="delta.png")
+        ), "delta.png")
 
     def post_head_to_head():
         # Fun prompt only
-        ds = f1_api.get_driver_standings("current")[:20]
+        ds = snap.driver_standings[:20]
         if len(ds) < 2:
             return
         a, b = random.sample(ds, 2)
-        an = _driver_name((a.get("Driver") or {}))
-        bn = _driver_name((b.get("Driver") or {}))
+        an = a.name
+        bn = b.name
         content = f"**Head-to-head**\nWho finishes higher this weekend: **{an}** vs **{bn}**?"
-        send_webhook(WEBHOOK, content=content)
+        return Post(content)
+
+    actions = {
+        "schedule": post_schedule,
+        "standings": post_standings,
+        "results": post_results,
+        "qualifying": post_quali,
+        "sprint": post_sprint,
+        "countdown": post_countdown,
+        "track": post_track_facts,
+        "weather": post_weather,
+        "recap": post_recap_last_race,
+        "delta": post_champ_delta,
+        "h2h": post_head_to_head,
+    }
 
     # Modes
     if mode != "auto":
-        key = f"{mode}:{season}:{round_}"
-        actions = {
-            "schedule": post_schedule,
-            "standings": post_standings,
-            "results": post_results,
-            "qualifying": post_quali,
-            "sprint": post_sprint,
-            "countdown": post_countdown,
-            "track": post_track_facts,
-            "weather": post_weather,
-            "recap": post_recap_last_race,
-            "delta": post_champ_delta,
-            "h2h": post_head_to_head,
-        }
         if mode not in actions:
             raise ValueError("Unknown mode")
-        _post_once(st, key, actions[mode])
+        plan = [mode]
+    else:
+        # AUTO: post a bundle across the weekend, de-duped.
+        weekday = now.weekday()  # Mon=0
+        plan = []
+
+        # Thursday/Friday: schedule + track + recap
+        if weekday in (3, 4):
+            plan += ["schedule", "track", "recap"]
+
+        # Countdown: only post on the Monday of the race weekend window (UTC).
+        # (This keeps it low-noise while still providing a heads-up at the start of the week.)
+        if weekday == 0:
+            plan.append("countdown")
+
+        # Saturday: qualifying + sprint if available
+        if weekday == 5:
+            plan += ["qualifying", "sprint"]
+
+        # Sunday: weather snapshot + race results + delta + standings
+        if weekday == 6:
+            plan += ["weather", "results", "delta", "standings"]
+
+        # Fun: head-to-head once per weekend
+        plan.append("h2h")
+
+    subscribers = load_subscribers(WEBHOOK, "weekend")
+    if not subscribers:
+        raise RuntimeError("Missing webhook url: set DISCORD_F1_WEEKEND_WEBHOOK_URL or DISCORD_SUBSCRIBERS")
+    keys = {m: f"{m}:{season}:{round_}" for m in plan}
+    targets = {m: [sub for sub in subscribers if sub.wants_card(m)] for m in plan}
+    todo = [m for m in plan if targets[m] and not _already_posted(st, keys[m], targets[m])]
+    if ENGINE == "async":
+        asyncio.run(_post_all_async(st, snap, plan, todo, actions, keys, targets))
         return
 
-    # AUTO: post a bundle across the weekend, de-duped.
-    # Thursday/Friday: schedule + track + recap
-    weekday = now.weekday()  # Mon=0
-
-    if weekday in (3, 4):
-        _post_once(st, f"schedule:{season}:{round_}", post_schedule)
-        _post_once(st, f"track:{season}:{round_}", post_track_facts)
-        _post_once(st, f"recap:{season}:{round_}", post_recap_last_race)
-
-    # Countdown: only post on the Monday of the race weekend window (UTC).
-    # (This keeps it low-noise while still providing a heads-up at the start of the week.)
-    if weekday == 0:
-        _post_once(st, f"countdown:{season}:{round_}", post_countdown)
+    # One concurrent round of API calls for every post that still has to go out
+    snap.fetch(part for m in todo for part in NEEDS[m])
 
-    # Saturday: qualifying + sprint if available
-    if weekday == 5:
-        _post_once(st, f"qualifying:{season}:{round_}", post_quali)
-        _post_once(st, f"sprint:{season}:{round_}", post_sprint)
+    for m in plan:
+        _post_once(st, keys[m], targets[m], lambda subs, m=m: _send_post(actions[m](), None, subs))
 
-    # Sunday: weather snapshot + race results + delta + standings
-    if weekday == 6:
-        _post_once(st, f"weather:{season}:{round_}", post_weather)
-        _post_once(st, f"results:{season}:{round_}", post_results)
-        _post_once(st, f"delta:{season}:{round_}", post_champ_delta)
-        _post_once(st, f"standings:{season}:{round_}", post_standings)
 
-    # Fun: head-to-head once per weekend
-    _post_once(st, f"h2h:{season}:{round_}", post_head_to_head)
+def main() -> None:
+    mode = os.getenv("F1_WEEKEND_MODE", "auto")
+    get_tracer().pipeline = "weekend"
+    try:
+        with span("weekend.run", mode=mode):
+            post_weekend_update(mode)
+    finally:
+        print(f"F1 API: {get_cache().summary()}")
+        print(f"Discord delivery: {get_delivery().summary()}")
+        print(f"Timings: {get_tracer().summary()}")
+        get_tracer().export()
 
 
 if __name__ == "__main__":
-    mode = os.getenv("F1_WEEKEND_MODE", "auto")
-    post_weekend_update(mode)
+    main()
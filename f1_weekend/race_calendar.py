@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from datetime import date, datetime, timedelta, timezone
+
+
+# Formula 1 calendar (race days). Stdlib only: the entry points check it before the scraper
+# and the poster import requests, PyMuPDF or Pillow, so most cron runs end in milliseconds.
+RACE_DATES = [
+    "2025-03-16", # Australian GP — Melbourne
+    "2026-03-08",  # Australian GP — Melbourne
+    "2026-03-15",  # Chinese GP — Shanghai
+    "2026-03-29",  # Japanese GP — Suzuka
+    "2026-04-12",  # Bahrain GP — Sakhir
+    "2026-04-19",  # Saudi Arabian GP — Jeddah
+    "2026-05-03",  # Miami GP — Miami
+    "2026-05-24",  # Canadian GP — Montreal
+    "2026-06-07",  # Monaco GP — Monaco
+    "2026-06-14",  # Spanish GP — Barcelona-Catalunya
+    "2026-06-28",  # Austrian GP — Spielberg
+    "2026-07-05",  # British GP — Silverstone
+    "2026-07-19",  # Belgian GP — Spa
+    "2026-07-26",  # Hungarian GP — Budapest
+    "2026-08-23",  # Dutch GP — Zandvoort
+    "2026-09-06",  # Italian GP — Monza
+    "2026-09-13",  # Spanish GP — Madrid
+    "2026-09-26",  # Azerbaijan GP — Baku
+    "2026-10-11",  # Singapore GP — Singapore
+    "2026-10-25",  # United States GP — Austin
+    "2026-11-01",  # Mexico City GP — Mexico City
+    "2026-11-08",  # São Paulo GP — Interlagos
+    "2026-11-21",  # Las Vegas GP — Las Vegas
+    "2026-11-29",  # Qatar GP — Lusail
+    "2026-12-06",  # Abu Dhabi GP — Yas Marina
+]
+
+# Parsed once, sorted, for a binary search per check
+RACE_DAYS = tuple(sorted(date.fromisoformat(d) for d in RACE_DATES))
+
+
+def near_race(today: date, before: int, after: int) -> bool:
+    # A race day falls in [today - after, today + before]
+    i = bisect_left(RACE_DAYS, today - timedelta(days=after))
+    return i < len(RACE_DAYS) and RACE_DAYS[i] <= today + timedelta(days=before)
+
+
+def covers(today: date) -> bool:
+    # False once the calendar has run out (next season not added yet)
+    return bool(RACE_DAYS) and today <= RACE_DAYS[-1] + timedelta(days=1)
+
+
+def is_race_weekend(today: date | None = None) -> bool:
+    # Thursday before a race through the Monday after
+    today = today or datetime.now(timezone.utc).date()
+    return near_race(today, before=3, after=1)
@@ -1,52 +1,313 @@
 from __future__ import annotations
 
+import hashlib
 import io
-from datetime import datetime
+import json
+import os
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
-try:
-    from PIL import Image, ImageDraw, ImageFont
-except Exception as e:  # pragma: no cover
-    raise RuntimeError(
-        "Pillow is required for graphics. Add 'Pillow' to requirements.txt"
-    ) from e
+from .tracing import span
 
+if TYPE_CHECKING:
+    from PIL import Image
 
-def _font(size: int):
-    # DejaVuSans is commonly available on ubuntu runners; fallback to default.
+
+WIDTH = 900
+PAD = 32
+BG = (14, 17, 22)
+FG = (235, 240, 246)
+ACCENT = (255, 60, 60)
+MUTED = (170, 180, 192)
+
+TITLE_SIZE = 40
+BODY_SIZE = 22
+SMALL_SIZE = 16
+LINE_GAP = 4  # between body lines
+BLOCK_GAP = 20  # after the title, before the footer
+CELL_GAP = 18  # between table cells
+GUTTER = 40  # between side-by-side columns
+
+# png: palette-quantised PNG (the cards use a handful of colours plus anti-aliasing)
+# webp: lossless WebP, a little smaller still on text-heavy cards
+CARD_FORMAT = os.getenv("F1_CARD_FORMAT", "png").lower()
+CARD_EXT = ".webp" if CARD_FORMAT == "webp" else ".png"
+PALETTE_COLORS = 64
+
+# Encoded cards by content hash: an in-process LRU in front of a small directory (cached in
+# Actions), so re-posts and F1_WEEKEND_ALLOW_DUPES runs reuse earlier renders.
+CARD_CACHE_DIR = os.getenv("F1_CARD_CACHE_DIR", "f1_card_cache")
+CARD_CACHE_SIZE = int(os.getenv("F1_CARD_CACHE_SIZE", "64"))
+# Bump when the card design changes so older cached PNGs are not reused
+RENDER_VERSION = 2
+
+_fonts = threading.local()
+
+
+def _pil():
+    # Pillow is imported on the first card, so runs that post nothing never load it
     try:
-        return ImageFont.truetype("DejaVuSans.ttf", size)
-    except Exception:
-        return ImageFont.load_default()
+        from PIL import Image, ImageDraw, ImageFont
+    except Exception as e:  # pragma: no cover
+        raise RuntimeError(
+            "Pillow is required for graphics. Add 'Pillow' to requirements.txt"
+        ) from e
+    return Image, ImageDraw, ImageFont
 
 
-def render_weekend_card(title: str, lines: list[str], footer: str) -> bytes:
-    width = 900
-    pad = 32
-    bg = (14, 17, 22)
-    fg = (235, 240, 246)
-    accent = (255, 60, 60)
+def _font(size: int):
+    # Loaded once per thread: FreeType faces must not be shared between render threads.
+    cache = _fonts.__dict__.setdefault("by_size", {})
+    if size not in cache:
+        _, _, ImageFont = _pil()
+        # DejaVuSans is commonly available on ubuntu runners; fallback to default.
+        try:
+            cache[size] = ImageFont.truetype("DejaVuSans.ttf", size)
+        except Exception:
+            cache[size] = ImageFont.load_default()
+    return cache[size]
 
-    font_title = _font(40)
-    font_body = _font(22)
-    font_small = _font(16)
 
-    # rough height
-    height = pad * 2 + 60 + (len(lines) * 30) + 50
-    img = Image.new("RGB", (width, height), bg)
-    draw = ImageDraw.Draw(img)
+@lru_cache(maxsize=16)
+def _background(height: int) -> Image.Image:
+    # Empty card of this height with the accent bar; copied, never drawn on.
+    Image, ImageDraw, _ = _pil()
+    img = Image.new("RGB", (WIDTH, height), BG)
+    ImageDraw.Draw(img).rectangle([0, 0, WIDTH, 8], fill=ACCENT)
+    return img
+
+
+def card_key(title: str, lines: list[str], footer: str, columns: int = 1) -> str:
+    raw = json.dumps([RENDER_VERSION, CARD_FORMAT, title, lines, footer, columns], ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class CardCache:
+    def __init__(self, directory: str | None = CARD_CACHE_DIR, size: int = CARD_CACHE_SIZE):
+        self.directory = directory
+        self.size = size
+        self._mem: OrderedDict[str, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}{CARD_EXT}")
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            png = self._mem.get(key)
+            if png is not None:
+                self._mem.move_to_end(key)
+                self.hits += 1
+                return png
+        if self.directory and os.path.exists(self._path(key)):
+            with open(self._path(key), "rb") as f:
+                png = f.read()
+            os.utime(self._path(key))  # mtime is the on-disk LRU order
+            self._remember(key, png)
+            with self._lock:
+                self.hits += 1
+            return png
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: str, png: bytes) -> None:
+        self._remember(key, png)
+        if not self.directory:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        tmp = self._path(key) + f".{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(png)
+        os.replace(tmp, self._path(key))
+        cards = [e for e in os.scandir(self.directory) if e.name.endswith((".png", ".webp"))]
+        if len(cards) > self.size:
+            cards.sort(key=lambda e: e.stat().st_mtime)
+            for e in cards[: len(cards) - self.size]:
+                try:
+                    os.remove(e.path)
+                except FileNotFoundError:
+                    pass
+
+    def _remember(self, key: str, png: bytes) -> None:
+        with self._lock:
+            self._mem[key] = png
+            self._mem.move_to_end(key)
+            while len(self._mem) > self.size:
+                self._mem.popitem(last=False)
+
+
+card_cache = CardCache()
+
 
-    draw.rectangle([0, 0, width, 8], fill=accent)
+def _text_width(font, text: str) -> int:
+    return font.getbbox(text)[2] if text else 0
 
-    y = pad
-    draw.text((pad, y), title, font=font_title, fill=fg)
-    y += 60
 
+def _line_height(font) -> int:
+    ascent, descent = font.getmetrics()
+    return ascent + descent
+
+
+def _fit(font, text: str, width: int) -> str:
+    # Truncate with an ellipsis to fit `width`
+    if _text_width(font, text) <= width:
+        return text
+    while text and _text_width(font, text + "…") > width:
+        text = text[:-1]
+    return text.rstrip() + "…"
+
+
+def wrap(font, text: str, width: int) -> list[str]:
+    # Greedy word wrap on measured widths; a single word wider than `width` is split.
+    out: list[str] = []
+    line = ""
+    for word in text.split(" "):
+        candidate = f"{line} {word}" if line else word
+        if _text_width(font, candidate) <= width:
+            line = candidate
+            continue
+        if line:
+            out.append(line)
+        while _text_width(font, word) > width:
+            cut = len(word)
+            while cut > 1 and _text_width(font, word[:cut]) > width:
+                cut -= 1
+            out.append(word[:cut])
+            word = word[cut:]
+        line = word
+    out.append(line)
+    return out
+
+
+# A laid-out run of text: (x, y, text, font, colour) relative to the block origin
+Op = tuple[int, int, str, object, tuple[int, int, int]]
+
+
+def _layout_lines(lines: list[str], font, width: int) -> tuple[list[Op], int]:
+    # Body text. Consecutive lines containing tabs form a table: cells are aligned across
+    # the rows, the last cell is right-aligned, and the widest other cell gives way if the
+    # table is too wide. Other lines wrap; an empty line is a half-height spacer.
+    ops: list[Op] = []
+    lh = _line_height(font)
+    y = 0
+    i = 0
+    while i < len(lines):
+        if "\t" in lines[i]:
+            j = i
+            while j < len(lines) and "\t" in lines[j]:
+                j += 1
+            rows = [line.split("\t") for line in lines[i:j]]
+            ncols = max(len(r) for r in rows)
+            rows = [r + [""] * (ncols - len(r)) for r in rows]
+            widths = [max(_text_width(font, r[c]) for r in rows) for c in range(ncols)]
+            overflow = sum(widths) + CELL_GAP * (ncols - 1) - width
+            if overflow > 0 and ncols > 1:
+                widest = max(range(ncols - 1), key=lambda c: widths[c])
+                widths[widest] = max(0, widths[widest] - overflow)
+            for r in rows:
+                x = 0
+                for c, cell in enumerate(r):
+                    cell = _fit(font, cell, widths[c])
+                    if c == ncols - 1 and ncols > 1:
+                        x = width - _text_width(font, cell)
+                    ops.append((x, y, cell, font, FG))
+                    x += widths[c] + CELL_GAP
+                y += lh + LINE_GAP
+            i = j
+            continue
+        if not lines[i]:
+            y += lh // 2
+        else:
+            for part in wrap(font, lines[i], width):
+                ops.append((0, y, part, font, FG))
+                y += lh + LINE_GAP
+        i += 1
+    return ops, max(0, y - LINE_GAP)
+
+
+def _sections(lines: list[str]) -> list[list[str]]:
+    out: list[list[str]] = [[]]
     for line in lines:
-        draw.text((pad, y), line, font=font_body, fill=fg)
-        y += 30
+        if line:
+            out[-1].append(line)
+        elif out[-1]:
+            out.append([])
+    return [sec for sec in out if sec]
 
-    draw.text((pad, height - pad - 18), footer, font=font_small, fill=(170, 180, 192))
 
+def layout_card(title: str, lines: list[str], footer: str, columns: int = 1) -> tuple[list[Op], int]:
+    # Every draw operation of the card in absolute coordinates, and the exact card height.
+    inner = WIDTH - 2 * PAD
+    font_title = _font(TITLE_SIZE)
+    font_body = _font(BODY_SIZE)
+    font_small = _font(SMALL_SIZE)
+    ops: list[Op] = []
+
+    y = PAD
+    for part in wrap(font_title, title, inner):
+        ops.append((PAD, y, part, font_title, FG))
+        y += _line_height(font_title)
+    y += BLOCK_GAP
+
+    sections = _sections(lines)
+    if columns > 1 and len(sections) > 1:
+        # Blank-line separated sections side by side, in order, split as evenly as possible
+        columns = min(columns, len(sections))
+        per_col = -(-len(sections) // columns)
+        col_width = (inner - GUTTER * (columns - 1)) // columns
+        body_height = 0
+        for c in range(columns):
+            col_lines: list[str] = []
+            for sec in sections[c * per_col:(c + 1) * per_col]:
+                col_lines += ([""] if col_lines else []) + sec
+            block, h = _layout_lines(col_lines, font_body, col_width)
+            x0 = PAD + c * (col_width + GUTTER)
+            ops += [(x0 + x, y + dy, t, f, fill) for x, dy, t, f, fill in block]
+            body_height = max(body_height, h)
+    else:
+        block, body_height = _layout_lines(lines, font_body, inner)
+        ops += [(PAD + x, y + dy, t, f, fill) for x, dy, t, f, fill in block]
+    y += body_height + BLOCK_GAP
+
+    for part in wrap(font_small, footer, inner):
+        ops.append((PAD, y, part, font_small, MUTED))
+        y += _line_height(font_small)
+    return ops, y + PAD
+
+
+def encode_card(img: Image.Image) -> bytes:
+    Image, _, _ = _pil()
     bio = io.BytesIO()
-    img.save(bio, format="PNG", optimize=True)
+    if CARD_FORMAT == "webp":
+        img.save(bio, format="WEBP", lossless=True, method=6)
+    else:
+        img.quantize(PALETTE_COLORS, method=Image.Quantize.FASTOCTREE).save(bio, format="PNG")
     return bio.getvalue()
+
+
+def draw_weekend_card(title: str, lines: list[str], footer: str, columns: int = 1) -> bytes:
+    ops, height = layout_card(title, lines, footer, columns)
+    _, ImageDraw, _ = _pil()
+    img = _background(height).copy()
+    draw = ImageDraw.Draw(img)
+    for x, y, text, font, fill in ops:
+        draw.text((x, y), text, font=font, fill=fill)
+    return encode_card(img)
+
+
+def render_weekend_card(title: str, lines: list[str], footer: str, columns: int = 1) -> bytes:
+    # Cards carry no generation time (Discord shows when each message was posted), so the
+    # same content always has the same key and a later run reuses the first render.
+    with span("card.render", title=title) as attrs:
+        key = card_key(title, lines, footer, columns)
+        png = card_cache.get(key)
+        attrs["cached"] = png is not None
+        if png is None:
+            png = draw_weekend_card(title, lines, footer, columns)
+            card_cache.put(key, png)
+        return png
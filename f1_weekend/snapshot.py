@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable, Iterable
+
+from . import f1_api
+from .weather import HourlyForecast, get_hourly_forecast
+
+
+# Weekend sessions as the API names them (the race itself is Race.start)
+SESSION_NODES = (
+    ("FP1", "FirstPractice"),
+    ("FP2", "SecondPractice"),
+    ("FP3", "ThirdPractice"),
+    ("Qualifying", "Qualifying"),
+    ("Sprint", "Sprint"),
+)
+
+# Snapshot parts each post reads; the next race is always loaded first
+NEEDS: dict[str, tuple[str, ...]] = {
+    "schedule": (),
+    "countdown": (),
+    "track": (),
+    "standings": ("driver_standings", "constructor_standings"),
+    "results": ("results",),
+    "qualifying": ("qualifying",),
+    "sprint": ("sprint",),
+    "weather": ("forecast",),
+    "recap": ("last_race", "last_results"),
+    "delta": ("driver_standings", "prev_driver_standings"),
+    "h2h": ("driver_standings",),
+}
+
+
+def utc_dt(date_str: str, time_str: str | None) -> datetime:
+    t = (time_str or "00:00:00Z").replace("Z", "+00:00")
+    return datetime.fromisoformat(f"{date_str}T{t}")
+
+
+def _driver_name(drv: dict) -> str:
+    return f"{drv.get('givenName','')} {drv.get('familyName','')}".strip()
+
+
+def _coord(value) -> float | None:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass(slots=True)
+class Session:
+    label: str
+    start: datetime
+
+
+@dataclass(slots=True)
+class Race:
+    season: str
+    round: str
+    name: str
+    circuit_name: str | None
+    locality: str | None
+    country: str | None
+    lat: float | None
+    lon: float | None
+    start: datetime
+    sessions: list[Session]  # practice, qualifying and sprint; not the race
+
+    @classmethod
+    def from_api(cls, d: dict) -> Race:
+        circuit = d.get("Circuit") or {}
+        loc = circuit.get("Location") or {}
+        sessions = [
+            Session(label, utc_dt(d[node].get("date"), d[node].get("time")))
+            for label, node in SESSION_NODES
+            if d.get(node)
+        ]
+        return cls(
+            season=d.get("season"),
+            round=d.get("round"),
+            name=d.get("raceName"),
+            circuit_name=circuit.get("circuitName"),
+            locality=loc.get("locality"),
+            country=loc.get("country"),
+            lat=_coord(loc.get("lat")),
+            lon=_coord(loc.get("long")),
+            start=utc_dt(d.get("date"), d.get("time")),
+            sessions=sessions,
+        )
+
+    def session(self, label: str) -> Session | None:
+        return next((s for s in self.sessions if s.label == label), None)
+
+
+@dataclass(slots=True)
+class Result:
+    position: str
+    driver: str
+    constructor: str | None
+    lap: str  # qualifying: best of Q3, Q2, Q1; empty for races and sprints
+
+    @classmethod
+    def from_api(cls, d: dict) -> Result:
+        return cls(
+            position=d.get("position"),
+            driver=_driver_name(d.get("Driver") or {}),
+            constructor=(d.get("Constructor") or {}).get("name"),
+            lap=d.get("Q3") or d.get("Q2") or d.get("Q1") or "",
+        )
+
+
+@dataclass(slots=True)
+class Standing:
+    position: str
+    name: str
+    points: float
+    points_text: str  # as the API wrote it, for display
+
+    @classmethod
+    def from_driver(cls, d: dict) -> Standing:
+        return cls(d.get("position"), _driver_name(d.get("Driver") or {}), float(d.get("points", 0)), d.get("points"))
+
+    @classmethod
+    def from_constructor(cls, d: dict) -> Standing:
+        return cls(d.get("position"), (d.get("Constructor") or {}).get("name"), float(d.get("points", 0)), d.get("points"))
+
+
+# Everything the weekend posts read, fetched up front and parsed once. The next race is
+# loaded first (it decides whether there is anything to do); the other parts are then
+# fetched together in one concurrent batch by fetch(). A part whose fetch failed raises its
+# error when it is read, at the same point the post would have failed fetching it itself.
+class SeasonSnapshot:
+    __slots__ = ("next_race", "_parts")
+
+    def __init__(self, next_race: Race):
+        self.next_race = next_race
+        self._parts: dict[str, object] = {}
+
+    @classmethod
+    def for_next_race(cls) -> SeasonSnapshot:
+        return cls(Race.from_api(f1_api.get_next_race()))
+
+    @property
+    def prev_round(self) -> str:
+        return str(max(1, int(self.next_race.round) - 1))
+
+    def _loaders(self) -> dict[str, Callable[[], object]]:
+        race = self.next_race
+        return {
+            "driver_standings": lambda: [Standing.from_driver(d) for d in f1_api.get_driver_standings("current")],
+            "constructor_standings": lambda: [Standing.from_constructor(c) for c in f1_api.get_constructor_standings("current")],
+            "prev_driver_standings": lambda: [Standing.from_driver(d) for d in f1_api.get_driver_standings(race.season, self.prev_round)],
+            "results": lambda: [Result.from_api(r) for r in f1_api.get_race_results(race.season, race.round)],
+            "qualifying": lambda: [Result.from_api(r) for r in f1_api.get_qualifying_results(race.season, race.round)],
+            "sprint": lambda: [Result.from_api(r) for r in f1_api.get_sprint_results(race.season, race.round)],
+            "last_race": lambda: Race.from_api(f1_api.get_last_race()),
+            "last_results": lambda: [Result.from_api(r) for r in f1_api.get_last_race_results()],
+            "forecast": self._load_forecast,
+        }
+
+    def _load_forecast(self) -> HourlyForecast | None:
+        # One request for the whole weekend, first session through the end of the race
+        race = self.next_race
+        if race.lat is None or race.lon is None:
+            return None
+        first = min([s.start for s in race.sessions] + [race.start])
+        end = race.start + timedelta(hours=3)
+        return HourlyForecast.from_api(get_hourly_forecast(race.lat, race.lon, first.date(), end.date()))
+
+    def fetch(self, parts: Iterable[str]) -> None:
+        loaders = self._loaders()
+        todo = [p for p in dict.fromkeys(parts) if p not in self._parts]
+        if not todo:
+            return
+
+        def load(name: str) -> object:
+            try:
+                return loaders[name]()
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=len(todo)) as pool:
+            for name, value in zip(todo, pool.map(load, todo)):
+                self._parts[name] = value
+
+    def _get(self, name: str):
+        if name not in self._parts:
+            raise RuntimeError(f"Season snapshot part '{name}' was not fetched")
+        value = self._parts[name]
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+    @property
+    def driver_standings(self) -> list[Standing]:
+        return self._get("driver_standings")
+
+    @property
+    def constructor_standings(self) -> list[Standing]:
+        return self._get("constructor_standings")
+
+    @property
+    def prev_driver_standings(self) -> list[Standing]:
+        return self._get("prev_driver_standings")
+
+    @property
+    def results(self) -> list[Result]:
+        return self._get("results")
+
+    @property
+    def qualifying(self) -> list[Result]:
+        return self._get("qualifying")
+
+    @property
+    def sprint(self) -> list[Result]:
+        return self._get("sprint")
+
+    @property
+    def last_race(self) -> Race:
+        return self._get("last_race")
+
+    @property
+    def last_results(self) -> list[Result]:
+        return self._get("last_results")
+
+    @property
+    def forecast(self) -> HourlyForecast | None:
+        return self._get("forecast")
@@ -1,27 +1,135 @@
 import json
 import os
-from dataclasses import dataclass
+import sqlite3
+import threading
+import time
 
 
+STATE_DB = os.getenv("F1_WEEKEND_STATE_DB", "f1_weekend_state.db")
+# Previous store (JSON {"posted": [...]}); imported once when the database is created
 STATE_FILE = os.getenv("F1_WEEKEND_STATE_FILE", "f1_weekend_state.json")
+# A claim left "pending" this long belongs to a run that died mid-post and may be retaken
+CLAIM_TTL = 15 * 60
 
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS posts (
+    key TEXT PRIMARY KEY,
+    season TEXT,
+    status TEXT NOT NULL,      -- pending | posted
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS posts_archive (
+    key TEXT PRIMARY KEY,
+    season TEXT,
+    status TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+"""
 
-@dataclass
-class State:
-    posted: set[str]
 
+def _season(key: str) -> str | None:
+    # Post keys are "<mode>:<season>:<round>"
+    parts = key.split(":")
+    return parts[1] if len(parts) >= 3 else None
 
-def load_state() -> State:
-    if not os.path.exists(STATE_FILE):
-        return State(posted=set())
-    with open(STATE_FILE, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    posted = set((data.get("posted") or []))
-    return State(posted=posted)
 
+class StateStore:
+    # Posted-key store for the weekend poster (SQLite, WAL mode). Posting goes through
+    # claim() -> mark_posted() / release(), so two overlapping runs can never both post the
+    # same key. Only the newest season stays in the hot `posts` table.
+    def __init__(self, path: str = STATE_DB):
+        self.path = path
+        fresh = not os.path.exists(path)
+        self._lock = threading.Lock()
+        # Shared with the async engine's worker threads; every use holds self._lock
+        self._db = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+        if fresh:
+            self._import_json(STATE_FILE)
+        self._archive_old_seasons()
 
-def save_state(state: State) -> None:
-    data = {"posted": sorted(state.posted)}
-    with open(STATE_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
-        f.write("\n")
+    def _import_json(self, path: str) -> None:
+        if not os.path.exists(path):
+            return
+        with open(path, "r", encoding="utf-8") as f:
+            keys = (json.load(f) or {}).get("posted") or []
+        now = time.time()
+        with self._lock:
+            self._db.executemany(
+                "INSERT OR IGNORE INTO posts (key, season, status, updated_at) VALUES (?, ?, 'posted', ?)",
+                [(k, _season(k), now) for k in keys],
+            )
+        print(f"Imported {len(keys)} posted keys from {path}")
+
+    def _archive_old_seasons(self) -> None:
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                newest = self._db.execute("SELECT MAX(season) FROM posts").fetchone()[0]
+                if newest:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO posts_archive SELECT * FROM posts WHERE season < ?", (newest,))
+                    self._db.execute("DELETE FROM posts WHERE season < ?", (newest,))
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+
+    def _row(self, key: str):
+        row = self._db.execute("SELECT status, updated_at FROM posts WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            row = self._db.execute("SELECT status, updated_at FROM posts_archive WHERE key = ?", (key,)).fetchone()
+        return row
+
+    def is_posted(self, key: str) -> bool:
+        with self._lock:
+            row = self._row(key)
+        return row is not None and row[0] == "posted"
+
+    def claim(self, key: str, force: bool = False) -> bool:
+        # Atomic insert-if-absent. False if the key is already posted, or another run holds
+        # a live claim on it; force (F1_WEEKEND_ALLOW_DUPES) only overrides the former.
+        now = time.time()
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._row(key)
+                ok = (
+                    row is None
+                    or (row[0] == "pending" and now - row[1] > CLAIM_TTL)
+                    or (row[0] == "posted" and force)
+                )
+                if ok:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO posts (key, season, status, updated_at) VALUES (?, ?, 'pending', ?)",
+                        (key, _season(key), now),
+                    )
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+        return ok
+
+    def mark_posted(self, key: str) -> None:
+        with self._lock:
+            self._db.execute(
+                "UPDATE posts SET status = 'posted', updated_at = ? WHERE key = ?", (time.time(), key))
+
+    def release(self, key: str, was_posted: bool = False) -> None:
+        # Give up a claim after a failed post (restoring a forced re-post's earlier state).
+        with self._lock:
+            if was_posted:
+                self._db.execute("UPDATE posts SET status = 'posted' WHERE key = ?", (key,))
+            else:
+                self._db.execute("DELETE FROM posts WHERE key = ? AND status = 'pending'", (key,))
+
+    def close(self) -> None:
+        # Checkpoints the WAL into the main file, so the .db alone can be cached
+        with self._lock:
+            self._db.close()
+
+
+def load_state() -> StateStore:
+    return StateStore()
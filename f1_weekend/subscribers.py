@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+from concurrent.futures import wait
+from dataclasses import dataclass
+
+from .discord_webhook import get_delivery
+from .tracing import span
+
+
+# Discord destinations beyond the single webhook each workflow was built for. Every
+# subscriber names a webhook, the feeds it takes and optional filters; each document or
+# card is prepared once and then sent to every matching subscriber at the same time.
+#
+#   [{"name": "team-server", "webhook": "https://discord.com/api/webhooks/...",
+#     "feeds": ["fia"], "doc_types": ["Decision", "Summons"], "drivers": ["4", "Norris"],
+#     "teams": ["McLaren"]},
+#    {"name": "results-only", "webhook": "...", "feeds": ["weekend"], "modes": ["results", "standings"]}]
+#
+# Read from DISCORD_SUBSCRIBERS (JSON, e.g. from a repository secret) or else the file
+# DISCORD_SUBSCRIBERS_FILE. An empty filter matches everything. doc_types, drivers and teams
+# apply to FIA documents (title / car number or driver name / competitor); modes applies to
+# weekend cards. A car number must equal the document's; names are matched as whole words,
+# case-insensitively, so "4" is not car 44 and "Red Bull" is not "Red Bullet".
+SUBSCRIBERS_ENV = "DISCORD_SUBSCRIBERS"
+SUBSCRIBERS_FILE = os.getenv("DISCORD_SUBSCRIBERS_FILE", "subscribers.json")
+FEEDS = ("fia", "weekend")
+# The webhook a feed had before subscribers (DISCORD_WEBHOOK_URL / DISCORD_F1_WEEKEND_WEBHOOK_URL)
+DEFAULT = "default"
+
+
+def _terms(value) -> tuple[str, ...]:
+    if value is None:
+        return ()
+    if isinstance(value, str):
+        value = [value]
+    return tuple(str(v).strip().casefold() for v in value if str(v).strip())
+
+
+def _has_words(term: str, text: str) -> bool:
+    # `term` as whole words of the case-folded `text`
+    return re.search(rf"(?<!\w){re.escape(term)}(?!\w)", text) is not None
+
+
+def _matches(terms: tuple[str, ...], *texts: str | None) -> bool:
+    if not terms:
+        return True
+    haystack = " ".join(t for t in texts if t).casefold()
+    return any(_has_words(term, haystack) for term in terms)
+
+
+def _driver_matches(terms: tuple[str, ...], metadata: dict) -> bool:
+    # Car numbers against the parsed number, anything else against the driver's name.
+    # Entries recorded before the number was parsed out only have driver_info ("4 – Name").
+    if not terms:
+        return True
+    info = metadata.get("driver_info") or ""
+    number = metadata.get("driver_number") or (re.match(r"\d+", info) or [""])[0]
+    name = (metadata.get("driver") or re.sub(r"^\d+\s*[-–]\s*", "", info)).casefold()
+    return any(term == number if term.isdigit() else _has_words(term, name) for term in terms)
+
+
+@dataclass(frozen=True)
+class Subscriber:
+    name: str
+    webhook: str
+    feeds: tuple[str, ...] = FEEDS
+    doc_types: tuple[str, ...] = ()
+    drivers: tuple[str, ...] = ()
+    teams: tuple[str, ...] = ()
+    modes: tuple[str, ...] = ()
+
+    @classmethod
+    def from_config(cls, d: dict) -> Subscriber:
+        name = str(d.get("name") or "").strip()
+        webhook = str(d.get("webhook") or "").strip()
+        if not name or not webhook:
+            raise RuntimeError(f"Subscriber needs a name and a webhook: {d.get('name')!r}")
+        feeds = _terms(d.get("feeds")) or FEEDS
+        unknown = set(feeds) - set(FEEDS)
+        if unknown:
+            raise RuntimeError(f"Subscriber {name!r}: unknown feed(s) {sorted(unknown)}")
+        return cls(
+            name=name,
+            webhook=webhook,
+            feeds=feeds,
+            doc_types=_terms(d.get("doc_types")),
+            drivers=_terms(d.get("drivers")),
+            teams=_terms(d.get("teams")),
+            modes=_terms(d.get("modes")),
+        )
+
+    def wants_document(self, metadata: dict) -> bool:
+        return (
+            "fia" in self.feeds
+            and _matches(self.doc_types, metadata.get("title"))
+            and _driver_matches(self.drivers, metadata)
+            and _matches(self.teams, metadata.get("competitor"))
+        )
+
+    def wants_card(self, mode: str) -> bool:
+        return "weekend" in self.feeds and (not self.modes or mode.lower() in self.modes)
+
+
+def load_subscribers(default_webhook: str | None, feed: str) -> list[Subscriber]:
+    # The feed's default webhook (if set) first, then the configured subscribers of that feed.
+    raw = os.getenv(SUBSCRIBERS_ENV)
+    if raw is None and os.path.exists(SUBSCRIBERS_FILE):
+        with open(SUBSCRIBERS_FILE, "r", encoding="utf-8") as f:
+            raw = f.read()
+    try:
+        entries = json.loads(raw) if raw and raw.strip() else []
+    except ValueError as e:
+        raise RuntimeError(f"Invalid subscriber configuration: {e}") from e
+    # Only type names in the message: the configuration holds webhook tokens
+    if not isinstance(entries, list):
+        raise RuntimeError(
+            f"Invalid subscriber configuration: expected a JSON list of subscriber objects, got {type(entries).__name__}")
+    bad = [type(d).__name__ for d in entries if not isinstance(d, dict)]
+    if bad:
+        raise RuntimeError(
+            f"Invalid subscriber configuration: every subscriber must be a JSON object, got {', '.join(bad)}")
+    configured = [Subscriber.from_config(d) for d in entries]
+
+    subs = [Subscriber(DEFAULT, default_webhook, (feed,))] if default_webhook else []
+    subs += [s for s in configured if feed in s.feeds]
+    names = [s.name for s in subs]
+    if len(set(names)) != len(names):
+        raise RuntimeError(f"Duplicate subscriber names: {names}")
+    return subs
+
+
+def fan_out(requests_by_subscriber: dict[Subscriber, dict]) -> dict[str, Exception | None]:
+    # Send one request per subscriber concurrently (each webhook has its own delivery
+    # queue) and wait for all of them. Returns each subscriber's error, or None if delivered.
+    if not requests_by_subscriber:
+        return {}
+    delivery = get_delivery()
+    with span("discord.send", subscribers=len(requests_by_subscriber)) as attrs:
+        futures = {s.name: delivery.submit(s.webhook, **kwargs) for s, kwargs in requests_by_subscriber.items()}
+        wait(futures.values())
+        errors = {name: fut.exception() for name, fut in futures.items()}
+        attrs["failed"] = sum(e is not None for e in errors.values())
+    return errors
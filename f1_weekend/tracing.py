@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+
+
+# Lightweight timing spans for the FIA scraper and the weekend poster.
+#
+# Every span (page fetch, PDF download, page rasterisation, Discord send, F1 API call, card
+# render, ...) is kept in memory for the run. export() appends them, plus a per-run summary,
+# to a JSON-lines file, and can also write a Prometheus textfile (node_exporter's textfile
+# collector) or OpenMetrics exposition. Neither is written unless configured.
+METRICS_FILE = os.getenv("F1_METRICS_FILE", "")
+PROM_FILE = os.getenv("F1_METRICS_PROM_FILE", "")
+# prometheus | openmetrics
+PROM_FORMAT = os.getenv("F1_METRICS_PROM_FORMAT", "prometheus").lower()
+
+
+class Tracer:
+    def __init__(self, pipeline: str = ""):
+        self.pipeline = pipeline
+        self.run_id = uuid.uuid4().hex[:12]
+        self.started_at = time.time()
+        self.records: list[dict] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name: str, **attrs):
+        # Times the block; the yielded dict can take more attributes along the way.
+        start = time.time()
+        t0 = time.perf_counter()
+        ok = True
+        try:
+            yield attrs
+        except BaseException:
+            ok = False
+            raise
+        finally:
+            self._add({"name": name, "start": round(start, 6), "seconds": time.perf_counter() - t0,
+                       "ok": ok, "attrs": attrs})
+
+    def observe(self, name: str, seconds: float, **attrs) -> None:
+        # A duration measured elsewhere, e.g. document published -> posted to Discord
+        self._add({"name": name, "start": round(time.time(), 6), "seconds": seconds, "ok": True, "attrs": attrs})
+
+    def _add(self, record: dict) -> None:
+        with self._lock:
+            self.records.append(record)
+
+    def drain(self) -> list[dict]:
+        # Hand this process's spans over (render workers return them to the parent)
+        with self._lock:
+            out, self.records = self.records, []
+        return out
+
+    def merge(self, records: list[dict]) -> None:
+        with self._lock:
+            self.records.extend(records)
+
+    def stats(self, records: list[dict] | None = None) -> dict[str, dict]:
+        if records is None:
+            with self._lock:
+                records = list(self.records)
+        out: dict[str, dict] = {}
+        for r in records:
+            st = out.setdefault(r["name"], {"count": 0, "errors": 0, "seconds": 0.0, "max_seconds": 0.0})
+            st["count"] += 1
+            st["errors"] += not r["ok"]
+            st["seconds"] += r["seconds"]
+            st["max_seconds"] = max(st["max_seconds"], r["seconds"])
+        return out
+
+    def summary(self) -> str:
+        stats = self.stats()
+        if not stats:
+            return "no spans"
+        top = sorted(stats.items(), key=lambda kv: -kv[1]["seconds"])
+        return ", ".join(f"{name} {st['count']}× {st['seconds']:.2f}s" for name, st in top)
+
+    def export(self) -> None:
+        # Write this run's spans and start the next run (the watcher exports after every poll)
+        records = self.drain()
+        if METRICS_FILE:
+            self._write_jsonl(METRICS_FILE, records)
+        if PROM_FILE:
+            self._write_prom(PROM_FILE, self.stats(records))
+        self.run_id = uuid.uuid4().hex[:12]
+        self.started_at = time.time()
+
+    def _write_jsonl(self, path: str, records: list[dict]) -> None:
+        base = {"run_id": self.run_id, "pipeline": self.pipeline}
+        with open(path, "a", encoding="utf-8") as f:
+            for r in records:
+                f.write(json.dumps({**base, "type": "span", **r}, ensure_ascii=False, default=str) + "\n")
+            f.write(json.dumps({**base, "type": "run", "start": round(self.started_at, 6),
+                                "seconds": time.time() - self.started_at, "spans": self.stats(records)}) + "\n")
+
+    def _write_prom(self, path: str, stats: dict[str, dict]) -> None:
+        pipeline = self.pipeline or "unknown"
+        lines = [
+            "# HELP f1_span_seconds Time spent in instrumented spans during the last run.",
+            "# TYPE f1_span_seconds summary",
+        ]
+        for name, st in sorted(stats.items()):
+            labels = f'pipeline="{pipeline}",span="{name}"'
+            lines.append(f"f1_span_seconds_sum{{{labels}}} {st['seconds']:.6f}")
+            lines.append(f"f1_span_seconds_count{{{labels}}} {st['count']}")
+        lines += ["# HELP f1_span_max_seconds Slowest single span of the last run.",
+                  "# TYPE f1_span_max_seconds gauge"]
+        for name, st in sorted(stats.items()):
+            lines.append(f'f1_span_max_seconds{{pipeline="{pipeline}",span="{name}"}} {st["max_seconds"]:.6f}')
+        lines += ["# HELP f1_span_errors Spans that raised during the last run.",
+                  "# TYPE f1_span_errors gauge"]
+        for name, st in sorted(stats.items()):
+            lines.append(f'f1_span_errors{{pipeline="{pipeline}",span="{name}"}} {st["errors"]}')
+        lines += ["# HELP f1_last_run_timestamp_seconds When the last run started.",
+                  "# TYPE f1_last_run_timestamp_seconds gauge",
+                  f'f1_last_run_timestamp_seconds{{pipeline="{pipeline}"}} {self.started_at:.3f}']
+        if PROM_FORMAT == "openmetrics":
+            lines.append("# EOF")
+        # Written beside the target and renamed, so a scraper never reads half a file
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        os.replace(tmp, path)
+
+
+_tracer: Tracer | None = None
+_tracer_lock = threading.Lock()
+
+
+def get_tracer() -> Tracer:
+    # Process-wide tracer; the entry point sets its pipeline name.
+    global _tracer
+    with _tracer_lock:
+        if _tracer is None:
+            _tracer = Tracer()
+        return _tracer
+
+
+def span(name: str, **attrs):
+    return get_tracer().span(name, **attrs)
@@ -1,17 +1,153 @@
 from __future__ import annotations
 
+import math
+import os
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+
 import requests
 
+from .tracing import span
+
+
+OPEN_METEO_URL = os.getenv("OPEN_METEO_URL", "https://api.open-meteo.com/v1/forecast")
+HOURLY_FIELDS = (
+    "temperature_2m",
+    "precipitation_probability",
+    "wind_speed_10m",
+    "dew_point_2m",
+    "visibility",
+    "relative_humidity_2m",
+)
+# Forecasts are reused within a run (and by repeated calls in one process) for this long
+FORECAST_TTL = int(os.getenv("F1_WEATHER_TTL_MINUTES", "15")) * 60
+# How long each session lasts, for its forecast window
+SESSION_HOURS = {"FP1": 1, "FP2": 1, "FP3": 1, "Qualifying": 1, "Sprint": 1, "Race": 2}
+# Rain probability change (percentage points) across a window that counts as a trend
+TREND_POINTS = 10
+
+_cache: dict[tuple, tuple[float, dict]] = {}
+_cache_lock = threading.Lock()
+
+
+def get_hourly_forecast(lat: float, lon: float, start: date | None = None, end: date | None = None) -> dict:
+    # Open-Meteo: no API key required. One request covers the whole weekend when
+    # start/end are given, otherwise the next 3 days.
+    key = (round(lat, 4), round(lon, 4), start, end)
+    with _cache_lock:
+        hit = _cache.get(key)
+        if hit and time.monotonic() - hit[0] < FORECAST_TTL:
+            return hit[1]
 
-def get_hourly_forecast(lat: float, lon: float) -> dict:
-    # Open-Meteo: no API key required.
+    dates = f"&start_date={start.isoformat()}&end_date={end.isoformat()}" if start and end else "&forecast_days=3"
     url = (
-        "https://api.open-meteo.com/v1/forecast"
-        f"?latitude={lat}&longitude={lon}"
-        "&hourly=temperature_2m,precipitation_probability,wind_speed_10m,dew_point_2m,visibility,relative_humidity_2m"
-        "&forecast_days=3"
+        f"{OPEN_METEO_URL}?latitude={lat}&longitude={lon}"
+        f"&hourly={','.join(HOURLY_FIELDS)}"
+        f"{dates}"
         "&timezone=UTC"
     )
-    r = requests.get(url, timeout=30)
-    r.raise_for_status()
-    return r.json()
+    with span("weather.forecast"):
+        r = requests.get(url, timeout=30)
+        r.raise_for_status()
+        data = r.json()
+    with _cache_lock:
+        _cache[key] = (time.monotonic(), data)
+    return data
+
+
+def _hour(dt: datetime) -> int:
+    # Hours since the epoch, UTC
+    return int(dt.timestamp() // 3600)
+
+
+def _column(values: list | None, n: int) -> array:
+    # float64 column; missing or short data becomes NaN
+    values = list(values or [])[:n]
+    values += [None] * (n - len(values))
+    return array("d", (math.nan if v is None else float(v) for v in values))
+
+
+def _value(x: float) -> float | None:
+    return None if math.isnan(x) else x
+
+
+@dataclass(slots=True)
+class Window:
+    label: str
+    start: datetime
+    hours: int  # forecast hours found in the window
+    temp_min: float | None
+    temp_max: float | None
+    rain_peak: float | None  # highest precipitation probability, %
+    rain_peak_at: datetime | None
+    rain_trend: str  # "rising", "falling" or "steady"
+    wind_max: float | None
+
+
+class HourlyForecast:
+    # An Open-Meteo hourly payload parsed once into float columns, indexed by UTC hour.
+    __slots__ = ("hours", "columns")
+
+    def __init__(self, hours: array, columns: dict[str, array]):
+        self.hours = hours  # sorted epoch hours, one per row
+        self.columns = columns
+
+    @classmethod
+    def from_api(cls, data: dict) -> HourlyForecast:
+        hourly = data.get("hourly") or {}
+        times = hourly.get("time") or []
+        hours = array("q", (
+            _hour(datetime.fromisoformat(t).replace(tzinfo=timezone.utc)) for t in times
+        ))
+        return cls(hours, {f: _column(hourly.get(f), len(hours)) for f in HOURLY_FIELDS})
+
+    def __len__(self) -> int:
+        return len(self.hours)
+
+    def index(self, dt: datetime) -> int | None:
+        # Row of the forecast hour containing `dt`
+        h = _hour(dt)
+        i = bisect_left(self.hours, h)
+        return i if i < len(self.hours) and self.hours[i] == h else None
+
+    def at(self, dt: datetime) -> dict[str, float | None] | None:
+        i = self.index(dt)
+        if i is None:
+            return None
+        return {f: _value(col[i]) for f, col in self.columns.items()}
+
+    def window(self, label: str, start: datetime, hours: int) -> Window:
+        # Every forecast hour the session overlaps, e.g. 18:00 and 19:00 for 18:30–19:30
+        lo = bisect_left(self.hours, _hour(start))
+        hi = bisect_left(self.hours, -(-int(start.timestamp() + hours * 3600) // 3600))
+        temps = [x for x in self.columns["temperature_2m"][lo:hi] if not math.isnan(x)]
+        winds = [x for x in self.columns["wind_speed_10m"][lo:hi] if not math.isnan(x)]
+        rain = [(x, i) for i, x in enumerate(self.columns["precipitation_probability"][lo:hi], lo) if not math.isnan(x)]
+        peak, peak_i = max(rain, key=lambda r: r[0], default=(None, None))  # earliest peak
+        trend = "steady"
+        if len(rain) > 1 and abs(rain[-1][0] - rain[0][0]) >= TREND_POINTS:
+            trend = "rising" if rain[-1][0] > rain[0][0] else "falling"
+        return Window(
+            label=label,
+            start=start,
+            hours=hi - lo,
+            temp_min=min(temps, default=None),
+            temp_max=max(temps, default=None),
+            rain_peak=peak,
+            rain_peak_at=datetime.fromtimestamp(self.hours[peak_i] * 3600, timezone.utc) if peak_i is not None else None,
+            rain_trend=trend,
+            wind_max=max(winds, default=None),
+        )
+
+    def session_windows(self, sessions: list[tuple[str, datetime]]) -> list[Window]:
+        # One window per (label, start) with forecast data, in the given order
+        out = []
+        for label, start in sessions:
+            w = self.window(label, start, SESSION_HOURS.get(label, 1))
+            if w.hours:
+                out.append(w)
+        return out
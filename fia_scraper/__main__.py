@@ -0,0 +1,17 @@
+import sys
+
+from f1_weekend.race_calendar import is_race_weekend
+
+# Slim entry point (`python -m fia_scraper`, same flags as `python -m fia_scraper.scraper`).
+# Most scheduled runs fall outside a race weekend, so that check comes first and the scraper,
+# with requests and everything it pulls in, is only imported when there is work to do.
+def main():
+    if "--force" not in sys.argv and "--watch" not in sys.argv and not is_race_weekend():
+        print("⏭️ Not a race weekend. Exiting. Use --force to override.")
+        return
+
+    from .scraper import main as scraper_main
+    scraper_main()
+
+if __name__ == "__main__":
+    main()
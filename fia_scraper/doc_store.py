@@ -0,0 +1,76 @@
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+
+# Content-addressed record of every document we have posted:
+#   by_hash: SHA-256 of the PDF bytes -> {url, doc_num, event, title, posted_at}
+#   by_doc:  "<event>|<doc number>"   -> SHA-256 of the latest posted version
+STORE_FILE = os.getenv("FIA_DOC_STORE_FILE", "fia_doc_store.json")
+
+
+@dataclass
+class DocStore:
+    by_hash: dict[str, dict] = field(default_factory=dict)
+    by_doc: dict[str, str] = field(default_factory=dict)
+
+
+def file_sha256(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def doc_key(metadata: dict) -> str | None:
+    # Secondary key; only usable when both the event and the doc number were read from the PDF.
+    doc_num = (metadata.get("doc_num") or "").strip()
+    event = (metadata.get("event") or "").strip()
+    if not doc_num or doc_num == "Unknown" or not event or event == "Event Unknown":
+        return None
+    return f"{event.lower()}|{doc_num}"
+
+
+def load_doc_store() -> DocStore:
+    if not os.path.exists(STORE_FILE):
+        return DocStore()
+    try:
+        with open(STORE_FILE, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except Exception as e:
+        print(f"⚠️ Ignoring unreadable document store: {e}")
+        return DocStore()
+    return DocStore(by_hash=data.get("by_hash") or {}, by_doc=data.get("by_doc") or {})
+
+
+def save_doc_store(store: DocStore) -> None:
+    tmp = STORE_FILE + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"by_hash": store.by_hash, "by_doc": store.by_doc}, f, indent=2, sort_keys=True)
+        f.write("\n")
+    os.replace(tmp, STORE_FILE)
+
+
+def previous_version(store: DocStore, metadata: dict, sha: str) -> dict | None:
+    # Earlier posted document with the same event + doc number but different bytes, if any.
+    key = doc_key(metadata)
+    prev_sha = store.by_doc.get(key) if key else None
+    if not prev_sha or prev_sha == sha:
+        return None
+    return store.by_hash.get(prev_sha)
+
+
+def remember_document(store: DocStore, sha: str, url: str, metadata: dict) -> None:
+    store.by_hash[sha] = {
+        "url": url,
+        "doc_num": metadata.get("doc_num"),
+        "event": metadata.get("event"),
+        "title": metadata.get("title"),
+        "posted_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+    }
+    key = doc_key(metadata)
+    if key:
+        store.by_doc[key] = sha
@@ -0,0 +1,131 @@
+import re
+
+
+# Position-based metadata extraction from the first page of an FIA document.
+#
+# Works on PyMuPDF word tuples (page.get_text("words"): x0, y0, x1, y1, text, ...) rather than
+# the flattened text, so a label and its value are paired by position even when the PDF
+# stores table cells as separate blocks. Words are grouped into visual rows, rows are split
+# into column segments at wide horizontal gaps, and every segment is matched once against a
+# single precompiled alternation of all field labels.
+#
+# Grouping the words costs ~0.1-0.2 ms per page over a regex search of the flattened text,
+# a few percent of a document's extraction time (benchmarks/bench_metadata.py); it is what
+# lets split table cells and moved columns parse at all.
+
+DOC_RE = re.compile(r"\bDocument\s+(\d+)")
+EVENT_RE = re.compile(r"(\d{4}\s+.*?Grand Prix)", re.IGNORECASE)
+TITLE_RE = re.compile(
+    r"(Summons|Decision|Infringement|Classification|Points|Notes|Report|Scrutineering|Grid|Procedure|Entry List|Car Presentation)",
+    re.IGNORECASE)
+DATE_RE = re.compile(r"[0-9]{1,2}\s+[A-Za-z]+\s+\d{4}")
+TIME_RE = re.compile(r"[0-9]{2}:[0-9]{2}")
+DRIVER_RE = re.compile(r"(\d+)\s*[-–]\s*(.+)")
+# A heading like "Decision - Car 4 - ..." starts with a label word but isn't a table row
+_HEADING_VALUE_RE = re.compile(r"[-–]")
+
+# (field, label pattern, value pattern that must match at the start of the value or None)
+LABELS = (
+    ("driver", r"No\s*/\s*Driver", DRIVER_RE),
+    ("competitor", r"Competitor", None),
+    ("date", r"Date", DATE_RE),
+    ("time", r"Time", TIME_RE),
+    ("session", r"Session", None),
+    ("infringement", r"Infringement|Offence", None),
+    ("penalty", r"Decision|Penalty", None),
+    ("reason", r"Reason", None),
+)
+_LABEL_RE = re.compile(
+    "^(?:" + "|".join(f"(?P<{field}>{label})" for field, label, _ in LABELS) + r")(?![A-Za-z])\s*:?\s*(?P<value>.*)$")
+_VALUE_RES = {field: value_re for field, _, value_re in LABELS}
+_FIELDS = tuple(field for field, _, _ in LABELS)
+
+# Words whose vertical centres are this close (pt) share a row; a wider horizontal gap
+# than COLUMN_GAP (pt) starts a new column segment.
+ROW_TOLERANCE = 3.0
+COLUMN_GAP = 18.0
+
+
+def rows_from_words(words) -> list[list[str]]:
+    # Group word tuples into rows (top to bottom), each a list of column segments (left to right).
+    ordered = sorted(words, key=lambda w: ((w[1] + w[3]) / 2, w[0]))
+    rows: list[list] = []
+    row_y = None
+    for w in ordered:
+        yc = (w[1] + w[3]) / 2
+        if not rows or yc - row_y > ROW_TOLERANCE:
+            rows.append([])
+            row_y = yc
+        rows[-1].append(w)
+
+    out = []
+    for row in rows:
+        row.sort(key=lambda w: w[0])
+        segments = [[row[0][4]]]
+        for prev, w in zip(row, row[1:]):
+            if w[0] - prev[2] > COLUMN_GAP:
+                segments.append([])
+            segments[-1].append(w[4])
+        out.append([" ".join(seg) for seg in segments])
+    return out
+
+
+def parse_first_page(words, fallback_title: str = "Document") -> dict:
+    fields: dict[str, str] = {}
+    doc_num = event = title = None
+
+    for segments in rows_from_words(words):
+        text = " ".join(segments)
+        if doc_num is None:
+            m = DOC_RE.search(text)
+            if m:
+                doc_num = m.group(1)
+        if event is None:
+            m = EVENT_RE.search(text)
+            if m:
+                event = m.group(1).title().replace("  ", " ")
+        if title is None:
+            m = TITLE_RE.search(text)
+            if m:
+                title = m.group(1).title()
+
+        for i, seg in enumerate(segments):
+            m = _LABEL_RE.match(seg)
+            if not m:
+                continue
+            field = next(f for f in _FIELDS if m.group(f))
+            if field in fields:
+                continue
+            value = " ".join([m.group("value"), *segments[i + 1:]]).strip()
+            if not value:
+                continue
+            if field == "penalty" and _HEADING_VALUE_RE.match(value):
+                continue
+            value_re = _VALUE_RES[field]
+            if value_re:
+                vm = value_re.match(value)
+                if not vm:
+                    continue
+                value = vm.group(0).strip()
+            fields[field] = value
+
+    driver_number = driver_name = ""
+    if "driver" in fields:
+        dm = DRIVER_RE.match(fields["driver"])
+        driver_number, driver_name = dm.group(1), dm.group(2).strip()
+
+    return {
+        "doc_num": doc_num or "Unknown",
+        "title": title or fallback_title,
+        "driver_info": f"{driver_number} – {driver_name}" if driver_number else "",
+        "driver_number": driver_number,
+        "driver": driver_name,
+        "competitor": fields.get("competitor", ""),
+        "event": event or "Event Unknown",
+        "date": fields.get("date", ""),
+        "time": fields.get("time", ""),
+        "session": fields.get("session", ""),
+        "infringement": fields.get("infringement", ""),
+        "penalty": fields.get("penalty", ""),
+        "reason": fields.get("reason", ""),
+    }
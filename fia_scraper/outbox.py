@@ -0,0 +1,160 @@
+import json
+import os
+import shutil
+from datetime import datetime, timezone
+
+from f1_weekend.subscribers import DEFAULT
+
+
+# Durable outbox for document posts.
+#
+# Each document post gets a manifest (<key>.json, key = SHA-256 of the PDF) recording its
+# metadata, the subscribers it is for and which chunks (Discord messages) each of them got.
+# When a send fails, the images of every chunk not yet delivered everywhere are "parked"
+# under <key>/ so a later run can resume each subscriber from its first unsent chunk without
+# downloading or rendering anything. Posts that succeed never write images, so the happy
+# path stays off disk.
+OUTBOX_DIR = os.getenv("FIA_OUTBOX_DIR", "fia_outbox")
+
+
+def _write_json(path: str, data: dict) -> None:
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+class OutboxEntry:
+    def __init__(self, key: str, data: dict, outbox_dir: str = OUTBOX_DIR):
+        self.key = key
+        self.data = data
+        self.outbox_dir = outbox_dir
+
+    @property
+    def manifest_path(self) -> str:
+        return os.path.join(self.outbox_dir, f"{self.key}.json")
+
+    @property
+    def image_dir(self) -> str:
+        return os.path.join(self.outbox_dir, self.key)
+
+    @property
+    def url(self) -> str:
+        return self.data["url"]
+
+    @property
+    def metadata(self) -> dict:
+        return self.data["metadata"]
+
+    @property
+    def targets(self) -> list[str]:
+        # Subscriber names the post is for (entries from before subscribers: the default webhook)
+        return self.data.get("targets") or [DEFAULT]
+
+    def set_targets(self, names: list[str]) -> None:
+        # Fixed by the first attempt, so a later run never starts a subscriber mid-document
+        if "targets" not in self.data:
+            self.data["targets"] = list(names)
+            self.save()
+
+    @property
+    def parked(self) -> bool:
+        # True once every undelivered chunk is on disk (resumable without rendering)
+        return bool(self.data.get("parked"))
+
+    def _sent(self, name: str) -> list[int]:
+        sent = self.data["sent"]
+        if isinstance(sent, list):  # written before subscribers: the default webhook's progress
+            sent = self.data["sent"] = {DEFAULT: sent}
+        return sent.setdefault(name, [])
+
+    def is_sent(self, index: int, name: str = DEFAULT) -> bool:
+        return index in self._sent(name)
+
+    def mark_sent(self, index: int, name: str = DEFAULT) -> None:
+        sent = self._sent(name)
+        if index not in sent:
+            sent.append(index)
+            self.save()
+
+    def park(self, chunks: list[tuple[int, list]]) -> None:
+        # Persist undelivered chunks as (chunk index, [path or (filename, bytes)]).
+        os.makedirs(self.image_dir, exist_ok=True)
+        layout = {}
+        for index, items in chunks:
+            names = []
+            for item in items:
+                if isinstance(item, tuple):
+                    name, data = item
+                else:
+                    name = os.path.basename(item)
+                    with open(item, "rb") as f:
+                        data = f.read()
+                with open(os.path.join(self.image_dir, name), "wb") as f:
+                    f.write(data)
+                names.append(name)
+            layout[str(index)] = names
+        self.data["chunks"] = layout
+        self.data["parked"] = True
+        self.save()
+
+    def parked_chunks(self, targets: list[str] | None = None) -> list[tuple[int, list[tuple[str, bytes]]]]:
+        # Parked chunks some target still needs, in order, with their images loaded back into memory.
+        targets = self.targets if targets is None else targets
+        out = []
+        for index, names in sorted((int(i), n) for i, n in self.data.get("chunks", {}).items()):
+            if all(self.is_sent(index, t) for t in targets):
+                continue
+            items = []
+            for name in names:
+                with open(os.path.join(self.image_dir, name), "rb") as f:
+                    items.append((name, f.read()))
+            out.append((index, items))
+        return out
+
+    def save(self) -> None:
+        os.makedirs(self.outbox_dir, exist_ok=True)
+        _write_json(self.manifest_path, self.data)
+
+    def delete(self) -> None:
+        if os.path.exists(self.manifest_path):
+            os.remove(self.manifest_path)
+        shutil.rmtree(self.image_dir, ignore_errors=True)
+
+
+def open_entry(key: str, url: str, metadata: dict, outbox_dir: str = OUTBOX_DIR) -> OutboxEntry:
+    # Existing entry for this document (keeping its delivery progress) or a fresh one.
+    path = os.path.join(outbox_dir, f"{key}.json")
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            return OutboxEntry(key, json.load(f), outbox_dir)
+    entry = OutboxEntry(key, {
+        "key": key,
+        "url": url,
+        "metadata": metadata,
+        "created_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "sent": {},
+        "parked": False,
+    }, outbox_dir)
+    entry.save()
+    return entry
+
+
+def pending_entries(outbox_dir: str = OUTBOX_DIR) -> list[OutboxEntry]:
+    if not os.path.isdir(outbox_dir):
+        return []
+    entries = []
+    for name in os.listdir(outbox_dir):
+        if not name.endswith(".json"):
+            continue
+        try:
+            with open(os.path.join(outbox_dir, name), "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"⚠️ Ignoring unreadable outbox entry {name}: {e}")
+            continue
+        entries.append(OutboxEntry(name[:-len(".json")], data, outbox_dir))
+    return sorted(entries, key=lambda e: e.data.get("created_at", ""))
@@ -2,44 +2,31 @@ import time
 import os
 import requests
 import hashlib
+import io
+import html as html_lib
 from urllib.parse import urlparse
-import fitz  # PyMuPDF for reading and rendering PDFs
 # Post to Discord via webhook (no bot token required)
 import re
 import sys
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from zoneinfo import ZoneInfo
-from bs4 import BeautifulSoup
 import json
+import random
+import tempfile
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 
-# Formula 1 calendar
-RACE_DATES = [
-    "2025-03-16", # Australian GP — Melbourne
-    "2026-03-08",  # Australian GP — Melbourne
-    "2026-03-15",  # Chinese GP — Shanghai
-    "2026-03-29",  # Japanese GP — Suzuka
-    "2026-04-12",  # Bahrain GP — Sakhir
-    "2026-04-19",  # Saudi Arabian GP — Jeddah
-    "2026-05-03",  # Miami GP — Miami
-    "2026-05-24",  # Canadian GP — Montreal
-    "2026-06-07",  # Monaco GP — Monaco
-    "2026-06-14",  # Spanish GP — Barcelona-Catalunya
-    "2026-06-28",  # Austrian GP — Spielberg
-    "2026-07-05",  # British GP — Silverstone
-    "2026-07-19",  # Belgian GP — Spa
-    "2026-07-26",  # Hungarian GP — Budapest
-    "2026-08-23",  # Dutch GP — Zandvoort
-    "2026-09-06",  # Italian GP — Monza
-    "2026-09-13",  # Spanish GP — Madrid
-    "2026-09-26",  # Azerbaijan GP — Baku
-    "2026-10-11",  # Singapore GP — Singapore
-    "2026-10-25",  # United States GP — Austin
-    "2026-11-01",  # Mexico City GP — Mexico City
-    "2026-11-08",  # São Paulo GP — Interlagos
-    "2026-11-21",  # Las Vegas GP — Las Vegas
-    "2026-11-29",  # Qatar GP — Lusail
-    "2026-12-06",  # Abu Dhabi GP — Yas Marina
-]
+from f1_weekend import f1_api
+from f1_weekend.discord_webhook import get_delivery
+from f1_weekend.race_calendar import is_race_weekend
+from f1_weekend.subscribers import fan_out, load_subscribers
+from f1_weekend.tracing import get_tracer, span
+
+from .doc_store import file_sha256, load_doc_store, previous_version, remember_document, save_doc_store
+from .metadata import parse_first_page
+from .outbox import open_entry, pending_entries
+from .seen_cache import load_seen_cache
 
 GP_TIMEZONES = {
     "Australian": "Australia/Melbourne",
@@ -67,41 +54,112 @@ GP_TIMEZONES = {
     "Abu Dhabi": "Asia/Dubai",
 }
 
+# FIA site (overridable to point the scraper at a local stand-in, see benchmarks/stand_in.py)
+FIA_BASE_URL = os.getenv("FIA_BASE_URL", "https://www.fia.com").rstrip("/")
 # FIA documents base URL for 2026 season
-FIA_DOCS_URL = "https://www.fia.com/documents/championships/fia-formula-one-world-championship-14/season/season-2026-2072"
+FIA_DOCS_URL = f"{FIA_BASE_URL}/documents/championships/fia-formula-one-world-championship-14/season/season-2026-2072"
 
 # Discord webhook environment variables
 WEBHOOK_URL = os.getenv("DISCORD_WEBHOOK_URL")
 ERROR_WEBHOOK_URL = os.getenv("DISCORD_ERROR_WEBHOOK_URL")
 
-# Cache file path to store hashes of already-processed documents
-CACHE_FILE = "last_fia_doc_hash.txt"
+# Poll state for the documents page: HTTP validators (ETag / Last-Modified) plus a
+# fingerprint of the document list from the last fully processed fetch.
+PAGE_STATE_FILE = "last_fia_page_state.json"
+
+# How PDF links are pulled out of the page:
+#   stream   - incremental tag scanner over the response body (default, no DOM)
+#   bs4      - full BeautifulSoup parse of the page
+#   validate - stream, then cross-check against BeautifulSoup and report any mismatch
+LINK_PARSER = os.getenv("FIA_LINK_PARSER", "stream").lower()
+
+PAGE_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+}
 
 # Fetch FIA documents page HTML
 # NOTE: The FIA documents list is server-rendered (PDF links appear in raw HTML),
 # so we avoid Selenium/Firefox for reliability and speed.
 def get_rendered_html():
+    r, _ = poll_documents_page({})
+    with r:
+        return r.text
+
+# Conditional GET of the documents page. The body is left unread (stream=True) so links
+# can be scanned as it arrives.
+# Returns (response, validators); response is None when the server answers 304 Not Modified.
+def poll_documents_page(page_state):
     print("🌐 Fetching FIA 2026 documents page...")
-    headers = {
-        "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120 Safari/537.36",
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    headers = dict(PAGE_HEADERS)
+    if page_state.get("etag"):
+        headers["If-None-Match"] = page_state["etag"]
+    if page_state.get("last_modified"):
+        headers["If-Modified-Since"] = page_state["last_modified"]
+
+    with span("fia.page_fetch") as attrs:
+        r = http_session().get(FIA_DOCS_URL, headers=headers, timeout=30, stream=True)
+        attrs["status"] = r.status_code
+    if r.status_code == 304:
+        r.close()
+        return None, {
+            "etag": page_state.get("etag"),
+            "last_modified": page_state.get("last_modified"),
+        }
+    try:
+        r.raise_for_status()
+    except Exception:
+        r.close()
+        raise
+    return r, {
+        "etag": r.headers.get("ETag"),
+        "last_modified": r.headers.get("Last-Modified"),
     }
-    r = requests.get(FIA_DOCS_URL, headers=headers, timeout=30)
-    r.raise_for_status()
-    return r.text
 
-# Extract all PDF links from the rendered HTML
+# SHA256 of the document list in page order. Unrelated page churn (tokens, banners,
+# timestamps) doesn't change it, so an unchanged list can skip all further work.
+def page_fingerprint(pdf_links):
+    return hashlib.sha256("\n".join(pdf_links).encode()).hexdigest()
+
+# Load poll state saved by the last fully processed run
+def load_page_state():
+    if not os.path.exists(PAGE_STATE_FILE):
+        return {}
+    try:
+        with open(PAGE_STATE_FILE, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except Exception as e:
+        print(f"⚠️ Ignoring unreadable page state: {e}")
+        return {}
+    return data if isinstance(data, dict) else {}
+
+# Save poll state (written to a temp file first so a crash can't leave half a JSON document)
+def save_page_state(state):
+    tmp = PAGE_STATE_FILE + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2)
+        f.write("\n")
+    os.replace(tmp, PAGE_STATE_FILE)
+
+# Turn an <a href> value into an absolute PDF URL (None if it isn't a PDF link)
+def _pdf_url(href):
+    href = href.strip()
+    if not href.lower().endswith(".pdf"):
+        return None
+    if href.startswith("http"):
+        return href
+    return f"{FIA_BASE_URL}{href}"
+
+# Extract all PDF links from the rendered HTML (BeautifulSoup reference implementation)
 def extract_pdf_links(html):
+    from bs4 import BeautifulSoup  # only for FIA_LINK_PARSER=bs4 / validate
+
     soup = BeautifulSoup(html, "html.parser")
     links = []
     for a in soup.find_all("a", href=True):
-        href = a["href"].strip()
-        if not href.lower().endswith(".pdf"):
-            continue
-        if href.startswith("http"):
-            links.append(href)
-        else:
-            links.append(f"https://www.fia.com{href}")
+        url = _pdf_url(a["href"])
+        if url:
+            links.append(url)
     # Deduplicate while preserving order
     seen = set()
     out = []
@@ -112,17 +170,128 @@ def extract_pdf_links(html):
         out.append(u)
     return out
 
-# Load previously seen document hashes from cache file
-def load_cached_hashes():
-    if not os.path.exists(CACHE_FILE):
-        return set()
-    with open(CACHE_FILE, "r") as f:
-        return set(line.strip() for line in f.readlines())
+# Next thing worth looking at: a comment, a <script>/<style> element (whose contents
+# html.parser never treats as markup) or an <a> tag. Everything else is skipped untokenised.
+# As in html.parser, the tag name ends at whitespace, "/" or ">" (<a/href=...> is an <a>).
+_SCAN_START_RE = re.compile(r"<!--|<(script|style)\b|<a(?=[\t\n\r\f />])", re.IGNORECASE)
+_RAW_TEXT_END_RE = {
+    "script": re.compile(r"</script", re.IGNORECASE),
+    "style": re.compile(r"</style", re.IGNORECASE),
+}
+# html.parser's attribute syntax (attrfind_tolerant), applied in order from after the tag
+# name so text inside a quoted value is never read as an attribute. The quantifiers are
+# possessive, as html.parser's one-attribute-at-a-time matching effectively is, so a tag cut
+# off at a chunk boundary fails fast instead of backtracking.
+_A_NAME_RE = re.compile(r"<a(?:\s|/(?!>))*+", re.IGNORECASE)
+_ATTR_RE = re.compile(
+    r"""((?<=['"\s/])[^\s/>][^\s/=>]*+)(\s*+=++\s*+('[^']*'|"[^"]*"|(?!['"])[^>\s]*+))?+(?:\s|/(?!>))*+""")
+# A whole <a ...> tag: the same attributes, then ">" or "/>"
+_A_TAG_RE = re.compile(
+    r"""<a(?:\s|/(?!>))*+"""
+    r"""(?:(?<=['"\s/])[^\s/>][^\s/=>]*+(?:\s*+=++\s*+(?:'[^']*'|"[^"]*"|(?!['"])[^>\s]*+))?+(?:\s|/(?!>))*+)*+"""
+    r"""\s*+/?>""", re.IGNORECASE)
+# An unterminated <a ...> longer than this is treated as malformed and skipped
+_MAX_TAG_LEN = 16 * 1024
 
-# Save updated list of hashes to cache file
-def save_cached_hashes(hashes):
-    with open(CACHE_FILE, "w") as f:
-        f.writelines(h + "\n" for h in hashes)
+# The href of an <a ...> tag as BeautifulSoup's html.parser builder sees it: attributes are
+# read in order, values unquoted and unescaped, and a repeated href replaces the earlier one.
+def _tag_href(tag):
+    href = None
+    k = _A_NAME_RE.match(tag).end()
+    while True:
+        m = _ATTR_RE.match(tag, k)
+        if not m:
+            return href
+        k = m.end()
+        if m.group(1).lower() != "href":
+            continue
+        value = m.group(3) if m.group(2) else ""
+        if value[:1] == value[-1:] and value[:1] in ("'", '"') and len(value) > 1:
+            value = value[1:-1]
+        href = html_lib.unescape(value) if value else value
+
+# Stream PDF URLs out of HTML text chunks (e.g. response.iter_content(decode_unicode=True)).
+# Yields absolute URLs in page order with the same dedup semantics as extract_pdf_links(),
+# holding at most one unfinished tag of the page in memory.
+def iter_pdf_links(chunks):
+    seen = set()
+    buf = ""
+    for chunk in chunks:
+        if not chunk:
+            continue
+        buf += chunk
+        pos = 0
+        while True:
+            m = _SCAN_START_RE.search(buf, pos)
+            if not m:
+                # Keep enough of the tail to recognise a token split across chunks
+                pos = max(pos, len(buf) - len("<script"))
+                break
+
+            if m.group(0) == "<!--":
+                end = buf.find("-->", m.end())
+                if end < 0:
+                    pos = m.start()
+                    break
+                pos = end + 3
+                continue
+
+            if m.group(1):
+                end = _RAW_TEXT_END_RE[m.group(1).lower()].search(buf, m.end())
+                if not end:
+                    pos = m.start()
+                    break
+                pos = end.end()
+                continue
+
+            tag = _A_TAG_RE.match(buf, m.start())
+            if not tag:
+                if len(buf) - m.start() > _MAX_TAG_LEN:
+                    pos = m.end()
+                    continue
+                pos = m.start()
+                break
+            pos = tag.end()
+
+            href = _tag_href(tag.group(0))
+            if href is None:
+                continue
+            url = _pdf_url(href)
+            if url and url not in seen:
+                seen.add(url)
+                yield url
+
+        buf = buf[pos:]
+
+# Collect the PDF links from a streamed page response according to LINK_PARSER
+def read_pdf_links(response):
+    if LINK_PARSER == "bs4":
+        return extract_pdf_links(response.text)
+
+    # Without a charset in Content-Type, iter_content(decode_unicode=True) yields bytes
+    response.encoding = response.encoding or response.apparent_encoding or "utf-8"
+    chunks = response.iter_content(chunk_size=64 * 1024, decode_unicode=True)
+    if LINK_PARSER != "validate":
+        return list(iter_pdf_links(chunks))
+
+    kept = []
+
+    def tee():
+        for c in chunks:
+            kept.append(c)
+            yield c
+
+    links = list(iter_pdf_links(tee()))
+    reference = extract_pdf_links("".join(kept))
+    if links != reference:
+        msg = (
+            f"Streaming link extractor disagrees with BeautifulSoup "
+            f"({len(links)} vs {len(reference)} links); using BeautifulSoup result."
+        )
+        print(f"⚠️ {msg}")
+        report_error_to_discord(msg)
+        return reference
+    return links
 
 # SHA256 hash of the document identifier (used for cache comparison)
 # We canonicalize to the URL path so scheme/host changes (http vs https) don't break caching.
@@ -134,91 +303,350 @@ def hash_url(url):
     key = path.strip().lower()
     return hashlib.sha256(key.encode()).hexdigest()
 
-# Download a PDF file to a specified folder
+# Shared keep-alive HTTP session (page polls + PDF downloads reuse pooled TLS connections)
+_session = None
+
+def http_session():
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        _session.mount("https://", adapter)
+        _session.mount("http://", adapter)
+    return _session
+
+# Largest PDF we are willing to download (entry lists / classifications are a few MB)
+MAX_PDF_BYTES = int(os.getenv("FIA_MAX_PDF_MB", "50")) * 1024 * 1024
+DOWNLOAD_RETRIES = 4
+DOWNLOAD_CHUNK = 64 * 1024
+
+# Raised when a transfer stops short; the next attempt resumes it with a Range request
+class _IncompleteDownload(Exception):
+    pass
+
+def _retryable(e):
+    if isinstance(e, (_IncompleteDownload, requests.ConnectionError, requests.Timeout,
+                      requests.exceptions.ChunkedEncodingError)):
+        return True
+    resp = getattr(e, "response", None)
+    return isinstance(e, requests.HTTPError) and resp is not None and (
+        resp.status_code == 429 or resp.status_code >= 500)
+
+PDF_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120 Safari/537.36",
+    "Accept": "application/pdf,*/*",
+    "Accept-Encoding": "identity",
+    "Referer": FIA_DOCS_URL,
+}
+
+# Stream a PDF into a seekable binary file object (temp file or BytesIO).
+# Interrupted transfers resume with Range/If-Range after a jittered exponential backoff;
+# anything over MAX_PDF_BYTES is refused. Returns the number of bytes written.
+def _download_into(url, f):
+    received = 0
+    validator = None
+    attempt = 0
+    while True:
+        headers = dict(PDF_HEADERS)
+        if received:
+            headers["Range"] = f"bytes={received}-"
+            if validator:
+                headers["If-Range"] = validator
+        try:
+            with http_session().get(url, headers=headers, timeout=30, stream=True) as r:
+                r.raise_for_status()
+                if received and r.status_code != 206:
+                    # Server ignored the range (or the file changed): start over
+                    received = 0
+                validator = r.headers.get("ETag") or r.headers.get("Last-Modified") or validator
+
+                length = int(r.headers.get("Content-Length") or 0)
+                expected = received + length if length else None
+                if expected and expected > MAX_PDF_BYTES:
+                    raise RuntimeError(f"PDF too large ({expected} bytes > {MAX_PDF_BYTES}): {url}")
+
+                f.seek(received)
+                f.truncate()
+                for chunk in r.iter_content(chunk_size=DOWNLOAD_CHUNK):
+                    received += len(chunk)
+                    if received > MAX_PDF_BYTES:
+                        raise RuntimeError(f"PDF too large (> {MAX_PDF_BYTES} bytes): {url}")
+                    f.write(chunk)
+
+                if expected and received < expected:
+                    raise _IncompleteDownload(f"got {received} of {expected} bytes")
+            return received
+
+        except Exception as e:
+            attempt += 1
+            if attempt > DOWNLOAD_RETRIES or not _retryable(e):
+                raise
+            delay = min(30.0, 2 ** (attempt - 1)) * random.uniform(0.5, 1.5)
+            print(f"🔁 Download interrupted ({e}); retry {attempt}/{DOWNLOAD_RETRIES} in {delay:.1f}s"
+                  f"{f' from byte {received}' if received else ''}: {url}")
+            time.sleep(delay)
+
+# Download a PDF file to a specified folder.
+# The body is streamed into a temp file in the same folder and renamed into place once
+# complete, so a partial file is never picked up.
 def download_pdf(url, folder):
     filename = url.split("/")[-1]
     path = os.path.join(folder, filename)
 
-    headers = {
-        "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120 Safari/537.36",
-        "Accept": "application/pdf,*/*",
-        "Referer": FIA_DOCS_URL,
-    }
+    fd, tmp_path = tempfile.mkstemp(dir=folder, prefix=f".{filename}.", suffix=".part")
+    try:
+        with os.fdopen(fd, "w+b") as f:
+            _download_into(url, f)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return path
 
-    r = requests.get(url, headers=headers, timeout=30)
-    r.raise_for_status()
+# Download a PDF straight into memory (same resume / size-cap rules as download_pdf)
+def fetch_pdf_bytes(url):
+    buf = io.BytesIO()
+    _download_into(url, buf)
+    return buf.getvalue()
 
-    with open(path, "wb") as f:
-        f.write(r.content)
+# Open a PDF from a file path or from its bytes
+def open_pdf(pdf):
+    import fitz  # PyMuPDF, loaded on first use so runs that render nothing don't pay for it
 
-    return path
+    if isinstance(pdf, (bytes, bytearray)):
+        return fitz.open(stream=pdf, filetype="pdf")
+    return fitz.open(pdf)
 
-# Extract structured metadata from the first page of a PDF document
-def extract_pdf_metadata(pdf_path):
-    doc = fitz.open(pdf_path)
-    first_page_text = doc[0].get_text()
-
-    doc_match = re.search(r"Document\s+(\d+)", first_page_text)
-    doc_number = doc_match.group(1) if doc_match else "Unknown"
-
-    event_match = re.search(r"(\d{4}\s+.*?Grand Prix)", first_page_text, re.IGNORECASE)
-    event = event_match.group(1).title().replace("  ", " ") if event_match else "Event Unknown"
-
-    date_match = re.search(r"Date\s+([0-9]{1,2}\s+[A-Za-z]+\s+\d{4})", first_page_text)
-    time_match = re.search(r"Time\s+([0-9]{2}:[0-9]{2})", first_page_text)
-    date = date_match.group(1).strip() if date_match else ""
-    time_str = time_match.group(1).strip() if time_match else ""
-
-    driver_match = re.search(r"No\s*/\s*Driver\s+(\d+)\s*[-–]\s*(.+)", first_page_text)
-    driver_info = f"{driver_match.group(1)} – {driver_match.group(2).strip()}" if driver_match else ""
-
-    reason_match = re.search(r"Reason\s+([^\n]+)", first_page_text)
-    reason = reason_match.group(1).strip() if reason_match else ""
-
-    title_match = re.search(
-        r"(Summons|Decision|Infringement|Classification|Points|Notes|Report|Scrutineering|Grid|Procedure|Entry List|Car Presentation)",
-        first_page_text, re.IGNORECASE)
-    title = title_match.group(1).title() if title_match else os.path.basename(pdf_path).split(".")[0].replace("_", " ").title()
-
-    return {
-        "doc_num": doc_number,
-        "title": title,
-        "driver_info": driver_info,
-        "event": event,
-        "date": date,
-        "time": time_str,
-        "reason": reason
-    }
+# Extract structured metadata from the first page of a PDF document (see metadata.py).
+# `pdf_path` may also be the PDF bytes; `name` then stands in for the file name.
+def extract_pdf_metadata(pdf_path, name=None):
+    with span("fia.metadata"):
+        with open_pdf(pdf_path) as doc:
+            words = doc[0].get_text("words")
+        name = name or (os.path.basename(pdf_path) if isinstance(pdf_path, str) else "document")
+        return parse_first_page(words, fallback_title=name.split(".")[0].replace("_", " ").title())
+
+# How pages are rasterised:
+#   eager - every page at 150 DPI, up front in the render pool (default)
+#   lazy  - per-page adaptive DPI, at most MAX_INLINE_PAGES pages, each rendered only when
+#           post_images_to_discord reaches its batch (the rest is linked as the PDF)
+RENDER_MODE = os.getenv("FIA_RENDER_MODE", "eager").lower()
+# Write downloaded PDFs to fia_docs/ and page JPEGs to jpg_output/ (for debugging).
+# Off by default: PDFs are opened from memory and pages are uploaded from in-memory buffers.
+KEEP_FILES = os.getenv("FIA_KEEP_FILES", "false").lower() == "true"
+MAX_INLINE_PAGES = int(os.getenv("FIA_MAX_INLINE_PAGES", "20"))
+# Upper bound on the long edge of an adaptively rendered page, in pixels
+MAX_PAGE_PX = 2000
 
 # Convert a multi-page PDF into JPEG images (150 DPI)
 def convert_pdf_to_images(pdf_path, image_folder, base_name=None):
-    os.makedirs(image_folder, exist_ok=True)
-    doc = fitz.open(pdf_path)
-    image_paths = []
-    for i in range(len(doc)):
-        page = doc.load_page(i)
-        pix = page.get_pixmap(dpi=150)
-        name = base_name or os.path.basename(pdf_path)
-        img_path = os.path.join(image_folder, f"{name}_page_{i+1}.jpg")
-        pix.save(img_path)
-        image_paths.append(img_path)
-    return image_paths
-
-def _send_webhook_files(webhook_url: str, content: str | None, file_paths: list[str]):
+    return list(iter_pdf_images(pdf_path, image_folder, base_name=base_name, dpi=150))
+
+# Pick a render DPI for a page from its text density and size: dense pages (timing sheets,
+# classifications) get more pixels so small print stays legible, near-empty ones fewer, and
+# no page goes over MAX_PAGE_PX on its long edge (A3 sheets would otherwise balloon).
+def choose_dpi(page):
+    w_in = page.rect.width / 72
+    h_in = page.rect.height / 72
+    density = len(page.get_text("text").strip()) / max(w_in * h_in, 1.0)
+    if density >= 200:
+        dpi = 180
+    elif density < 30:
+        dpi = 110
+    else:
+        dpi = 150
+    return int(max(72, min(dpi, MAX_PAGE_PX / max(w_in, h_in, 1.0))))
+
+# Discord webhook upload limits: 10 attachments and (unboosted server) 10 MiB per message,
+# less some room for the multipart framing and payload_json of the request.
+MAX_FILES_PER_MESSAGE = 10
+MAX_UPLOAD_BYTES = int(float(os.getenv("DISCORD_MAX_UPLOAD_MB", "10")) * 1024 * 1024)
+UPLOAD_BUDGET = MAX_UPLOAD_BYTES - 64 * 1024
+# JPEG qualities tried per page, best first. A page takes the first one that fits its share
+# of a full message, so ten pages normally still go out in a single request.
+JPEG_QUALITIES = (95, 85, 75, 65, 50)
+PAGE_TARGET_BYTES = UPLOAD_BUDGET // MAX_FILES_PER_MESSAGE
+
+# Rasterise one page to JPEG bytes that fit the upload budget: lower the quality first, and
+# only if a page cannot fit a message on its own even at the lowest quality, the resolution.
+# Overshoots are usually small, so the next step down normally fits (two encodes in all).
+def encode_page(page, dpi):
+    while True:
+        pix = page.get_pixmap(dpi=dpi)
+        for quality in JPEG_QUALITIES:
+            data = pix.tobytes("jpeg", jpg_quality=quality)
+            if len(data) <= PAGE_TARGET_BYTES:
+                return data
+        if len(data) <= UPLOAD_BUDGET or dpi <= 72:
+            return data
+        dpi = max(72, int(dpi * 0.75))
+
+# Render PDF pages to JPEGs one at a time, only as the caller asks for the next one.
+# Yields file paths, or (filename, jpeg bytes) when image_folder is None (nothing touches disk).
+# `pdf_path` may also be the PDF bytes; dpi=None picks it per page with choose_dpi().
+def iter_pdf_images(pdf_path, image_folder, base_name=None, max_pages=None, dpi=None):
+    if image_folder:
+        os.makedirs(image_folder, exist_ok=True)
+    doc = open_pdf(pdf_path)
+    try:
+        count = len(doc) if max_pages is None else min(len(doc), max_pages)
+        name = base_name or (os.path.basename(pdf_path) if isinstance(pdf_path, str) else "document")
+        for i in range(count):
+            with span("fia.rasterise_page", page=i + 1) as attrs:
+                page = doc.load_page(i)
+                data = encode_page(page, dpi or choose_dpi(page))
+                attrs["bytes"] = len(data)
+            filename = f"{name}_page_{i+1}.jpg"
+            if not image_folder:
+                yield filename, data
+                continue
+            img_path = os.path.join(image_folder, filename)
+            with open(img_path, "wb") as f:
+                f.write(data)
+            yield img_path
+    finally:
+        doc.close()
+
+# Deferred page images for lazy mode: iterating renders the pages (picklable, so it can be
+# handed back from a render worker without doing the rendering there).
+class LazyPageImages:
+    def __init__(self, pdf_path, image_folder, base_name, max_pages):
+        self.pdf_path = pdf_path
+        self.image_folder = image_folder
+        self.base_name = base_name
+        self.max_pages = max_pages
+
+    def __iter__(self):
+        return iter_pdf_images(self.pdf_path, self.image_folder, self.base_name, self.max_pages)
+
+# Read metadata and rasterise one downloaded document (runs in a render worker).
+# `pdf` is a path with FIA_KEEP_FILES, otherwise the PDF bytes and pages stay in memory.
+def prepare_document(pdf, name=None):
+    metadata = extract_pdf_metadata(pdf, name=name)
+
+    base_name = f"Doc_{metadata['doc_num']}_{metadata['title'].replace(' ', '_')}"
+    base_name = re.sub(r"[^\w\-_.]", "", base_name)
+
+    image_folder = "jpg_output" if KEEP_FILES else None
+    if RENDER_MODE == "lazy":
+        with open_pdf(pdf) as doc:
+            metadata["page_count"] = len(doc)
+        images = LazyPageImages(pdf, image_folder, base_name, MAX_INLINE_PAGES)
+    else:
+        images = list(iter_pdf_images(pdf, image_folder, base_name=base_name, dpi=150))
+    return metadata, images
+
+def _download_document(url):
+    print(f"⬇️ Downloading and processing: {url}")
+    name = url.split("/")[-1]
+    with span("fia.pdf_download", url=url) as attrs:
+        if KEEP_FILES:
+            pdf_path = download_pdf(url, "fia_docs")
+            attrs["bytes"] = os.path.getsize(pdf_path)
+            return pdf_path, file_sha256(pdf_path), name
+        data = fetch_pdf_bytes(url)
+        attrs["bytes"] = len(data)
+        return data, hashlib.sha256(data).hexdigest(), name
+
+# prepare_document() in a render worker process, handing its spans back with the result
+def _prepare_in_worker(pdf, name):
+    return prepare_document(pdf, name), get_tracer().drain()
+
+# Download finished: hand the PDF to the render pool and forward (sha, outcome) to `ready`.
+# Content we have already posted (byte-identical re-upload) is never rendered.
+def _chain_render(ready, render_pool, known_hashes, download):
+    try:
+        pdf, sha, name = download.result()
+        if sha in known_hashes:
+            ready.set_result((sha, None))
+            return
+        in_worker = isinstance(render_pool, ProcessPoolExecutor)
+        render = render_pool.submit(_prepare_in_worker if in_worker else prepare_document, pdf, name)
+    except Exception as e:
+        ready.set_exception(e)
+        return
+
+    def done(f):
+        try:
+            prepared = f.result()
+            if in_worker:
+                prepared, spans = prepared
+                get_tracer().merge(spans)
+            ready.set_result((sha, prepared))
+        except Exception as e:
+            ready.set_exception(e)
+
+    render.add_done_callback(done)
+
+# Pipelined download -> metadata -> rasterise for a list of documents.
+# Downloads run on a bounded thread pool and each PDF moves on to the render pool as soon as
+# it lands, but results are yielded strictly in input order as
+# (url, content sha256, (metadata, images), error) so the caller can post in order and only
+# commit a hash once its post succeeded. Documents whose bytes are in `known_hashes` come
+# back with prepared=None and are not rendered.
+# PyMuPDF isn't thread-safe, so rendering uses worker processes, or a single thread when
+# render_workers is 0 or there is only one document (not worth the process start-up).
+def iter_prepared_documents(urls, download_workers, render_workers, known_hashes=()):
+    if not urls:
+        return
+
+    if render_workers > 0 and len(urls) > 1:
+        render_pool = ProcessPoolExecutor(
+            max_workers=min(render_workers, len(urls)),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    else:
+        render_pool = ThreadPoolExecutor(max_workers=1)
+    download_pool = ThreadPoolExecutor(max_workers=max(1, min(download_workers, len(urls))))
+
+    try:
+        ready = []
+        for url in urls:
+            fut = Future()
+            ready.append(fut)
+            download = download_pool.submit(_download_document, url)
+            download.add_done_callback(partial(_chain_render, fut, render_pool, known_hashes))
+
+        for url, fut in zip(urls, ready):
+            try:
+                sha, prepared = fut.result()
+            except Exception as e:
+                yield url, None, None, e
+                continue
+            yield url, sha, prepared, None
+    finally:
+        download_pool.shutdown(wait=True, cancel_futures=True)
+        render_pool.shutdown(wait=True, cancel_futures=True)
+
+def _files_request(content: str | None, file_paths: list):
     # Discord webhooks accept multipart with files[0], files[1], ...
+    # Each item is a file path or an in-memory (filename, bytes) pair.
+    # Returns the request and the file objects it opened.
     files = {}
     opened = []
-    try:
-        for idx, p in enumerate(file_paths):
-            f = open(p, "rb")
-            opened.append(f)
-            files[f"files[{idx}]"] = (p.split("/")[-1], f, "image/jpeg")
+    for idx, p in enumerate(file_paths):
+        if isinstance(p, tuple):
+            files[f"files[{idx}]"] = (p[0], p[1], "image/jpeg")
+            continue
+        f = open(p, "rb")
+        opened.append(f)
+        files[f"files[{idx}]"] = (p.split("/")[-1], f, "image/jpeg")
 
-        data = {
-            "payload_json": json.dumps({"content": content or ""}),
-        }
-        r = requests.post(webhook_url, data=data, files=files, timeout=60)
-        r.raise_for_status()
+    data = {
+        "payload_json": json.dumps({"content": content or ""}),
+    }
+    return {"data": data, "files": files, "timeout": 60}, opened
+
+# Send one message to every subscriber at once; returns {subscriber name: error or None}
+def _send_webhook_files(subscribers, content: str | None, file_paths: list):
+    requests_by_subscriber = {}
+    opened = []
+    try:
+        for sub in subscribers:
+            request, files = _files_request(content, file_paths)
+            opened += files
+            requests_by_subscriber[sub] = request
+        return fan_out(requests_by_subscriber)
     finally:
         for f in opened:
             try:
@@ -226,36 +654,71 @@ def _send_webhook_files(webhook_url: str, content: str | None, file_paths: list[
             except Exception:
                 pass
 
+def _attachment_size(item):
+    return len(item[1]) if isinstance(item, tuple) else os.path.getsize(item)
+
+# Group page images into as few webhook messages as possible without reordering them: a
+# message is closed when the next page would exceed the attachment count or byte budget.
+# Works on an iterator, so lazily rendered pages are produced one message at a time.
+def pack_attachments(images, budget=None, max_files=MAX_FILES_PER_MESSAGE):
+    budget = UPLOAD_BUDGET if budget is None else budget
+    chunk, used = [], 0
+    for item in images:
+        size = _attachment_size(item)
+        if chunk and (len(chunk) >= max_files or used + size > budget):
+            yield chunk
+            chunk, used = [], 0
+        chunk.append(item)
+        used += size
+    if chunk:
+        yield chunk
+
 def convert_to_gmt(event, date_str, time_str):
     try:
-        if not date_str or not time_str:
-            return None
+        utc_dt = document_time_utc(event, date_str, time_str)
+        return utc_dt.strftime("%H:%M GMT") if utc_dt else None
+    except Exception as e:
+        print(f"⚠️ Failed GMT conversion: {e}")
+        return None
 
-        gp_timezone = None
+# When a document says it was issued (its local date/time at the Grand Prix), in UTC
+def document_time_utc(event, date_str, time_str):
+    if not date_str or not time_str:
+        return None
 
-        for gp_name, tz in GP_TIMEZONES.items():
-            if gp_name.lower() in event.lower():
-                gp_timezone = tz
-                break
+    gp_timezone = None
 
-        if not gp_timezone:
-            return None
+    for gp_name, tz in GP_TIMEZONES.items():
+        if gp_name.lower() in event.lower():
+            gp_timezone = tz
+            break
 
-        local_dt = datetime.strptime(
-            f"{date_str} {time_str}",
-            "%d %B %Y %H:%M"
-        )
-        
-        local_dt = local_dt.replace(tzinfo=ZoneInfo(gp_timezone))
-        utc_dt = local_dt.astimezone(ZoneInfo("UTC"))
-        return utc_dt.strftime("%H:%M GMT")
-        
-    except Exception as e:
-        print(f"⚠️ Failed GMT conversion: {e}")
+    if not gp_timezone:
         return None
 
-# Format and post metadata + images to Discord via webhook
-def post_images_to_discord(image_paths, metadata):
+    local_dt = datetime.strptime(
+        f"{date_str} {time_str}",
+        "%d %B %Y %H:%M"
+    )
+
+    local_dt = local_dt.replace(tzinfo=ZoneInfo(gp_timezone))
+    return local_dt.astimezone(ZoneInfo("UTC"))
+
+# Record how long after its stated issue time a document reached Discord
+def record_publish_latency(metadata):
+    try:
+        issued = document_time_utc(metadata.get("event", ""), metadata.get("date"), metadata.get("time"))
+    except Exception:
+        return
+    if not issued:
+        return
+    seconds = (datetime.now(timezone.utc) - issued).total_seconds()
+    # A stated time in the future is a misparsed date or venue timezone, not a latency
+    if seconds >= 0:
+        get_tracer().observe("fia.published_to_discord", seconds, doc=metadata.get("doc_num"))
+
+# Build the message text that accompanies a document's first batch of images
+def format_post_content(metadata):
     doc_num = metadata.get("doc_num", "Unknown")
     title = metadata.get("title", "Untitled")
     driver_info = metadata.get("driver_info", "")
@@ -263,6 +726,9 @@ def post_images_to_discord(image_paths, metadata):
     date = metadata.get("date", "")
     time_str = metadata.get("time", "")
     reason = metadata.get("reason", "")
+    penalty = metadata.get("penalty", "")
+    revision_of = metadata.get("revision_of")
+    page_count = metadata.get("page_count") or 0
 
     bold_line = f"**Doc {doc_num} — {title}"
     if driver_info:
@@ -287,24 +753,82 @@ def post_images_to_discord(image_paths, metadata):
     content = bold_line
     if plain_line:
         content += f"\n{plain_line}"
+    if penalty:
+        content += f"\nPenalty: **{penalty}**"
     if reason:
         content += f"\n_{reason}_"
+    if revision_of:
+        content += f"\n🔁 Revision of Doc {revision_of} (an earlier version was already posted)"
+    if page_count > MAX_INLINE_PAGES and RENDER_MODE == "lazy":
+        content += f"\n📎 First {MAX_INLINE_PAGES} of {page_count} pages shown — full PDF: {metadata.get('url', '')}"
+    return content
+
+# Send a document's chunks, in order, to each subscriber that hasn't had them yet (all
+# subscribers of a chunk at once). A subscriber whose send fails gets nothing further from
+# this run; every chunk from the first failure on is returned as unsent, for parking.
+def _deliver_chunks(chunks, content, targets, entry=None):
+    failed = {}
+    unsent = []
+    for index, chunk in chunks:
+        due = [s for s in targets if s.name not in failed and not (entry is not None and entry.is_sent(index, s.name))]
+        for name, err in _send_webhook_files(due, content if index == 0 else None, chunk).items():
+            if err is not None:
+                print(f"❌ Discord send to '{name}' failed: {err}")
+                failed[name] = err
+            elif entry is not None:
+                entry.mark_sent(index, name)
+        if failed:
+            unsent.append((index, chunk))
+    return failed, unsent
 
-    for i in range(0, len(image_paths), 10):
-        chunk = image_paths[i:i+10]
-        _send_webhook_files(WEBHOOK_URL, content if i == 0 else None, chunk)
+def _delivery_error(failed):
+    return RuntimeError("Discord delivery failed for " + "; ".join(f"{name}: {err}" for name, err in failed.items()))
 
-# Check if today is within ±2 days of a race date
-def is_race_weekend():
-    today = datetime.utcnow().date()
-    race_dates = [datetime.strptime(d, "%Y-%m-%d").date() for d in RACE_DATES]
+# Format and post metadata + images to every subscriber the document matches. With an outbox
+# entry, chunks a subscriber already got are skipped, each delivery is recorded, and a failed
+# send parks the chunks not yet delivered everywhere so the next run can finish the post
+# without rendering again.
+def post_images_to_discord(image_paths, metadata, entry=None, subscribers=()):
+    content = format_post_content(metadata)
+    targets = [s for s in subscribers if s.wants_document(metadata)]
+    if entry is not None:
+        entry.set_targets([s.name for s in targets])
+        targets = [s for s in targets if s.name in entry.targets]
 
-    for race_day in race_dates:
-        window_start = race_day - timedelta(days=3)  # Thursday
-        window_end = race_day + timedelta(days=1)    # Monday
-        if window_start <= today <= window_end:
-            return True
-    return False
+    # Packed by size as they come, so lazily rendered pages are only produced as each batch is sent
+    failed, unsent = _deliver_chunks(enumerate(pack_attachments(image_paths)), content, targets, entry)
+    if failed:
+        if entry is not None:
+            entry.park(unsent)
+            print(f"📥 Parked {len(unsent)} unsent batch(es) in the outbox: {entry.url}")
+        raise _delivery_error(failed)
+
+# Finish posts whose sends failed in an earlier run, straight from their parked images
+def resume_outbox(cache, store, subscribers=()):
+    had_errors = False
+    for entry in pending_entries():
+        if not entry.parked:
+            # Interrupted before anything was parked; the document is re-rendered when the
+            # pipeline reaches it, and open_entry() keeps the delivered chunks skipped.
+            continue
+        try:
+            content = format_post_content(entry.metadata)
+            # Subscribers removed from the registry since are dropped
+            targets = [s for s in subscribers if s.name in entry.targets]
+            chunks = entry.parked_chunks([s.name for s in targets])
+            failed, _ = _deliver_chunks(chunks, content, targets, entry)
+            if failed:
+                raise _delivery_error(failed)
+            sha = entry.key
+            cache.add(hash_url(entry.url), entry.url, "posted", sha)
+            remember_document(store, sha, entry.url, entry.metadata)
+            entry.delete()
+            print(f"📤 Resumed outbox post: {entry.url}")
+        except Exception as e:
+            print(f"❌ Outbox resume failed for {entry.url}: {e}")
+            report_error_to_discord(f"{entry.url}\n{e}")
+            had_errors = True
+    return had_errors
 
 # Report unexpected errors to Discord error channel
 def report_error_to_discord(error_msg):
@@ -313,47 +837,82 @@ def report_error_to_discord(error_msg):
             payload = {
                 "content": f"❌ FIA Scraper Error:\n```\n{error_msg}\n```"
             }
-            r = requests.post(ERROR_WEBHOOK_URL, json=payload, timeout=30)
-            r.raise_for_status()
+            get_delivery().send(ERROR_WEBHOOK_URL, json=payload, timeout=30)
         except Exception as e:
             print(f"⚠️ Failed to send error to Discord: {e}")
     else:
         print("⚠️ DISCORD_ERROR_WEBHOOK_URL not set")
 
-# Main scraping and processing routine
-def main():
+# One scrape: poll the page, then download, render and post anything new.
+# `cache` / `store` are passed in by the watcher so they stay in memory between polls.
+def run_once(force=False, cache=None, store=None):
     # Hard safety cap: if the scraper ever thinks there are "too many" new docs,
     # treat it as a state/caching failure and do not spam Discord.
     MAX_NEW_DOCS_PER_RUN = int(os.getenv("MAX_NEW_DOCS_PER_RUN", "10"))
-    # Check for `--force` flag to override race weekend logic
-    force = "--force" in sys.argv
-
-    # Skip if not a race weekend unless force override is active
-    if not force and not is_race_weekend():
-        print("⏭️ Not a race weekend. Exiting. Use --force to override.")
-        return
+    # Pipeline concurrency: parallel PDF downloads, and render processes (0 = render in-process)
+    DOWNLOAD_WORKERS = int(os.getenv("FIA_DOWNLOAD_WORKERS", "4"))
+    RENDER_WORKERS = int(os.getenv("FIA_RENDER_WORKERS", str(min(4, os.cpu_count() or 1))))
 
     try:
-        html = get_rendered_html()
-        pdf_links = extract_pdf_links(html)
-        print(f"📄 Found {len(pdf_links)} PDF documents.")
+        if cache is None:
+            with span("fia.cache_load"):
+                cache = load_seen_cache()
+            print(f"🧾 Cache entries loaded: {len(cache)}")
+        else:
+            cache.refresh()
+
+        subscribers = load_subscribers(WEBHOOK_URL, "fia")
+        if not subscribers:
+            raise RuntimeError("Missing webhook url: set DISCORD_WEBHOOK_URL or DISCORD_SUBSCRIBERS")
+
+        # Posts left half-sent by an earlier run go out first, from their parked images
+        outbox_errors = False
+        parked = {}
+        if pending_entries():
+            if store is None:
+                with span("fia.cache_load", what="documents"):
+                    store = load_doc_store()
+            outbox_errors = resume_outbox(cache, store, subscribers)
+            save_doc_store(store)
+            # Entries that failed to resume stay parked for the next run; posting their
+            # document again below would duplicate the chunks already delivered.
+            parked = {e.key: e.url for e in pending_entries() if e.parked}
+
+        # Only trust the poll state when there is a document cache to go with it;
+        # --force always does a full fetch and parse.
+        page_state = {} if force or not len(cache) else load_page_state()
+        if not page_state.get("fingerprint"):
+            page_state = {}
+
+        response, validators = poll_documents_page(page_state)
+        if response is None:
+            print("💤 FIA documents page not modified (304). Exiting.")
+            return
+
+        with response, span("fia.link_extract") as attrs:
+            pdf_links = read_pdf_links(response)
+            attrs["links"] = len(pdf_links)
 
-        os.makedirs("fia_docs", exist_ok=True)
-        os.makedirs("jpg_output", exist_ok=True)
-        cache = load_cached_hashes()
-        new_cache = set(cache)
+        fingerprint = page_fingerprint(pdf_links)
+        new_page_state = {**validators, "fingerprint": fingerprint}
+        if fingerprint == page_state.get("fingerprint"):
+            print("💤 FIA document list unchanged. Exiting.")
+            save_page_state(new_page_state)
+            return
 
-        print(f"🧾 Cache entries loaded: {len(cache)}")
+        print(f"📄 Found {len(pdf_links)} PDF documents.")
 
+        if KEEP_FILES:
+            os.makedirs("fia_docs", exist_ok=True)
+            os.makedirs("jpg_output", exist_ok=True)
         # First-run safety: if the cache is empty, do NOT post everything.
         # Instead, initialize the cache with the current set and exit.
         # Use --force if you intentionally want to post everything.
         if not cache and not force:
             print(f"🧯 Cache is empty. Initializing cache with {len(pdf_links)} existing docs (no posts).")
-            for url in reversed(pdf_links):
-                new_cache.add(hash_url(url))
-            save_cached_hashes(new_cache)
-            print(f"🧾 Cache entries saved: {len(new_cache)}")
+            cache.add_many((hash_url(u), u, "baseline", None) for u in reversed(pdf_links))
+            save_page_state(new_page_state)
+            print(f"🧾 Cache entries saved: {len(cache)}")
             return
 
         # Safety cap: if we detect too many "new" docs in one run, assume the cache/state is wrong.
@@ -367,41 +926,170 @@ def main():
             print(msg)
             report_error_to_discord(msg)
             # Still update cache so the next run can recover without spamming.
-            for url in reversed(pdf_links):
-                new_cache.add(hash_url(url))
-            save_cached_hashes(new_cache)
-            print(f"🧾 Cache entries saved: {len(new_cache)}")
+            cache.add_many((hash_url(u), u, "skipped", None) for u in reversed(pdf_links))
+            save_page_state(new_page_state)
+            print(f"🧾 Cache entries saved: {len(cache)}")
             return
 
+        pending = []
         for url in reversed(pdf_links):
             h = hash_url(url)
             if h in cache:
                 print(f"⏩ Skipping cached document: {url}")
-                new_cache.add(h)
                 continue
-            
-            try:
-                print(f"⬇️ Downloading and processing: {url}")
-                pdf_path = download_pdf(url, "fia_docs")
-                metadata = extract_pdf_metadata(pdf_path)
+            if url in parked.values():
+                print(f"📥 Skipping document parked in the outbox: {url}")
+                continue
+            pending.append(url)
 
-                base_name = f"Doc_{metadata['doc_num']}_{metadata['title'].replace(' ', '_')}"
-                base_name = re.sub(r"[^\w\-_.]", "", base_name)
+        if store is None:
+            with span("fia.cache_load", what="documents"):
+                store = load_doc_store()
+        had_errors = outbox_errors
+        for url, sha, prepared, err in iter_prepared_documents(
+                pending, DOWNLOAD_WORKERS, RENDER_WORKERS, known_hashes=set(store.by_hash) | set(parked)):
+            try:
+                if err is not None:
+                    raise err
+                if sha in parked:
+                    # Same bytes as a parked post under another URL: left to the outbox
+                    print(f"📥 Skipping re-upload of a document parked in the outbox: {url}")
+                    continue
+                if prepared is None or sha in store.by_hash:
+                    print(f"♻️ Byte-identical re-upload of a posted document; skipping: {url}")
+                    cache.add(hash_url(url), url, "duplicate", sha)
+                    continue
 
-                images = convert_pdf_to_images(pdf_path, "jpg_output", base_name=base_name)
-                post_images_to_discord(images, metadata)
-                new_cache.add(h)
+                metadata, images = prepared
+                previous = previous_version(store, metadata, sha)
+                if previous:
+                    metadata["revision_of"] = previous.get("doc_num")
+                metadata["url"] = url
+                entry = open_entry(sha, url, metadata)
+                with span("fia.post_document", doc=metadata.get("doc_num")):
+                    post_images_to_discord(images, metadata, entry, subscribers)
+                record_publish_latency(metadata)
+                cache.add(hash_url(url), url, "posted", sha)
+                remember_document(store, sha, url, metadata)
+                entry.delete()
 
             except Exception as e:
                 err_msg = f"{url}\n{e}"
                 print(f"❌ Error handling {url}: {e}")
                 report_error_to_discord(err_msg)
+                had_errors = True
+
+        with span("fia.cache_save"):
+            save_doc_store(store)
+            compacted = cache.maybe_compact()
+        if compacted:
+            print("🧾 Compacted seen-document log")
+        print(f"🧾 Cache entries saved: {len(cache)}")
 
-        save_cached_hashes(new_cache)
-        print(f"🧾 Cache entries saved: {len(new_cache)}")
+        # Leave the poll state alone after a failure so the next run refetches and retries.
+        if not had_errors:
+            save_page_state(new_page_state)
+        print(f"📮 Discord delivery: {get_delivery().summary()}")
 
     except Exception as e:
         report_error_to_discord(f"Top-level failure:\n{e}")
+    finally:
+        print(f"⏱️ Timings: {get_tracer().summary()}")
+        get_tracer().export()
+
+# Watch mode: poll fast (every FAST_POLL_SECONDS) from the end of each session for
+# FAST_WINDOW, when decisions and classifications land, and every SLOW_POLL_SECONDS otherwise.
+FAST_POLL_SECONDS = (15, 30)
+FAST_WINDOW = timedelta(hours=1)
+SLOW_POLL_SECONDS = int(os.getenv("FIA_WATCH_SLOW_SECONDS", "180"))
+# Exit cleanly before the GitHub Actions 6 h job limit so the cache save steps still run
+WATCH_MAX_HOURS = float(os.getenv("FIA_WATCH_MAX_HOURS", "5.5"))
+SCHEDULE_REFRESH = timedelta(hours=6)
+
+# Typical session lengths used to turn start times into end times
+SESSION_MINUTES = {
+    "FirstPractice": 60,
+    "SecondPractice": 60,
+    "ThirdPractice": 60,
+    "SprintQualifying": 45,
+    "SprintShootout": 45,
+    "Sprint": 60,
+    "Qualifying": 60,
+}
+RACE_MINUTES = 120
+
+def _session_dt(node):
+    t = (node.get("time") or "00:00:00Z").replace("Z", "+00:00")
+    return datetime.fromisoformat(f"{node.get('date')}T{t}")
+
+# End times (UTC) of every session of a race from the Ergast-compatible API
+def session_end_times(race):
+    ends = []
+    for key, minutes in SESSION_MINUTES.items():
+        node = race.get(key)
+        if node and node.get("date"):
+            ends.append(_session_dt(node) + timedelta(minutes=minutes))
+    if race.get("date"):
+        ends.append(_session_dt(race) + timedelta(minutes=RACE_MINUTES))
+    return sorted(ends)
+
+# Seconds to wait before the next poll
+def poll_interval(now, session_ends):
+    for end in session_ends:
+        if end <= now <= end + FAST_WINDOW:
+            return random.uniform(*FAST_POLL_SECONDS)
+    upcoming = [(end - now).total_seconds() for end in session_ends if end > now]
+    return max(FAST_POLL_SECONDS[0], min([SLOW_POLL_SECONDS, *upcoming]))
+
+# Stay resident and keep polling; the HTTP session, seen-document cache and document
+# store stay warm in memory between polls.
+def watch(force=False):
+    deadline = time.monotonic() + WATCH_MAX_HOURS * 3600
+    cache = load_seen_cache()
+    store = load_doc_store()
+    print(f"👀 Watching FIA documents (cache entries: {len(cache)}, up to {WATCH_MAX_HOURS}h)")
+
+    session_ends = []
+    schedule_at = None
+    try:
+        while time.monotonic() < deadline:
+            now = datetime.now(timezone.utc)
+            if schedule_at is None or now - schedule_at >= SCHEDULE_REFRESH:
+                try:
+                    ends = session_end_times(f1_api.get_next_race())
+                    # Keep the sessions that just finished even once "next" moves on
+                    session_ends = sorted(set(session_ends + ends))
+                    session_ends = [e for e in session_ends if e + FAST_WINDOW >= now]
+                    schedule_at = now
+                except Exception as e:
+                    print(f"⚠️ Could not load the session schedule: {e}")
+                    schedule_at = now - SCHEDULE_REFRESH + timedelta(minutes=15)
+
+            if force or is_race_weekend():
+                run_once(cache=cache, store=store)
+
+            delay = poll_interval(datetime.now(timezone.utc), session_ends)
+            time.sleep(max(0.0, min(delay, deadline - time.monotonic())))
+    except KeyboardInterrupt:
+        print("🛑 Watch interrupted.")
+    print("👋 Watch finished.")
+
+# Main scraping and processing routine
+def main():
+    # Check for `--force` flag to override race weekend logic
+    force = "--force" in sys.argv
+    get_tracer().pipeline = "fia"
+
+    if "--watch" in sys.argv:
+        watch(force=force)
+        return
+
+    # Skip if not a race weekend unless force override is active
+    if not force and not is_race_weekend():
+        print("⏭️ Not a race weekend. Exiting. Use --force to override.")
+        return
+
+    run_once(force=force)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,134 @@
+import json
+import os
+from datetime import datetime, timezone
+
+
+# Append-only log of seen FIA documents, one JSON record per line:
+#   {"h": <url hash>, "url": ..., "first_seen": ..., "status": ..., "sha256": ...}
+# A later record for the same hash supersedes the earlier one (first_seen is kept).
+SEEN_FILE = os.getenv("FIA_SEEN_FILE", "fia_seen_docs.jsonl")
+
+# Pre-log cache format: one URL hash per line, rewritten on every run
+LEGACY_CACHE_FILE = "last_fia_doc_hash.txt"
+
+# Compact once the log holds this many superseded records beyond one line per document
+COMPACT_SLACK = 500
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class SeenCache:
+    def __init__(self, path: str = SEEN_FILE):
+        self.path = path
+        self._index: dict[str, dict] = {}
+        self._offset = 0
+        self._lines = 0
+
+    def __contains__(self, h: str) -> bool:
+        return h in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def get(self, h: str) -> dict | None:
+        return self._index.get(h)
+
+    def refresh(self) -> int:
+        # Replay records appended since the last load/refresh; returns how many were read.
+        if not os.path.exists(self.path):
+            return 0
+        read = 0
+        with open(self.path, "rb") as f:
+            f.seek(self._offset)
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    # Torn write from a crash mid-append; dropped by the next append.
+                    break
+                self._offset += len(raw)
+                self._lines += 1
+                try:
+                    rec = json.loads(raw)
+                except ValueError:
+                    continue
+                self._apply(rec)
+                read += 1
+        return read
+
+    def _apply(self, rec: dict) -> None:
+        prev = self._index.get(rec["h"])
+        if prev and prev.get("first_seen"):
+            rec = {**rec, "first_seen": prev["first_seen"]}
+        self._index[rec["h"]] = rec
+
+    def add(self, h: str, url: str | None = None, status: str = "posted", sha256: str | None = None) -> None:
+        self.add_many([(h, url, status, sha256)])
+
+    def add_many(self, entries) -> None:
+        # Append (h, url, status, sha256) records with a single fsync; unchanged entries are skipped.
+        records = []
+        for h, url, status, sha256 in entries:
+            prev = self._index.get(h)
+            if prev and prev.get("status") == status and prev.get("sha256") == sha256:
+                continue
+            records.append({
+                "h": h,
+                "url": url or (prev or {}).get("url"),
+                "first_seen": (prev or {}).get("first_seen") or _now(),
+                "status": status,
+                "sha256": sha256 or (prev or {}).get("sha256"),
+            })
+        if not records:
+            return
+
+        data = "".join(json.dumps(r, separators=(",", ":")) + "\n" for r in records).encode()
+        with open(self.path, "ab") as f:
+            if f.tell() != self._offset:
+                # Drop a torn trailing record before appending after it
+                f.truncate(self._offset)
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        self._offset += len(data)
+        self._lines += len(records)
+        for r in records:
+            self._apply(r)
+
+    def compact(self) -> None:
+        # Rewrite the log with one record per document (temp file + fsync + atomic rename).
+        tmp = self.path + ".tmp"
+        data = "".join(json.dumps(r, separators=(",", ":")) + "\n" for r in self._index.values()).encode()
+        with open(tmp, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+        self._offset = len(data)
+        self._lines = len(self._index)
+
+    def maybe_compact(self) -> bool:
+        if self._lines - len(self._index) < COMPACT_SLACK:
+            return False
+        self.compact()
+        return True
+
+
+def load_seen_cache(path: str = SEEN_FILE) -> SeenCache:
+    cache = SeenCache(path)
+    if not os.path.exists(path) and os.path.exists(LEGACY_CACHE_FILE):
+        migrate_legacy_cache(cache)
+    cache.refresh()
+    return cache
+
+
+def migrate_legacy_cache(cache: SeenCache, legacy_path: str = LEGACY_CACHE_FILE) -> int:
+    # One-time import of last_fia_doc_hash.txt (hashes only; URL and content hash unknown).
+    with open(legacy_path, "r") as f:
+        hashes = [line.strip() for line in f if line.strip()]
+    cache.add_many((h, None, "migrated", None) for h in hashes)
+    print(f"🧾 Migrated {len(hashes)} entries from {legacy_path} to {cache.path}")
+    return len(hashes)